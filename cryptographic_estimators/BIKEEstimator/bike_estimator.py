@@ -22,17 +22,21 @@ import pytest
 from .bike_algorithm import BIKEAlgorithm
 from .bike_problem import BIKEProblem
 from ..base_estimator import BaseEstimator
+from ..helper import ComplexityType
+from concurrent.futures import ProcessPoolExecutor
 from math import inf
 import warnings
 warnings.filterwarnings("ignore", category=RuntimeWarning)
 
 class BIKEEstimator(BaseEstimator):
     excluded_algorithms_by_default = []
-    def __init__(self, r: int, w: int, t: int, memory_bound=inf, **kwargs):
+    def __init__(self, r: int, w: int, t: int, memory_bound=inf, processes=1, **kwargs):
         """Construct an instance of BIKEEstimator.
 
         Args:
             excluded_algorithm: A list/tuple of excluded algorithms (default: None)
+            processes (int): Maximum number of processes running the syndrome decoding estimations of the attacks in
+                parallel (default: 1)
         """
         super(BIKEEstimator, self).__init__(
             BIKEAlgorithm,
@@ -40,6 +44,28 @@ class BIKEEstimator(BaseEstimator):
             **kwargs
         )
         self._estimator_type = "scheme"
+        self._processes = processes
+
+    def estimate(self, **kwargs):
+        """Returns dictionary describing the complexity of each algorithm and its optimal parameters.
+
+        With `processes` larger than 1, the syndrome decoding estimations of the attacks run in parallel first.
+
+        Tests:
+            >>> from cryptographic_estimators.BIKEEstimator import BIKEEstimator
+            >>> BIKEEstimator(150, 12, 11, processes=2).estimate() == BIKEEstimator(150, 12, 11).estimate()
+            True
+        """
+        if self._processes > 1 and not self.estimates:
+            attacks = [algorithm for algorithm in self.algorithms() if hasattr(algorithm, "_SDEstimator")
+                       and algorithm.complexity_type == ComplexityType.ESTIMATE.value]
+            if len(attacks) > 1:
+                with ProcessPoolExecutor(max_workers=min(self._processes, len(attacks))) as pool:
+                    sd_estimators = list(pool.map(_estimate_sd, [attack._SDEstimator for attack in attacks]))
+                for attack, sd_estimator in zip(attacks, sd_estimators):
+                    attack._SDEstimator = sd_estimator
+
+        return super(BIKEEstimator, self).estimate(**kwargs)
 
     def table(self, show_quantum_complexity=0, show_tilde_o_time=0,
               show_all_parameters=0, precision=1, truncate=0, *args, **kwargs):
@@ -97,3 +123,9 @@ class BIKEEstimator(BaseEstimator):
                                          show_all_parameters=show_all_parameters,
                                          precision=precision, truncate=truncate,
                                          *args, **kwargs)
+
+
+def _estimate_sd(sd_estimator):
+    """Return `sd_estimator` after finding its fastest algorithm, such that it carries the estimates back."""
+    sd_estimator.fastest_algorithm()
+    return sd_estimator
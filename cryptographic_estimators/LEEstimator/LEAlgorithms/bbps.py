@@ -21,9 +21,9 @@ from ..le_algorithm import LEAlgorithm
 from ..le_problem import LEProblem
 from ..le_constants import *
 from ...base_algorithm import optimal_parameter
-from ...PEEstimator.pe_helper import gv_distance, number_of_weight_d_codewords
+from ...PEEstimator.pe_helper import gv_distance, log2_number_of_weight_d_codewords
 from math import log2, inf, log, comb as binom, factorial
-from ...SDFqEstimator.sdfq_estimator import SDFqEstimator, SDFqProblem
+from ...SDFqEstimator.sdfq_estimator import sdfq_sub_estimate
 from ...base_constants import BASE_BIT_COMPLEXITIES, BASE_MEMORY_BOUND, BASE_NSOLUTIONS
 
 
@@ -103,8 +103,7 @@ class BBPS(LEAlgorithm):
         w_prime = parameters["w_prime"]
 
         n, k, q = self.problem.get_parameters()
-        num_codewords = number_of_weight_d_codewords(n, k, q, w_prime)
-        Nw_prime = 0 if num_codewords == 0 else log2(num_codewords)
+        Nw_prime = log2_number_of_weight_d_codewords(n, k, q, w_prime)
 
         if Nw_prime < 0:
             return inf, inf
@@ -121,13 +120,13 @@ class BBPS(LEAlgorithm):
              + log2((q - 1)) * (w - 2 * w_prime + 1) - (log2(binom(n, w_prime)) + log2(binom(n - w_prime, w - w_prime))
                                                         + log2(binom(w_prime, 2 * w_prime - w)))
 
-        M_second = pr_w_w_prime + LPrime * 4 - 2 + pw + log2(2 ** pr_w_w_prime - 2 / (num_codewords ** 2))
+        M_second = pr_w_w_prime + LPrime * 4 - 2 + pw + log2(2 ** pr_w_w_prime - 2 ** (1 - 2 * Nw_prime))
         if M_second > 0:
             return inf, inf
 
-        self.SDFqEstimator = SDFqEstimator(n=n, k=k, w=w_prime, q=q, bit_complexities=0, nsolutions=0,
-                                           memory_bound=self.problem.memory_bound, **self._SDFqEstimator_parameters)
-        c_isd = self.SDFqEstimator.fastest_algorithm().time_complexity()
+        isd = sdfq_sub_estimate(n, k, w_prime, q, nsolutions=0, memory_bound=self.problem.memory_bound,
+                                **self._SDFqEstimator_parameters)
+        c_isd = isd.time
 
         time = c_isd + LPrime - Nw_prime
         # accounting for sampling LPrime different elements from set of Nw_prime elements
@@ -139,7 +138,7 @@ class BBPS(LEAlgorithm):
             verbose_information[VerboseInformation.LISTS.value] = LPrime
             verbose_information[VerboseInformation.ISD.value] = c_isd
 
-        return time, self.SDFqEstimator.fastest_algorithm().memory_complexity()
+        return time, isd.memory
 
     def _compute_time_complexity(self, parameters):
         return self._time_and_memory_complexity(parameters)[0]
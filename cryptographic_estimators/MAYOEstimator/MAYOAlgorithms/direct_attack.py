@@ -19,12 +19,10 @@
 
 from ..mayo_algorithm import MAYOAlgorithm
 from ..mayo_problem import MAYOProblem
-from ...MQEstimator.mq_problem import MQProblem
-from ...MQEstimator.MQAlgorithms.hashimoto import Hashimoto
 from ...MQEstimator.MQAlgorithms.lokshtanov import Lokshtanov
 from ...base_algorithm import optimal_parameter
 from ...helper import ComplexityType
-from ..mayo_helper import _optimize_k
+from ..mayo_helper import _optimize_k, _hashimoto_algorithm
 from ...base_constants import BASE_EXCLUDED_ALGORITHMS, BASE_FORGERY_ATTACK
 from math import log2, floor
 
@@ -49,9 +47,22 @@ class DirectAttack(MAYOAlgorithm):
 
         self._name = "DirectAttack"
         self._attack_type = BASE_FORGERY_ATTACK
+        self._hashimoto = None
 
-        n, m, _, k, q = self.problem.get_parameters()
-        self._hashimoto = Hashimoto(MQProblem(n=n*k, m=m, q=q), bit_complexities=0)
+    def get_hashimoto(self):
+        """Return the Hashimoto estimate of the MQ instance attacked by the direct attack.
+
+        Tests:
+            >>> from cryptographic_estimators.MAYOEstimator.MAYOAlgorithms.direct_attack import DirectAttack
+            >>> from cryptographic_estimators.MAYOEstimator.mayo_problem import MAYOProblem
+            >>> E = DirectAttack(MAYOProblem(n=22, m=20, o=4, k=5, q=16))
+            >>> E.get_hashimoto().problem.get_parameters()
+            [110, 20, 16]
+        """
+        if self._hashimoto is None:
+            n, m, _, k, q = self.problem.get_parameters()
+            self._hashimoto = _hashimoto_algorithm(n * k, m, q)
+        return self._hashimoto
 
     @optimal_parameter
     def k(self):
@@ -64,7 +75,7 @@ class DirectAttack(MAYOAlgorithm):
             >>> E.k()
             2
         """
-        E = self._hashimoto
+        E = self.get_hashimoto()
         return E._get_optimal_parameter("k")
 
     @optimal_parameter
@@ -78,7 +89,7 @@ class DirectAttack(MAYOAlgorithm):
             >>> E.a()
             9
         """
-        E = self._hashimoto
+        E = self.get_hashimoto()
         return E._get_optimal_parameter("a")
 
     def _compute_time_complexity(self, parameters: dict):
@@ -95,7 +106,7 @@ class DirectAttack(MAYOAlgorithm):
             45.114555923134844
 
         """
-        E = self._hashimoto
+        E = self.get_hashimoto()
         return E.time_complexity()
 
     def _compute_memory_complexity(self, parameters: dict):
@@ -112,13 +123,11 @@ class DirectAttack(MAYOAlgorithm):
             15.289154353723356
 
         """
-        E = self._hashimoto
+        E = self.get_hashimoto()
         return E.memory_complexity()
     
     def get_optimal_parameters_dict(self):
         """Returns the optimal parameters dictionary."""
-        E = self._hashimoto
-        d = E.get_optimal_parameters_dict()
-        d["variant"] = E._name
-        return d
+        E = self.get_hashimoto()
+        return {**E.get_optimal_parameters_dict(), "variant": E._name}
     
@@ -22,4 +22,7 @@ MAYO_NUMBER_VARIABLES = "number of variables"
 MAYO_NUMBER_POLYNOMIALS = "number of polynomials"
 MAYO_OIL_SPACE = "dimension of the oil space"
 MAYO_WHIPPING_PARAMETER = "whipping parameter"
-MAYO_FIELD_SIZE = "field size"
\ No newline at end of file
+MAYO_FIELD_SIZE = "field size"
+
+# Maximum number of Hashimoto estimates kept alive by the process-wide cache used by the direct attack.
+MAYO_HASHIMOTO_CACHE_SIZE = 1024
@@ -17,11 +17,32 @@
 # under the License.
 # ****************************************************************************
 
-from ..MQEstimator.MQAlgorithms import BooleanSolveFXL
+from ..MQEstimator.MQAlgorithms import BooleanSolveFXL, Hashimoto
 from ..MQEstimator import MQProblem
+from .mayo_constants import MAYO_HASHIMOTO_CACHE_SIZE
+from functools import lru_cache
 from math import log2, inf, floor
 
 
+@lru_cache(maxsize=MAYO_HASHIMOTO_CACHE_SIZE)
+def _hashimoto_algorithm(n: int, m: int, q: int):
+    """Return the Hashimoto estimate of an MQ instance, shared by all direct attacks on the same instance.
+
+    The returned algorithm must not be modified.
+
+    Args:
+        n (int): Number of variables
+        m (int): Number of polynomials
+        q (int): Order of the finite field
+
+    Tests:
+        >>> from cryptographic_estimators.MAYOEstimator.mayo_helper import _hashimoto_algorithm
+        >>> _hashimoto_algorithm(110, 20, 16) is _hashimoto_algorithm(110, 20, 16)
+        True
+    """
+    return Hashimoto(MQProblem(n=n, m=m, q=q), bit_complexities=0)
+
+
 def _optimize_k(n: int, m: int, k: int, q: int, w: float):
     """Find the optimal parameter `K` from Furue, Nakamura, and Takagi strategy.
 
@@ -37,6 +37,7 @@ class Bjorklund(MQAlgorithm):
             h (int, optional): External hybridization parameter (default: 0).
             memory_access (int, optional): Specifies the memory access cost model (default: 0, choices: 0 - constant, 1 - logarithmic, 2 - square-root, 3 - cube-root or deploy custom function which takes as input the logarithm of the total memory usage).
             complexity_type (int, optional): Complexity type to consider (0: estimate, 1: tilde O complexity, default: 0).
+            unimodal_search (bool, optional): Search lambda_ assuming a unimodal time complexity (default: False).
 
         Examples:
             >>> from cryptographic_estimators.MQEstimator.MQAlgorithms.bjorklund import Bjorklund
@@ -58,6 +59,7 @@ class Bjorklund(MQAlgorithm):
             self.set_parameter_ranges("lambda_", 3 / n, min(m, n - 1) / n)
 
         self._time_complexity_is_convex = True
+        self._internal_time_complexities = {}
 
     @optimal_parameter
     def lambda_(self):
@@ -87,6 +89,19 @@ class Bjorklund(MQAlgorithm):
             if l < l_min:
                 stop = True
 
+    def _find_optimal_parameters(self):
+        """Find the optimal parameters, by unimodal search if enabled and by full enumeration otherwise.
+
+        Tests:
+            >>> from cryptographic_estimators.MQEstimator.MQAlgorithms.bjorklund import Bjorklund
+            >>> from cryptographic_estimators.MQEstimator.mq_problem import MQProblem
+            >>> E = Bjorklund(MQProblem(n=60, m=70, q=2), unimodal_search=True)
+            >>> E.optimal_parameters() == Bjorklund(MQProblem(n=60, m=70, q=2)).optimal_parameters()
+            True
+        """
+        if not (self._unimodal_search and self._find_optimal_parameters_by_unimodal_search()):
+            super()._find_optimal_parameters()
+
     def _compute_time_complexity(self, parameters: dict):
         """Return the time complexity of the algorithm for a given set of parameters.
 
@@ -110,7 +125,7 @@ class Bjorklund(MQAlgorithm):
             * log2(n)
             * sum(
                 [
-                    Bjorklund._internal_time_complexity_(n - i, m + k + 2, lambda_)
+                    self._internal_time_complexity_(n - i, m + k + 2, lambda_)
                     for i in range(1, n)
                 ]
             )
@@ -192,8 +207,22 @@ class Bjorklund(MQAlgorithm):
         """
         self._optimal_parameters["lambda_"] = 0.19677
 
-    @staticmethod
-    def _internal_time_complexity_(n: int, m: int, lambda_: float):
+    def _internal_time_complexity_(self, n: int, m: int, lambda_: float):
+        """Helper function. Returns the runtime of the algorithm for given n, m and lambda, memoized on this instance.
+
+        Tests:
+            >>> from cryptographic_estimators.MQEstimator.MQAlgorithms.bjorklund import Bjorklund
+            >>> from cryptographic_estimators.MQEstimator.mq_problem import MQProblem
+            >>> E = Bjorklund(MQProblem(n=10, m=12, q=2))
+            >>> E._internal_time_complexity_(9, 15, 0.3)
+            481985546
+        """
+        key = (n, m, lambda_)
+        if key not in self._internal_time_complexities:
+            self._internal_time_complexities[key] = self._compute_internal_time_complexity(n, m, lambda_)
+        return self._internal_time_complexities[key]
+
+    def _compute_internal_time_complexity(self, n: int, m: int, lambda_: float):
         """Helper function. Computes the runtime of the algorithm for given n, m and lambda.
 
         ALgorithm taken from: Stefano Barbero et al. Practical complexities of probabilistic algorithms for solving
@@ -219,7 +248,7 @@ class Bjorklund(MQAlgorithm):
         # Line 10:
         T += s * sumbin_B * sumbin_n_2 * (l + 2)  # Partially evaluate R_i's
         T += (
-            s * sumbin_B * Bjorklund._internal_time_complexity_(l, l + 2, lambda_)
+            s * sumbin_B * self._internal_time_complexity_(l, l + 2, lambda_)
         )  # Recursive call
         # Line 11: Interpolation: this function makes two calls to the Z-transform
         T += (
@@ -113,17 +113,24 @@ class BooleanSolveFXL(MQAlgorithm):
         """Yields a new set of valid parameters for the optimization routine.
     
         This generator yields a new set of valid parameters on each call, based on the optimization routine's requirements.
+        Both variants guess `k + h` variables, hence `(k + h) * log2(q)` is a lower bound on the time complexity for k
+        and every larger value of it, and the remaining values of k of a variant are skipped once it exceeds the
+        current optimum.
         """
         new_ranges = self._fix_ranges_for_already_set_parameters()
         _ = new_ranges.pop(MQ_VARIANT)
+        _, _, q = self.get_reduced_parameters()
 
         variant = MQ_LAS_VEGAS
         indices = {i: new_ranges[i]["min"] for i in new_ranges}
         stop = False
         while not stop:
-            aux = indices.copy()
-            aux.update({MQ_VARIANT: variant})
-            yield aux
+            if self._is_early_abort_possible((indices["k"] + self._h) * log2(q)):
+                indices["k"] = new_ranges["k"]["max"]
+            else:
+                aux = indices.copy()
+                aux.update({MQ_VARIANT: variant})
+                yield aux
             indices["k"] += 1
             if indices["k"] > new_ranges["k"]["max"] and variant != MQ_DETERMINISTIC:
                 indices["k"] = new_ranges["k"]["min"]
@@ -20,11 +20,34 @@
 
 from cryptographic_estimators.MQEstimator.mq_algorithm import MQAlgorithm
 from cryptographic_estimators.MQEstimator.mq_problem import MQProblem
-from cryptographic_estimators.MQEstimator.series.hilbert import HilbertSeries
-from cryptographic_estimators.MQEstimator.series.nmonomial import NMonomialSeries
+from cryptographic_estimators.MQEstimator.series.hilbert import hilbert_series
+from cryptographic_estimators.MQEstimator.series.nmonomial import nmonomial_series
 from cryptographic_estimators.MQEstimator.mq_helper import nmonomials_up_to_degree
 from cryptographic_estimators.base_algorithm import optimal_parameter
 from math import log2, inf, comb as binomial
+from numpy import array, indices, zeros
+
+
+def _cumulative_convolution(a: list, b: list):
+    """Return the matrix whose entry (d, D) is the sum of `a[i] * b[D - i]` for `0 <= i <= min(d, D)`.
+
+    All the partial convolutions of `a` and `b` are obtained at once, as exact integers.
+
+    Args:
+        a (list): The coefficients of the first sequence.
+        b (list): The coefficients of the second sequence.
+
+    Tests:
+        >>> from cryptographic_estimators.MQEstimator.MQAlgorithms.crossbred import _cumulative_convolution
+        >>> _cumulative_convolution([1, 2, 3], [1, 1, 1]).tolist()
+        [[1, 1, 1], [1, 3, 3], [1, 3, 6]]
+    """
+    size = len(b)
+    b = array(b, dtype=object)
+    terms = zeros((len(a), size), dtype=object)
+    for i, a_i in enumerate(a[:size]):
+        terms[i, i:] = a_i * b[: size - i]
+    return terms.cumsum(axis=0)
 
 
 class Crossbred(MQAlgorithm):
@@ -78,6 +101,7 @@ class Crossbred(MQAlgorithm):
         self.set_parameter_ranges("k", 1, n)
         self.set_parameter_ranges("D", 2, self._max_D)
         self.set_parameter_ranges("d", 1, n)
+        self._preprocessing_tables = {}
 
     @optimal_parameter
     def k(self):
@@ -164,20 +188,30 @@ class Crossbred(MQAlgorithm):
         if d >= D:
             raise ValueError("d must be smaller than D")
 
-        n, _, q = self.get_reduced_parameters()
-        nms0 = NMonomialSeries(n=k, q=q, max_prec=D + 1)
-        nms1 = NMonomialSeries(n=n - k, q=q, max_prec=D + 1)
-
-        ncols = 0
-        for dk in range(d + 1, D + 1):
-            ncols += sum(
-                [
-                    nms0.nmonomials_of_degree(dk) * nms1.nmonomials_of_degree(dp)
-                    for dp in range(D - dk + 1)
-                ]
-            )
+        table = self._preprocessing_table(k, max(D, self.max_D))
+        return int(table[D, D] - table[d, D])
+
+    def _preprocessing_table(self, k: int, max_D: int):
+        """Return the table whose entry (d, D) counts the degree-D monomials whose degree in the last k variables is at most d.
 
-        return ncols
+        Each monomial in `n - k` variables of degree at most D - dk is paired with a monomial of degree dk in the last k
+        variables. The table is kept per k on this instance.
+
+        Args:
+            k (int): The number of variables in the resulting system.
+            max_D (int): The largest degree D needed.
+        """
+        table = self._preprocessing_tables.get(k)
+        if table is None or len(table) <= max_D:
+            n, _, q = self.get_reduced_parameters()
+            nms0 = nmonomial_series(n=k, q=q, max_prec=max_D + 1)
+            nms1 = nmonomial_series(n=n - k, q=q, max_prec=max_D + 1)
+            table = _cumulative_convolution(
+                [nms0.nmonomials_of_degree(dk) for dk in range(max_D + 1)],
+                [nms1.nmonomials_up_to_degree(dp) for dp in range(max_D + 1)],
+            )
+            self._preprocessing_tables[k] = table
+        return table
 
     def _ncols_in_linearization_step(self, k: int, d: int):
         """Returns the number of columns involved in the linearization step.
@@ -203,8 +237,8 @@ class Crossbred(MQAlgorithm):
             parameters["q"],
             parameters["max_D"],
         )
-        Hk = HilbertSeries(n=k, degrees=[2] * m, q=q)
-        N = NMonomialSeries(n=n - k, q=q, max_prec=max_D + 1)
+        Hk = hilbert_series(n=k, degrees=[2] * m, q=q)
+        N = nmonomial_series(n=n - k, q=q, max_prec=max_D + 1)
         out = sum(
             [
                 Hk.coefficient_of_degree(i) * N.nmonomials_of_degree(D - i)
@@ -232,32 +266,37 @@ class Crossbred(MQAlgorithm):
         n, m, q = self.get_reduced_parameters()
         max_D = self.max_D
 
-        Hn = HilbertSeries(n=n, degrees=[2] * m, q=q)
+        Hn = hilbert_series(n=n, degrees=[2] * m, q=q)
         h_n = Hn._hilbert_series_up_to_degree
-        k = 1
-        stop = False
-        while not stop:
-
-            Hk = HilbertSeries(n=k, degrees=[2] * m, q=q)
-            h_k =  Hk._hilbert_series
+        h_n = array([int(h_n[D]) for D in range(max_D + 1)], dtype=object)
+        d_, D_ = indices((max_D + 1, max_D + 1))
+        in_ranges = (new_ranges["D"]["min"] <= D_) & (D_ <= new_ranges["D"]["max"]) & \
+            (new_ranges["d"]["min"] <= d_) & (d_ <= new_ranges["d"]["max"]) & (1 <= d_) & (d_ < D_)
+        for k in range(1, new_ranges['k']["max"] + 1):
+            # every choice for this k costs at least m * q^(n - k + h) operations
+            if self._is_early_abort_possible((n - k + self._h) * log2(q) + log2(m)):
+                continue
+
+            Hk = hilbert_series(n=k, degrees=[2] * m, q=q)
+            h_k = Hk._hilbert_series
             h_k_d_reg = Hk.first_nonpositive_coefficient()
             h_k_up_to_degree = Hk._hilbert_series_up_to_degree
-            N = NMonomialSeries(n=n - k, q=q, max_prec=max_D + 1)
+            N = nmonomial_series(n=n - k, q=q, max_prec=max_D + 1)
             nm_nk = N._nmonomial_series_up_to_degree
             d_truncated = 0
             while int(h_k_up_to_degree[d_truncated]) > 0:
                 d_truncated += 1
-            for D in range(max(2,d_truncated), self._max_D + 1):
-                for d in range(1,  min(h_k_d_reg, D)):
-                    C_D_d = sum([h_k[i] * nm_nk[D - i] for i in range(d + 1)])
-                    coefficient_D_d = C_D_d - h_n[D] - h_k_up_to_degree[d]
-                    if 0 <= coefficient_D_d and new_ranges['D']["min"] <= D <= new_ranges['D']["max"] and \
-                        new_ranges['d']["min"] <= d <= new_ranges['d']["max"]:
-                        yield {'D': D, 'd': d, 'k': k}
-
-            k += 1
-            if k > new_ranges['k']["max"]:
-                stop = True
+
+            # C[d, D] = sum(h_k[i] * nm_nk[D - i] for i in range(d + 1)) for all d and D at once
+            C = _cumulative_convolution(
+                [int(h_k[i]) for i in range(max_D + 1)],
+                [int(nm_nk[j]) for j in range(max_D + 1)],
+            )
+            h_k_up_to_d = array([int(h_k_up_to_degree[d]) for d in range(max_D + 1)], dtype=object)
+            admissible = (C - h_n[None, :] - h_k_up_to_d[:, None] >= 0) & in_ranges & \
+                (max(2, d_truncated) <= D_) & (d_ < h_k_d_reg)
+            for D, d in zip(*admissible.T.nonzero()):
+                yield {'D': int(D), 'd': int(d), 'k': k}
 
     def _compute_time_complexity(self, parameters: dict):
         """Computes the time complexity of the algorithm for a given set of parameters.
@@ -38,6 +38,7 @@ class DinurFirst(MQAlgorithm):
             problem (MQProblem): MQProblem object including all necessary parameters.
             nsolutions (int): Number of solutions (default: 1).
             h (int): External hybridization parameter (default: 0).
+            unimodal_search (bool): Search kappa and lambda_ assuming a unimodal time complexity (default: False).
 
         Examples:
             >>> from cryptographic_estimators.MQEstimator.MQAlgorithms.dinur1 import DinurFirst
@@ -55,6 +56,7 @@ class DinurFirst(MQAlgorithm):
         n, m, _ = self.get_reduced_parameters()
         self.set_parameter_ranges("kappa", 1 / n, 1 / 3)
         self.set_parameter_ranges("lambda_", 1 / (n - 1), 0.999)
+        self._T_values = {}
 
     @optimal_parameter
     def lambda_(self):
@@ -106,7 +108,37 @@ class DinurFirst(MQAlgorithm):
             kappa = n1 / (n - 1)
             lambda_ = (n1 - n2) / (n - 1)
 
+    def _find_optimal_parameters(self):
+        """Find the optimal parameters, by unimodal search if enabled and by full enumeration otherwise.
+
+        Tests:
+            >>> from cryptographic_estimators.MQEstimator.MQAlgorithms.dinur1 import DinurFirst
+            >>> from cryptographic_estimators.MQEstimator.mq_problem import MQProblem
+            >>> E = DinurFirst(MQProblem(n=60, m=70, q=2), unimodal_search=True)
+            >>> E.optimal_parameters() == DinurFirst(MQProblem(n=60, m=70, q=2)).optimal_parameters()
+            True
+        """
+        if not (self._unimodal_search and self._find_optimal_parameters_by_unimodal_search(outer_parameter="kappa")):
+            super()._find_optimal_parameters()
+
     def _T(self, n: int, n1: int, w: int, lambda_: float):
+        """Return the number of operations of the recursive parity-counting step, memoized on this instance.
+
+        The sums over `i` for the different choices of `kappa` and `lambda_` share most of their recursive calls.
+
+        Tests:
+            >>> from cryptographic_estimators.MQEstimator.MQAlgorithms.dinur1 import DinurFirst
+            >>> from cryptographic_estimators.MQEstimator.mq_problem import MQProblem
+            >>> E = DinurFirst(MQProblem(n=10, m=12, q=2))
+            >>> E._T(9, 3, 6, 0.2)
+            4454271
+        """
+        key = (n, n1, w, lambda_)
+        if key not in self._T_values:
+            self._T_values[key] = self._compute_T(n, n1, w, lambda_)
+        return self._T_values[key]
+
+    def _compute_T(self, n: int, n1: int, w: int, lambda_: float):
         t = 48 * n + 1
         n2 = floor(n1 - lambda_ * n)
         l = n2 + 2
@@ -21,12 +21,46 @@
 from cryptographic_estimators.base_algorithm import optimal_parameter
 from ...MQEstimator.mq_algorithm import MQAlgorithm
 from ...MQEstimator.mq_problem import MQProblem
-from ..mq_constants import MQ_LAS_VEGAS
+from ..mq_constants import MQ_LAS_VEGAS, MQ_VARIANT, MQ_SUBSOLVER_CACHE_SIZE
 from ...MQEstimator.MQAlgorithms.booleansolve_fxl import BooleanSolveFXL
+from functools import lru_cache
 from math import log2, inf
 import pytest
 
 
+@lru_cache(maxsize=MQ_SUBSOLVER_CACHE_SIZE)
+def _booleansolve_fxl_complexities(q: int, n: int, m: int, k_range=None, k=None, variant=None):
+    """Return the time and memory complexity of a BooleanSolveFXL sub-instance.
+
+    The sub-instances used by Hashimoto only depend on their shape and on the constraints put on them, and many
+    `(a, k)` candidates share them. Each distinct sub-instance is therefore optimized once per process.
+
+    Args:
+        q (int): Order of the finite field.
+        n (int): Number of variables of the sub-problem.
+        m (int): Number of polynomials of the sub-problem.
+        k_range (Optional[tuple]): Range `(min, max)` for the parameter k. Default is the range of BooleanSolveFXL.
+        k (Optional[int]): Fixed value of k. If given, `variant` must be given as well.
+        variant (Optional[str]): Fixed variant.
+
+    Tests:
+        >>> from cryptographic_estimators.MQEstimator.MQAlgorithms.hashimoto import _booleansolve_fxl_complexities
+        >>> _booleansolve_fxl_complexities(16, 4, 4, k_range=(1, 3))
+        (18.339850002884624, 6.0)
+        >>> _booleansolve_fxl_complexities(16, 5, 6, k=0, variant='las_vegas')
+        (25.23599316365914, 10.62935662007961)
+    """
+    E = BooleanSolveFXL(MQProblem(q=q, n=n, m=m), bit_complexities=0)
+    if k_range is not None:
+        E.set_parameter_ranges('k', *k_range)
+
+    if k is None:
+        return E.time_complexity(), E.memory_complexity()
+
+    parameters = {'k': k, MQ_VARIANT: variant}
+    return E.time_complexity(**parameters), E.memory_complexity(**parameters)
+
+
 class Hashimoto(MQAlgorithm):
     def __init__(self, problem: MQProblem, **kwargs):
         """Construct an instance of Hashimoto estimator.
@@ -97,6 +131,27 @@ class Hashimoto(MQAlgorithm):
         """
         return self._get_optimal_parameter("a")
 
+    def _sub_estimates(self, a: int, k: int):
+        """Return the (time, memory) complexities of the three BooleanSolveFXL sub-instances for the given `a` and `k`.
+
+        Args:
+            a (int): The parameter alpha.
+            k (int): The parameter k.
+
+        Tests:
+            >>> from cryptographic_estimators.MQEstimator.MQAlgorithms.hashimoto import Hashimoto
+            >>> from cryptographic_estimators.MQEstimator.mq_problem import MQProblem
+            >>> E = Hashimoto(MQProblem(q=16, n=45, m=10))
+            >>> E._sub_estimates(4, 2)[2]
+            (17.75041913021961, 7.129283016944966)
+        """
+        _, m, q = self.problem.get_problem_parameters()
+        return (
+            _booleansolve_fxl_complexities(q, a, a, k_range=(1, a - 1)),
+            _booleansolve_fxl_complexities(q, a - 1, a - 1, k_range=(1, a - 2)),
+            _booleansolve_fxl_complexities(q, m - a - k, m - a, k=0, variant=MQ_LAS_VEGAS),
+        )
+
     def _compute_time_complexity(self, parameters: dict):
         """Return the time complexity of the algorithm for a given set of parameters.
     
@@ -124,15 +179,11 @@ class Hashimoto(MQAlgorithm):
         k = parameters["k"]
 
         if max((a + 1) * (m - k - a + 1), a * (m - k) - (a - 1) ** 2 + k) <= n:
-            E_1 = BooleanSolveFXL(MQProblem(q=q, n=a, m=a), bit_complexities=0)
-            E_1.set_parameter_ranges('k', 1, a-1);
-            E_2 = BooleanSolveFXL(MQProblem(q=q, n=a-1, m=a-1), bit_complexities=0)
-            E_2.set_parameter_ranges('k', 1, a - 2);
-            E_3 = BooleanSolveFXL(MQProblem(q=q, n=m-a-k, m=m-a), bit_complexities=0)
-
-            com1 = log2(m - a - k + 1) + E_1.time_complexity()
-            com2 = k * log2(q) + E_2.time_complexity()
-            com3 = k * log2(q) + E_3.time_complexity(k=0, variant=MQ_LAS_VEGAS)
+            E_1, E_2, E_3 = self._sub_estimates(a, k)
+
+            com1 = log2(m - a - k + 1) + E_1[0]
+            com2 = k * log2(q) + E_2[0]
+            com3 = k * log2(q) + E_3[0]
             return max(com1, com2, com3)
 
         return inf
@@ -155,16 +206,8 @@ class Hashimoto(MQAlgorithm):
         k = parameters["k"]
 
         if max((a + 1) * (m - k - a + 1), a * (m - k) - (a - 1) ** 2 + k) <= n:
-            E_1 = BooleanSolveFXL(MQProblem(q=q, n=a, m=a), bit_complexities=0)
-            E_1.set_parameter_ranges('k', 1, a-1);
-            E_2 = BooleanSolveFXL(MQProblem(q=q, n=a-1, m=a-1), bit_complexities=0)
-            E_2.set_parameter_ranges('k', 1, a - 2);
-            E_3 = BooleanSolveFXL(MQProblem(q=q, n=m-a-k, m=m-a), bit_complexities=0)
-
-            com1 = E_1.memory_complexity()
-            com2 = E_2.memory_complexity()
-            com3 = E_3.memory_complexity(k=0, variant=MQ_LAS_VEGAS)
-            return max(com1, com2, com3)
+            E_1, E_2, E_3 = self._sub_estimates(a, k)
+            return max(E_1[1], E_2[1], E_3[1])
         
         return inf
 
@@ -22,6 +22,7 @@ from cryptographic_estimators.base_algorithm import optimal_parameter
 from cryptographic_estimators.MQEstimator.mq_algorithm import MQAlgorithm
 from cryptographic_estimators.MQEstimator.mq_problem import MQProblem
 from cryptographic_estimators.MQEstimator.MQAlgorithms.f5 import F5
+from cryptographic_estimators.helper import ComplexityType
 from math import log2
 
 
@@ -69,6 +70,7 @@ class HybridF5(MQAlgorithm):
 
         n = self.nvariables_reduced()
         self.set_parameter_ranges("k", 0, n - 1)
+        self._f5_subsystems = {}
 
     def degree_of_polynomials(self):
         """Return a list of degree of the polynomials.
@@ -82,6 +84,37 @@ class HybridF5(MQAlgorithm):
         """
         return self._degrees
 
+    def _f5_subsystem(self, k: int, complexity_type: int = ComplexityType.ESTIMATE.value):
+        """Return the F5 estimator of the subsystem obtained by fixing `k` variables.
+
+        The estimators are kept for the lifetime of this instance, so the time and memory passes, as well as the
+        optimization over `k`, share the degree of regularity of each subsystem.
+
+        Args:
+            k (int): The number of fixed variables.
+            complexity_type (int): Complexity type of the subsystem estimator (default: 0).
+
+        Tests:
+            >>> from cryptographic_estimators.MQEstimator.MQAlgorithms.hybrid_f5 import HybridF5
+            >>> from cryptographic_estimators.MQEstimator.mq_problem import MQProblem
+            >>> H = HybridF5(MQProblem(q=256, n=10, m=10))
+            >>> H._f5_subsystem(2)
+            F5 estimator for the MQ problem with 8 variables and 10 polynomials
+            >>> H._f5_subsystem(2) is H._f5_subsystem(2)
+            True
+        """
+        key = (k, complexity_type)
+        if key not in self._f5_subsystems:
+            n, m, q = self.get_reduced_parameters()
+            self._f5_subsystems[key] = F5(
+                MQProblem(n=n - k, m=m, q=q),
+                w=self.linear_algebra_constant(),
+                degrees=self.degree_of_polynomials(),
+                bit_complexities=False,
+                complexity_type=complexity_type,
+            )
+        return self._f5_subsystems[key]
+
     @optimal_parameter
     def k(self):
         """Return the optimal k.
@@ -103,6 +136,19 @@ class HybridF5(MQAlgorithm):
         """
         return self._get_optimal_parameter("k")
 
+    def _valid_choices(self):
+        """Yield the values of k in increasing order, stopping once no larger k can improve the current optimum.
+
+        Every subsystem costs at least `m` field operations, hence `(k + h) * log2(q) + log2(m)` is a lower bound on
+        the time complexity for k and every larger value of it.
+        """
+        _, m, q = self.get_reduced_parameters()
+        for parameters in super()._valid_choices():
+            lower_bound = (parameters["k"] + self._h) * log2(q) + log2(m)
+            if self._is_early_abort_possible(lower_bound):
+                return
+            yield parameters
+
     def _compute_time_complexity(self, parameters: dict):
         """Return the time complexity of the algorithm for a given set of parameters.
     
@@ -117,12 +163,8 @@ class HybridF5(MQAlgorithm):
             46.38042019731107
         """
         k = parameters["k"]
-        n, m, q = self.get_reduced_parameters()
-        w = self.linear_algebra_constant()
-        degrees = self.degree_of_polynomials()
-        E = F5(
-            MQProblem(n=n - k, m=m, q=q), w=w, degrees=degrees, bit_complexities=False
-        )
+        _, _, q = self.get_reduced_parameters()
+        E = self._f5_subsystem(k)
         h = self._h
         return log2(q) * k + E.time_complexity() + h * log2(q)
 
@@ -140,12 +182,8 @@ class HybridF5(MQAlgorithm):
             20.659592676441402
         """
         k = parameters["k"]
-        n, m, q = self.get_reduced_parameters()
-        w = self.linear_algebra_constant()
-        degrees = self.degree_of_polynomials()
-        E = F5(
-            MQProblem(n=n - k, m=m, q=q), w=w, degrees=degrees, bit_complexities=False
-        )
+        n, m, _ = self.get_reduced_parameters()
+        E = self._f5_subsystem(k)
         return max(E.memory_complexity(), log2(m * n**2))
 
     def _compute_tilde_o_time_complexity(self, parameters: dict):
@@ -162,10 +200,8 @@ class HybridF5(MQAlgorithm):
             26.38447672418113
         """
         k = parameters["k"]
-        n, m, q = self.get_reduced_parameters()
-        w = self.linear_algebra_constant()
-        degrees = self.degree_of_polynomials()
-        E = F5(MQProblem(n=n - k, m=m, q=q), w=w, degrees=degrees, complexity_type=1)
+        _, _, q = self.get_reduced_parameters()
+        E = self._f5_subsystem(k, complexity_type=ComplexityType.TILDEO.value)
         h = self._h
         return log2(q) * k + E.time_complexity() + h * log2(q)
 
@@ -183,10 +219,8 @@ class HybridF5(MQAlgorithm):
             12.784634845557521
         """
         k = parameters["k"]
-        n, m, q = self.get_reduced_parameters()
-        w = self.linear_algebra_constant()
-        degrees = self.degree_of_polynomials()
-        E = F5(MQProblem(n=n - k, m=m, q=q), w=w, degrees=degrees, complexity_type=1)
+        n, m, _ = self.get_reduced_parameters()
+        E = self._f5_subsystem(k, complexity_type=ComplexityType.TILDEO.value)
         return max(E.memory_complexity(), log2(m * n**2))
 
     def _find_optimal_tilde_o_parameters(self):
@@ -18,7 +18,7 @@
 # ****************************************************************************
 
 
-from cryptographic_estimators.MQEstimator.series.nmonomial import NMonomialSeries
+from cryptographic_estimators.MQEstimator.series.nmonomial import nmonomial_series
 from cryptographic_estimators.MQEstimator.mq_problem import MQProblem
 from cryptographic_estimators.MQEstimator.mq_algorithm import MQAlgorithm
 from cryptographic_estimators.base_algorithm import optimal_parameter
@@ -45,6 +45,7 @@ class Lokshtanov(MQAlgorithm):
                 which takes as input the logarithm of the total memory usage.
             complexity_type (int, optional): The complexity type to consider. Defaults to 0 (estimate),
                 choices: 0 - estimate, 1 - tilde O complexity.
+            unimodal_search (bool, optional): Search delta assuming a unimodal time complexity. Defaults to False.
 
         Examples:
             >>> from cryptographic_estimators.MQEstimator.MQAlgorithms.lokshtanov import Lokshtanov
@@ -103,6 +104,19 @@ class Lokshtanov(MQAlgorithm):
             if l > l_max:
                 stop = True
 
+    def _find_optimal_parameters(self):
+        """Find the optimal parameters, by unimodal search if enabled and by full enumeration otherwise.
+
+        Tests:
+            >>> from cryptographic_estimators.MQEstimator.MQAlgorithms.lokshtanov import Lokshtanov
+            >>> from cryptographic_estimators.MQEstimator.mq_problem import MQProblem
+            >>> E = Lokshtanov(MQProblem(n=40, m=45, q=3), unimodal_search=True)
+            >>> E.optimal_parameters() == Lokshtanov(MQProblem(n=40, m=45, q=3)).optimal_parameters()
+            True
+        """
+        if not (self._unimodal_search and self._find_optimal_parameters_by_unimodal_search()):
+            super()._find_optimal_parameters()
+
     def _compute_time_complexity(self, parameters: dict):
         """Return the time complexity of the algorithm for a given set of parameters.
     
@@ -134,7 +148,7 @@ class Lokshtanov(MQAlgorithm):
         resulting_degree = k * (q - 1) * (np + 2)
         if self._is_early_abort_possible(time1):
             return inf
-        serie = NMonomialSeries(
+        serie = nmonomial_series(
             n=n_temp - np, q=q, max_prec=resulting_degree + 1
         )
         M = serie.nmonomials_up_to_degree(resulting_degree)
@@ -168,7 +182,7 @@ class Lokshtanov(MQAlgorithm):
         else:
             np = floor(n * delta)
             resulting_degree = 2 * (q - 1) * (np + 2)
-            serie = NMonomialSeries(n=n - np, q=q, max_prec=resulting_degree + 1)
+            serie = nmonomial_series(n=n - np, q=q, max_prec=resulting_degree + 1)
             M = serie.nmonomials_up_to_degree(resulting_degree)
             memory = M + log2(n) * q ** (n - np)
 
@@ -20,7 +20,7 @@
 
 from cryptographic_estimators.MQEstimator.mq_algorithm import MQAlgorithm
 from cryptographic_estimators.MQEstimator.mq_problem import MQProblem
-from cryptographic_estimators.MQEstimator.series.hilbert import HilbertSeries
+from cryptographic_estimators.MQEstimator.series.hilbert import hilbert_series
 from cryptographic_estimators.base_algorithm import optimal_parameter
 from math import log2, ceil, inf, comb as binomial
 
@@ -76,6 +76,18 @@ class PXL(MQAlgorithm):
         """
         return self._get_optimal_parameter("k")
     
+    def _valid_choices(self):
+        """Yield the values of k in increasing order, stopping once no larger k can improve the current optimum.
+
+        The exhaustive part guesses `k` variables, hence `k * log2(q)` is a lower bound on the time complexity for k and
+        every larger value of it.
+        """
+        _, _, q = self.get_reduced_parameters()
+        for parameters in super()._valid_choices():
+            if self._is_early_abort_possible(parameters["k"] * log2(q)):
+                return
+            yield parameters
+
     def _compute_time_complexity(self, parameters: dict):
         """Return the time complexity of the algorithm for a given set of parameters.
     
@@ -101,7 +113,7 @@ class PXL(MQAlgorithm):
         k = parameters["k"]
     
         try: 
-            H = HilbertSeries(n=n - k, degrees=[2] * m)
+            H = hilbert_series(n=n - k, degrees=[2] * m)
             D = H.first_nonpositive_coefficient_up_to_degree()
             
             alpha = sum(
@@ -142,7 +154,7 @@ class PXL(MQAlgorithm):
         k = parameters["k"]
     
         try:
-            H = HilbertSeries(n=n - k, degrees=[2] * m)
+            H = hilbert_series(n=n - k, degrees=[2] * m)
             D = H.first_nonpositive_coefficient_up_to_degree()
 
             return log2(binomial(k + D, D)) + 2 * log2(binomial(n - k + D, D))
@@ -18,7 +18,9 @@
 # ****************************************************************************
 
 
-from ..MQEstimator.series.hilbert import HilbertSeries
+from ..MQEstimator.degree_tables import tabulated_degree
+from ..MQEstimator.mq_constants import MQ_SADDLE_POINT_MIN_VARIABLES
+from ..MQEstimator.series.hilbert import hilbert_series, _saddle_point_first_nonpositive_coefficient
 
 
 def generic_system(n: int, degrees: list[int], q=None):
@@ -104,6 +106,10 @@ def semi_regular_system(n: int, degrees: list[int], q=None):
         3
 
     Tests:
+        >>> degree_of_regularity.semi_regular_system(20000, [2]*30000)  # as the expansion of the Hilbert series
+        2713
+        >>> degree_of_regularity.semi_regular_system(10000, [2]*10010)
+        4767
         >>> degree_of_regularity.semi_regular_system(10, [2]*9)
         Traceback (most recent call last):
         ...
@@ -114,7 +120,12 @@ def semi_regular_system(n: int, degrees: list[int], q=None):
         raise ValueError(
             "the number of polynomials must be >= than the number of variables")
 
-    s = HilbertSeries(n, degrees, q=q)
+    if n >= MQ_SADDLE_POINT_MIN_VARIABLES:
+        estimate = _saddle_point_first_nonpositive_coefficient(n, degrees, q=q)
+        if estimate is not None:
+            return estimate
+
+    s = hilbert_series(n, degrees, q=q)
     return s.first_nonpositive_coefficient()
 
 
@@ -135,4 +146,8 @@ def quadratic_system(n: int, m: int, q=None):
         >>> degree_of_regularity.quadratic_system(15, 15)
         16
     """
+    degree = tabulated_degree("degree_of_regularity", n, m, q=q)
+    if degree is not None:
+        return degree
+
     return generic_system(n, [2] * m, q=q)
@@ -0,0 +1,134 @@
+# ****************************************************************************
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+# 
+#   http://www.apache.org/licenses/LICENSE-2.0
+# 
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+# ****************************************************************************
+
+
+from os import makedirs, path
+from numpy import full, load, save, uint16
+from .mq_constants import MQ_DEGREE_TABLES_DIRECTORY
+
+# Marks entries of a table for which no value is tabulated.
+NOT_TABULATED = 0
+
+
+class DegreeTable(object):
+    def __init__(self, values):
+        """Construct a table of degrees of quadratic systems indexed by the number of variables and of polynomials.
+
+        Args:
+            values: A two-dimensional array of unsigned integers, where `values[n, m]` is the degree for a system with
+                n variables and m polynomials, or NOT_TABULATED.
+
+        Examples:
+            >>> from numpy import array, uint16
+            >>> from cryptographic_estimators.MQEstimator.degree_tables import DegreeTable
+            >>> T = DegreeTable(array([[0, 1], [0, 3]], dtype=uint16))
+            >>> T.get(1, 1), T.get(1, 0), T.get(5, 1)
+            (3, None, None)
+        """
+        self._values = values
+
+    @classmethod
+    def load(cls, file_name: str):
+        """Load a table from a `.npy` file, memory-mapping it read-only.
+
+        Args:
+            file_name (str): The path of the file.
+
+        Examples:
+            >>> from tempfile import TemporaryDirectory
+            >>> from os import path
+            >>> from cryptographic_estimators.MQEstimator.degree_tables import DegreeTable, write_degree_table
+            >>> with TemporaryDirectory() as directory:
+            ...     file_name = write_degree_table(directory, "degree_of_regularity", None, {(2, 3): 3, (3, 3): 4})
+            ...     T = DegreeTable.load(file_name)
+            ...     path.basename(file_name), T.get(2, 3), T.get(3, 3), T.get(3, 4)
+            ('degree_of_regularity_q0.npy', 3, 4, None)
+        """
+        return cls(load(file_name, mmap_mode="r"))
+
+    def get(self, n: int, m: int):
+        """Return the tabulated degree for a system with n variables and m polynomials, or None.
+
+        Args:
+            n (int): The number of variables.
+            m (int): The number of polynomials.
+        """
+        rows, columns = self._values.shape
+        if not (0 <= n < rows and 0 <= m < columns):
+            return None
+        value = int(self._values[n, m])
+        return None if value == NOT_TABULATED else value
+
+
+def table_file_name(directory: str, kind: str, q=None):
+    """Return the path of the table of the given kind ("degree_of_regularity" or "witness_degree") for the field
+    of order q (None for systems over the rationals).
+
+    Examples:
+        >>> from cryptographic_estimators.MQEstimator.degree_tables import table_file_name
+        >>> table_file_name("tables", "witness_degree", 16)
+        'tables/witness_degree_q16.npy'
+    """
+    return path.join(directory, f"{kind}_q{0 if q is None else q}.npy")
+
+
+def write_degree_table(directory: str, kind: str, q, degrees: dict):
+    """Write a table of the given kind for the field of order q and return its path.
+
+    Args:
+        directory (str): The directory the table is written to; it is created if needed.
+        kind (str): Either "degree_of_regularity" or "witness_degree".
+        q (int): The order of the finite field, or None.
+        degrees (dict): A dictionary mapping pairs (n, m) to the corresponding degree.
+    """
+    rows = max(n for n, _ in degrees) + 1
+    columns = max(m for _, m in degrees) + 1
+    values = full((rows, columns), NOT_TABULATED, dtype=uint16)
+    for (n, m), degree in degrees.items():
+        values[n, m] = degree
+
+    makedirs(directory, exist_ok=True)
+    file_name = table_file_name(directory, kind, q)
+    save(file_name, values)
+    return file_name
+
+
+_loaded_tables = {}
+
+
+def tabulated_degree(kind: str, n: int, m: int, q=None):
+    """Return the tabulated degree of the given kind for a quadratic system with n variables and m polynomials over
+    the field of order q, or None if it is not tabulated.
+
+    Tables are looked up in MQ_DEGREE_TABLES_DIRECTORY (see `scripts/generate_mq_degree_tables.py`) and memory-mapped
+    on first use.
+
+    Args:
+        kind (str): Either "degree_of_regularity" or "witness_degree".
+        n (int): The number of variables.
+        m (int): The number of polynomials.
+        q (int, optional): The order of the finite field. Defaults to None.
+    """
+    key = (kind, q)
+    if key not in _loaded_tables:
+        file_name = table_file_name(MQ_DEGREE_TABLES_DIRECTORY, kind, q)
+        _loaded_tables[key] = DegreeTable.load(file_name) if path.exists(file_name) else None
+
+    table = _loaded_tables[key]
+    return None if table is None else table.get(n, m)
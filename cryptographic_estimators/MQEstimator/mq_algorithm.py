@@ -20,8 +20,9 @@
 
 from cryptographic_estimators.base_algorithm import BaseAlgorithm
 from cryptographic_estimators.MQEstimator.mq_problem import MQProblem
+from cryptographic_estimators.MQEstimator.mq_constants import MQ_UNIMODAL_SEARCH_POLISH_RADIUS
 from cryptographic_estimators.helper import is_prime_power
-from math import floor
+from math import floor, inf
 
 
 class MQAlgorithm(BaseAlgorithm):
@@ -38,6 +39,9 @@ class MQAlgorithm(BaseAlgorithm):
                 logarithm of the total memory usage.
             complexity_type (int, optional): Complexity type to consider.
                 Defaults to 0 (estimate), 1 (tilde O complexity).
+            unimodal_search (bool, optional): If True, algorithms supporting it search their optimal parameters
+                assuming a unimodal time complexity, falling back to full enumeration if this is detected to be
+                wrong. Defaults to False.
         """
         super(MQAlgorithm, self).__init__(problem, **kwargs)
 
@@ -70,6 +74,7 @@ class MQAlgorithm(BaseAlgorithm):
         self._h = h
         self._n_reduced = None
         self._m_reduced = None
+        self._unimodal_search = kwargs.get("unimodal_search", False)
 
     def nvariables_reduced(self):
         """Return the number of variables after fixing some values.
@@ -143,6 +148,118 @@ class MQAlgorithm(BaseAlgorithm):
         """
         return self._w
 
+    def _cost_of_parameters(self, parameters: dict):
+        """Return the time complexity used to compare `parameters` during the optimization.
+
+        It is infinite if the memory complexity exceeds the memory bound of the problem.
+
+        Args:
+            parameters (dict): A dictionary including the parameters.
+        """
+        time = self._compute_time_complexity(parameters)
+        memory = self._compute_memory_complexity(parameters)
+        if self.bit_complexities:
+            memory = self._to_bitcomplexity_memory(memory)
+        if memory > self.problem.memory_bound:
+            return inf
+        return time + self.memory_access_cost(memory)
+
+    @staticmethod
+    def _unimodal_minimum(evaluate, size: int):
+        """Return the first index in `range(size)` minimizing `evaluate`, assuming its values are unimodal.
+
+        The minimum is located by an integer ternary search and its neighbourhood is then evaluated exhaustively. Return
+        `None` if the evaluated values are not unimodal, or if they are tied or infinite where a direction is needed.
+
+        Args:
+            evaluate (callable): Function returning the value at an index.
+            size (int): Number of indices.
+
+        Tests:
+            >>> from cryptographic_estimators.MQEstimator.mq_algorithm import MQAlgorithm
+            >>> MQAlgorithm._unimodal_minimum(lambda i: (i - 37) ** 2, 100)
+            37
+            >>> MQAlgorithm._unimodal_minimum(lambda i: [5, 4, 6, 3, 7, 8, 9, 10, 11, 12][i], 10) is None
+            True
+        """
+        if size == 0:
+            return None
+        values = {}
+
+        def value(i):
+            if i not in values:
+                values[i] = evaluate(i)
+            return values[i]
+
+        low, high = 0, size - 1
+        while high - low > 2 * MQ_UNIMODAL_SEARCH_POLISH_RADIUS + 2:
+            third = (high - low) // 3
+            left, right = value(low + third), value(high - third)
+            if left == right or inf in (left, right):
+                return None
+            if left < right:
+                high = high - third - 1
+            else:
+                low = low + third + 1
+
+        first = max(0, low - MQ_UNIMODAL_SEARCH_POLISH_RADIUS)
+        last = min(size - 1, high + MQ_UNIMODAL_SEARCH_POLISH_RADIUS)
+        for i in range(first, last + 1):
+            value(i)
+
+        indices = sorted(values)
+        sequence = [values[i] for i in indices]
+        best = sequence.index(min(sequence))
+        if sequence[best] == inf:
+            return None
+        if any(sequence[j] < sequence[j + 1] for j in range(best)) or \
+                any(sequence[j] > sequence[j + 1] for j in range(best, len(sequence) - 1)):
+            return None
+        return indices[best]
+
+    def _find_optimal_parameters_by_unimodal_search(self, outer_parameter=None):
+        """Search the optimal parameters among `_valid_choices`, assuming the time complexity is unimodal.
+
+        If `outer_parameter` is given, consecutive choices sharing its value form an inner sequence, and both the inner
+        sequences and the sequence of their minima are searched as unimodal sequences.
+
+        Args:
+            outer_parameter (str, optional): Name of the parameter grouping the inner sequences. Defaults to None.
+
+        Returns:
+            bool: False if the time complexity was detected not to be unimodal, in which case nothing is stored.
+        """
+        groups = []
+        for parameters in self._valid_choices():
+            parameters = dict(parameters)
+            if outer_parameter is None or not groups or groups[-1][0][outer_parameter] != parameters[outer_parameter]:
+                groups.append([])
+            groups[-1].append(parameters)
+
+        costs = {}
+        inner_minima = {}
+        not_unimodal = []
+
+        def cost(j, i):
+            if (j, i) not in costs:
+                costs[j, i] = self._cost_of_parameters(groups[j][i])
+            return costs[j, i]
+
+        def inner_minimum(j):
+            if j not in inner_minima:
+                inner_minima[j] = self._unimodal_minimum(lambda i: cost(j, i), len(groups[j]))
+            if inner_minima[j] is None:
+                not_unimodal.append(j)
+                return inf
+            return cost(j, inner_minima[j])
+
+        j = self._unimodal_minimum(inner_minimum, len(groups))
+        if j is None or not_unimodal:
+            return False
+
+        self._optimal_parameters.update(groups[j][inner_minima[j]])
+        return True
+
     def __repr__(self):
         n, m = self.problem.nvariables(), self.problem.npolynomials()
         return f"{self._name} estimator for the MQ problem with {n} variables and {m} polynomials"
@@ -18,6 +18,8 @@
 # ****************************************************************************
 
 
+from os import path
+
 MQ_NUMBER_VARIABLES = "number of variables"
 MQ_NUMBER_POLYNOMIALS = "number of polynomials"
 MQ_FIELD_SIZE = "field size"
@@ -25,3 +27,28 @@ MQ_FIELD_SIZE = "field size"
 MQ_LAS_VEGAS = "las_vegas"
 MQ_DETERMINISTIC = "deterministic"
 MQ_VARIANT = "variant"
+
+# Maximum number of distinct series kept alive by the process-wide series caches.
+MQ_SERIES_CACHE_SIZE = 1024
+# Maximum number of Hilbert series families kept alive, and of members kept per family.
+MQ_HILBERT_SERIES_FAMILY_CACHE_SIZE = 64
+MQ_HILBERT_SERIES_FAMILY_SIZE = 64
+# Maximum number of distinct sub-solver estimates kept alive by the process-wide sub-estimate cache.
+MQ_SUBSOLVER_CACHE_SIZE = 4096
+# Maximum number of fastest algorithms kept alive by the process-wide cache used by estimators calling MQEstimator.
+MQ_FASTEST_ALGORITHM_CACHE_SIZE = 1024
+# Maximum number of tables of cumulative binomial sums kept alive by `sum_of_binomial_coefficients`.
+MQ_BINOMIAL_SUMS_CACHE_SIZE = 1024
+# Number of neighbouring candidates evaluated on each side of the optimum found by the unimodal parameter search.
+MQ_UNIMODAL_SEARCH_POLISH_RADIUS = 2
+
+# Systems with at least this many variables locate the degree of regularity and the witness degree from a saddle-point
+# estimate, confirmed by exact coefficients around it, instead of expanding the Hilbert series.
+MQ_SADDLE_POINT_MIN_VARIABLES = 10000
+# Number of exact coefficients computed on each side of the saddle-point estimate.
+MQ_SADDLE_POINT_SEARCH_RADIUS = 8
+# First zero of the Airy function Ai.
+AIRY_FIRST_ZERO = -2.338107410459767
+
+# Location of the precomputed tables of degrees of regularity and witness degrees of quadratic systems.
+MQ_DEGREE_TABLES_DIRECTORY = path.join(path.dirname(__file__), "tables")
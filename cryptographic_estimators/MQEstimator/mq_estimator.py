@@ -20,7 +20,11 @@
 
 from ..MQEstimator.mq_algorithm import MQAlgorithm
 from ..MQEstimator.mq_problem import MQProblem
+from ..MQEstimator.mq_constants import MQ_FASTEST_ALGORITHM_CACHE_SIZE
 from ..base_estimator import BaseEstimator
+from ..helper import ComplexityType
+from copy import deepcopy
+from functools import lru_cache
 from math import inf
 import pytest
 
@@ -41,6 +45,7 @@ class MQEstimator(BaseEstimator):
             complexity_type (int, optional): The complexity type to consider (0: estimate, 1: tilde O complexity). Defaults to 0.
             bit_complexities (int, optional): The state complexity as bit rather than field operations. Defaults to 1, and is only relevant for complexity_type 0.
             memory_bound (float, optional): The memory bound. Defaults to inf.
+            unimodal_search (bool, optional): Let Bjorklund, DinurFirst and Lokshtanov search their parameters assuming a unimodal time complexity, with a fallback to full enumeration. Defaults to False.
 
         Tests:
             >>> E = MQEstimator(n=15, m=15, q=2, w=2)
@@ -89,6 +94,58 @@ class MQEstimator(BaseEstimator):
         super(MQEstimator, self).__init__(MQAlgorithm, MQProblem(
             n=n, m=m, q=q, memory_bound=memory_bound, **kwargs), **kwargs)
 
+    def fastest_algorithm(self, use_tilde_o_time=False):
+        """Return the algorithm with the smallest time complexity.
+
+        If the time complexity is estimated in field operations with constant memory access cost, the algorithms
+        without parameters are evaluated first, followed by the others by increasing number of parameters. The best
+        time found so far is handed to every algorithm as the bound of its early abort, such that its parameter search
+        skips all choices whose time lower bound exceeds it. Algorithms not reaching that bound are reset, hence their
+        later estimates are computed without it.
+
+        Args:
+            use_tilde_o_time (bool): Use Ō time complexity, i.e., ignore polynomial factors. Default is False.
+
+        Tests:
+            >>> from cryptographic_estimators.MQEstimator import MQEstimator
+            >>> from cryptographic_estimators.base_estimator import BaseEstimator
+            >>> E = MQEstimator(n=44, m=40, q=16, bit_complexities=0)
+            >>> A = E.fastest_algorithm()
+            >>> A, A.time_complexity()
+            (PXL estimator for the MQ problem with 44 variables and 40 polynomials, 100.18109034876788)
+            >>> B = BaseEstimator.fastest_algorithm(MQEstimator(n=44, m=40, q=16, bit_complexities=0))
+            >>> B.time_complexity() == A.time_complexity() and B.optimal_parameters() == A.optimal_parameters()
+            True
+            >>> E.hybrid_f5.time_complexity() == MQEstimator(n=44, m=40, q=16, bit_complexities=0).hybrid_f5.time_complexity()
+            True
+        """
+        algorithms = self.algorithms()
+        if use_tilde_o_time or any(algorithm.complexity_type != ComplexityType.ESTIMATE.value or
+                                   algorithm.bit_complexities or algorithm.memory_access != 0 or
+                                   algorithm._unimodal_search for algorithm in algorithms):
+            return super(MQEstimator, self).fastest_algorithm(use_tilde_o_time=use_tilde_o_time)
+
+        def key(algorithm):
+            try:
+                return algorithm.time_complexity()
+            except NotImplementedError:
+                return inf
+
+        times = {}
+        bound = inf
+        for algorithm in sorted(algorithms, key=lambda algorithm: len(algorithm.parameter_names())):
+            algorithm._current_minimum_for_early_abort = bound
+            try:
+                times[algorithm] = key(algorithm)
+            finally:
+                algorithm._current_minimum_for_early_abort = inf
+            if times[algorithm] > bound:
+                algorithm.reset()
+            else:
+                bound = times[algorithm]
+
+        return min(algorithms, key=times.get)
+
     def table(self, show_quantum_complexity=0, show_tilde_o_time=0, show_all_parameters=0, precision=1, truncate=0, *args, **kwargs):
         """Print table describing the complexity of each algorithm and its optimal parameters.
     
@@ -199,3 +256,47 @@ class MQEstimator(BaseEstimator):
                                        show_tilde_o_time=show_tilde_o_time,
                                        show_all_parameters=show_all_parameters,
                                        precision=precision, truncate=truncate, *args, **kwargs)
+
+
+def fastest_mq_algorithm(n: int, m: int, q=None, **kwargs):
+    """Return the fastest algorithm of `MQEstimator(n, m, q, **kwargs)`, as used by other estimators.
+
+    Estimators of multivariate schemes query the same MQ instances for many parameter sets. The results are shared
+    through a bounded process-wide cache keyed by the instance and by `kwargs`, including the complexity type. Every
+    call returns a copy of the cached algorithm, which already holds its optimal parameters and complexities, such that
+    the caller may modify it without affecting any other caller.
+
+    Args:
+        n (int): The number of variables.
+        m (int): The number of polynomials.
+        q (None, optional): The order of the finite field. Defaults to None.
+        **kwargs: Additional keyword arguments for MQEstimator.
+
+    Examples:
+        >>> from cryptographic_estimators.MQEstimator.mq_estimator import fastest_mq_algorithm
+        >>> A = fastest_mq_algorithm(14, 12, 5, bit_complexities=0)
+        >>> A
+        ExhaustiveSearch estimator for the MQ problem with 14 variables and 12 polynomials
+        >>> B = fastest_mq_algorithm(14, 12, 5, bit_complexities=0)
+        >>> B is A, B.optimal_parameters() == A.optimal_parameters()
+        (False, True)
+        >>> A.complexity_type = 1
+        >>> B.time_complexity() == fastest_mq_algorithm(14, 12, 5, bit_complexities=0).time_complexity()
+        True
+    """
+    try:
+        key = tuple(sorted((name, tuple(value) if isinstance(value, list) else value)
+                           for name, value in kwargs.items()))
+        hash(key)
+    except TypeError:
+        return MQEstimator(n=n, m=m, q=q, **kwargs).fastest_algorithm()
+
+    return deepcopy(_cached_fastest_mq_algorithm(n, m, q, key))
+
+
+@lru_cache(maxsize=MQ_FASTEST_ALGORITHM_CACHE_SIZE)
+def _cached_fastest_mq_algorithm(n: int, m: int, q, kwargs: tuple):
+    kwargs = {name: list(value) if isinstance(value, tuple) else value for name, value in kwargs}
+    algorithm = MQEstimator(n=n, m=m, q=q, **kwargs).fastest_algorithm()
+    algorithm.memory_complexity()
+    return algorithm
@@ -18,7 +18,10 @@
 # ****************************************************************************
 
 
-from cryptographic_estimators.MQEstimator.series.nmonomial import NMonomialSeries
+from cryptographic_estimators.MQEstimator.mq_constants import MQ_BINOMIAL_SUMS_CACHE_SIZE
+from cryptographic_estimators.MQEstimator.series.nmonomial import nmonomial_series
+from functools import lru_cache
+from itertools import accumulate
 from math import comb as binomial
 
 
@@ -37,7 +40,7 @@ def nmonomials_of_degree(d, n, q=None):
         >>> nmonomials_of_degree(d=2, n=10, q=2)
         45
     """
-    series = NMonomialSeries(n, q, max_prec=d + 1)
+    series = nmonomial_series(n, q, max_prec=d + 1)
     return series.nmonomials_of_degree(d)
 
 def nmonomials_up_to_degree(d, n, q=None):
@@ -57,7 +60,7 @@ def nmonomials_up_to_degree(d, n, q=None):
         >>> nmonomials_up_to_degree(d=2, n=10, q=2)
         56
     """
-    series = NMonomialSeries(n, q, max_prec=d + 1)
+    series = nmonomial_series(n, q, max_prec=d + 1)
     return series.nmonomials_up_to_degree(d)
 
 
@@ -79,4 +82,22 @@ def sum_of_binomial_coefficients(n, l):
     """
     if l < 0:
         raise ValueError("l must be a non-negative integer")
-    return sum(binomial(n, j) for j in range(l + 1))
+    if n < 0:
+        return sum(binomial(n, j) for j in range(l + 1))
+    sums = _cumulative_binomial_sums(n)
+    return sums[min(l, n)]
+
+
+@lru_cache(maxsize=MQ_BINOMIAL_SUMS_CACHE_SIZE)
+def _cumulative_binomial_sums(n):
+    """Return the tuple whose l-th entry is the sum of the binomial coefficients from 0 to l for the given n.
+
+    Args:
+        n (int): A non-negative integer.
+
+    Tests:
+        >>> from cryptographic_estimators.MQEstimator.mq_helper import _cumulative_binomial_sums
+        >>> _cumulative_binomial_sums(4)
+        (1, 5, 11, 15, 16)
+    """
+    return tuple(accumulate(binomial(n, j) for j in range(n + 1)))
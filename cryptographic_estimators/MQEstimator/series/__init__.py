@@ -1,2 +1,2 @@
-from .hilbert import HilbertSeries
-from .nmonomial import NMonomialSeries
\ No newline at end of file
+from .hilbert import HilbertSeries, HilbertSeriesFamily, hilbert_series, hilbert_series_family
+from .nmonomial import NMonomialSeries, nmonomial_series
@@ -19,8 +19,17 @@
 
 
 from cryptographic_estimators.helper import is_prime_power
-from flint import fmpq_series as power_series
-from math import prod
+from cryptographic_estimators.MQEstimator.mq_constants import (
+    AIRY_FIRST_ZERO,
+    MQ_HILBERT_SERIES_FAMILY_CACHE_SIZE,
+    MQ_HILBERT_SERIES_FAMILY_SIZE,
+    MQ_SADDLE_POINT_SEARCH_RADIUS,
+)
+from flint import fmpz, fmpz_series as power_series
+from bisect import bisect_right
+from functools import lru_cache
+from collections import Counter
+from math import prod, comb as binomial, exp
 
 
 class HilbertSeries(object):
@@ -54,14 +63,27 @@ class HilbertSeries(object):
                 raise ValueError("The order of finite field q must be a prime power.")
             if q < 2 * len(self._degrees):
                 self._series = (
-                    prod([(1 - x**d) / (1 - x ** (d * q)) for d in degrees])
+                    prod([((1 - x**d) / (1 - x ** (d * q))) ** k for d, k in Counter(degrees).items()])
                     * ((1 - x**q) / (1 - x)) ** n
                 )
             else:
-                self._series = prod([1 - x**d for d in degrees]) / (1 - x) ** n
+                self._series = prod([(1 - x**d) ** k for d, k in Counter(degrees).items()]) / (1 - x) ** n
         else:
-            self._series = prod([1 - x**d for d in degrees]) / (1 - x) ** n
-        self._series_up_to_degree = self._series / (1 - x)
+            self._series = prod([(1 - x**d) ** k for d, k in Counter(degrees).items()]) / (1 - x) ** n
+        self._series_up_to_degree = None
+
+    @classmethod
+    def _from_series(cls, n: int, degrees: list[int], q, series):
+        """Construct an instance of Hilbert series from an already computed series of matching precision."""
+        H = cls.__new__(cls)
+        H._q = q
+        H._nvariables = n
+        H._degrees = degrees
+        H._prec = 2 * len(degrees)
+        H._gen = power_series([0, 1], prec=H._prec)
+        H._series = series
+        H._series_up_to_degree = None
+        return H
 
     @property
     def _hilbert_series(self):
@@ -85,6 +107,8 @@ class HilbertSeries(object):
             >>> H._hilbert_series_up_to_degree
             1 + 6*x + 14*x^2 + 14*x^3 + (-14)*x^5 + (-14)*x^6 + (-6)*x^7 + (-1)*x^8 + O(x^14)
         """
+        if self._series_up_to_degree is None:
+            self._series_up_to_degree = self._series / (1 - self._gen)
         return self._series_up_to_degree
 
     @property
@@ -163,7 +187,7 @@ class HilbertSeries(object):
         """
 
         if d < self._prec:
-            return int(self._series_up_to_degree[d])
+            return int(self._hilbert_series_up_to_degree[d])
         raise ValueError(
             f"The degree d should be smaller than the precision of the series which is {self._prec}"
         )
@@ -171,36 +195,452 @@ class HilbertSeries(object):
     def first_nonpositive_coefficient(self):
         """Return the first non-positive integer of the series.
 
+        Coefficients beyond the precision of the series are computed lazily, so the search is not limited by it.
+
         Examples:
             >>> from cryptographic_estimators.MQEstimator.series.hilbert import HilbertSeries
             >>> H = HilbertSeries(10, [2]*15)
             >>> H.first_nonpositive_coefficient()
             4
+
+        Tests:
+            >>> HilbertSeries(4, [3]*4).first_nonpositive_coefficient()
+            9
+            >>> HilbertSeries(20, [2]*5, q=3).first_nonpositive_coefficient()
+            15
         """
-        serie = self._series
-        for d in range(self.precision):
-            if serie[d] <= 0:
-                return int(d)
+        for d, coefficient in enumerate(self._coefficients()):
+            if coefficient <= 0:
+                return d
         raise ValueError("Unable to find a nonpositive coefficient in the serie.")
 
     def first_nonpositive_coefficient_up_to_degree(self):
         """Return the first non-positive integer of the serie self._series/(1-x).
 
+        Coefficients beyond the precision of the series are computed lazily, so the search is not limited by it.
+
         Examples:
             >>> from cryptographic_estimators.MQEstimator.series.hilbert import HilbertSeries
             >>> H = HilbertSeries(10, [2]*15)
             >>> H.first_nonpositive_coefficient_up_to_degree()
             5
+
+        Tests:
+            >>> HilbertSeries(4, [3]*5).first_nonpositive_coefficient_up_to_degree()
+            11
         """
-        for d in range(self.precision):
-            if self._series_up_to_degree[d] <= 0:
-                return int(d)
+        coefficient_up_to_degree = 0
+        for d, coefficient in enumerate(self._coefficients()):
+            coefficient_up_to_degree += coefficient
+            if coefficient_up_to_degree <= 0:
+                return d
         raise ValueError(
             "Unable to find a nonpositive coefficient in the up_to_degree serie."
         )
 
+    def _uses_field_equations(self):
+        """Return whether the series accounts for the field equations."""
+        return self._q is not None and self._q < 2 * len(self._degrees)
+
+    def _degree_bound(self):
+        """Return the number of coefficients after which the search for a non-positive coefficient is abandoned.
+
+        Over the rationals and without field equations the series is a polynomial of degree sum(degrees) - n if there
+        are at least as many polynomials as variables, and has only positive coefficients otherwise. With field
+        equations the search stops after the degrees of numerator and denominator.
+        """
+        n, q, degrees = self._nvariables, self._q, self._degrees
+        if self._uses_field_equations():
+            return sum(degrees) * (q + 1) + n * (q + 1) + 1
+        if len(degrees) < n:
+            return self._prec
+        return sum(degrees) + 1
+
+    def _numerator_and_denominator(self, prec: int):
+        """Return the integer coefficients of the numerator and denominator of the series, truncated to `prec`."""
+        n, q = self._nvariables, self._q
+        numerator = [1] + [0] * (prec - 1)
+        denominator = [(-1) ** j * binomial(n, j) for j in range(min(n + 1, prec))] + [0] * max(prec - n - 1, 0)
+        for d in self._degrees:
+            _multiply_by_one_minus_monomial(numerator, d)
+        if self._uses_field_equations():
+            for d in self._degrees:
+                _multiply_by_one_minus_monomial(denominator, d * q)
+            for _ in range(n):
+                _multiply_by_one_minus_monomial(numerator, q)
+        return numerator, denominator
+
+    def _coefficients(self):
+        """Yield the coefficients of the series, continuing beyond its precision (and beyond the global cap on the
+        length of power series) in chunks of doubling size via the recurrence given by numerator and denominator.
+        """
+        h = []
+        for d in range(min(self._prec, self._series.prec)):
+            h.append(int(self._series[d]))
+            yield h[-1]
+
+        bound = self._degree_bound()
+        while len(h) < bound:
+            prec = min(2 * len(h), bound)
+            numerator, denominator = self._numerator_and_denominator(prec)
+            support = [j for j in range(1, prec) if denominator[j]]
+            for t in range(len(h), prec):
+                h.append(numerator[t] - sum(denominator[j] * h[t - j] for j in support[:bisect_right(support, t)]))
+                yield h[-1]
+
     def __repr__(self):
         text = f"Hilbert series for system with {self.nvariables} variables and {self.npolynomials} polynomials"
         if self._q is not None:
             text += f" over F_{self._q}"
         return text
+
+
+def _saddle_point_first_nonpositive_coefficient(n: int, degrees: list[int], q=None, up_to_degree=False):
+    """Return the index of the first non-positive coefficient of the Hilbert series of a semi-regular system (or of the
+    series divided by (1 - x) if `up_to_degree` is set), located from an asymptotic estimate.
+
+    With H(x) the series and mu(t) = x H'(x) / H(x) at x = e^t, the coefficients stay positive as long as a real
+    saddle point exists, i.e. up to the maximum of mu; the coalescence of the two saddle points there contributes a
+    correction of order n^(1/3) through the first zero of the Airy function. The estimate is only the starting point
+    of `_first_nonpositive_coefficient_near`, which returns the first non-positive coefficient of a window of exact
+    coefficients around it. Returns None if the saddle point is too close to x = 1 for the estimate to be reliable.
+
+    Args:
+        n (int): The number of variables.
+        degrees (list[int]): A list of integers representing the degree of the polynomials.
+        q (int, optional): The order of the finite field. Defaults to None.
+        up_to_degree (bool): Estimate the index for the series divided by (1 - x). Defaults to False.
+
+    Tests:
+        >>> from cryptographic_estimators.MQEstimator.series.hilbert import _saddle_point_first_nonpositive_coefficient
+        >>> _saddle_point_first_nonpositive_coefficient(2000, [2]*2200)
+        558
+        >>> HilbertSeries(2000, [2]*2200).first_nonpositive_coefficient()
+        558
+        >>> _saddle_point_first_nonpositive_coefficient(800, [2]*1000, q=16, up_to_degree=True)
+        167
+        >>> HilbertSeries(800, [2]*1000, q=16).first_nonpositive_coefficient_up_to_degree()
+        167
+        >>> _saddle_point_first_nonpositive_coefficient(1000, [2]*1001, up_to_degree=True) is None
+        True
+
+        The following values agree with the expansion of the Hilbert series, on which the asymptotic estimate alone is
+        off by up to six degrees::
+
+        >>> _saddle_point_first_nonpositive_coefficient(10000, [2]*10010)
+        4767
+        >>> _saddle_point_first_nonpositive_coefficient(10000, [2]*10010, up_to_degree=True)
+        4784
+        >>> _saddle_point_first_nonpositive_coefficient(10000, [2]*12000, q=2, up_to_degree=True)
+        802
+    """
+    field_equations = q is not None and q < 2 * len(degrees)
+    multiplicities = Counter(degrees)
+
+    def mu(t):
+        x = exp(t)
+        value = n * x / (1 - x)
+        if field_equations:
+            value -= n * q * x**q / (1 - x**q)
+        for d, multiplicity in multiplicities.items():
+            value -= multiplicity * d * x**d / (1 - x**d)
+            if field_equations:
+                value += multiplicity * d * q * x ** (d * q) / (1 - x ** (d * q))
+        if up_to_degree:
+            value += x / (1 - x)
+        return value
+
+    lower, upper = -40.0, -1e-12
+    for _ in range(100):
+        left, right = lower + (upper - lower) / 3, upper - (upper - lower) / 3
+        if mu(left) < mu(right):
+            lower = left
+        else:
+            upper = right
+    t = (lower + upper) / 2
+    if exp(t) > 0.99:
+        return None
+
+    h = 1e-3 * abs(t)
+    curvature = abs(mu(t + h) - 2 * mu(t) + mu(t - h)) / h**2
+    estimate = round(mu(t) - AIRY_FIRST_ZERO * (curvature / 2) ** (1 / 3))
+    return _first_nonpositive_coefficient_near(n, degrees, q, up_to_degree, estimate)
+
+
+def _first_nonpositive_coefficient_near(n: int, degrees: list[int], q, up_to_degree: bool, estimate: int):
+    """Return the index of the first non-positive coefficient in a window of exact coefficients around `estimate`.
+
+    The window is moved until its first coefficient is positive and it contains a non-positive one. Returns None if
+    the window is moved beyond the last coefficient that may be non-positive.
+
+    Args:
+        n (int): The number of variables.
+        degrees (list[int]): A list of integers representing the degree of the polynomials.
+        q (int): The order of the finite field, or None.
+        up_to_degree (bool): Search the series divided by (1 - x).
+        estimate (int): Estimated index of the first non-positive coefficient.
+
+    Tests:
+        >>> from cryptographic_estimators.MQEstimator.series.hilbert import _first_nonpositive_coefficient_near
+        >>> [_first_nonpositive_coefficient_near(40, [2]*50, None, False, estimate) for estimate in (0, 7, 13, 19)]
+        [13, 13, 13, 13]
+        >>> HilbertSeries(40, [2]*50).first_nonpositive_coefficient()
+        13
+        >>> _first_nonpositive_coefficient_near(30, [2]*40, 3, True, 4)
+        8
+        >>> HilbertSeries(30, [2]*40, q=3).first_nonpositive_coefficient_up_to_degree()
+        8
+    """
+    field_equations = q is not None and q < 2 * len(degrees)
+    if field_equations:
+        bound = sum(degrees) * (q + 1) + n * (q + 1) + 1
+    else:
+        bound = sum(degrees) + 1
+
+    width = 2 * MQ_SADDLE_POINT_SEARCH_RADIUS
+    start = max(estimate - MQ_SADDLE_POINT_SEARCH_RADIUS, 0)
+    while start < bound:
+        coefficients = _exact_coefficients(n, degrees, q, up_to_degree, start, start + width)
+        if coefficients[0] <= 0 and start > 0:
+            start = max(start - width + 1, 0)
+            continue
+        for i, coefficient in enumerate(coefficients):
+            if coefficient <= 0:
+                return start + i
+        start += width - 1
+    return None
+
+
+def _exact_coefficients(n: int, degrees: list[int], q, up_to_degree: bool, start: int, stop: int):
+    """Return the exact coefficients of index start, ..., stop - 1 of the Hilbert series of a semi-regular system (or
+    of the series divided by (1 - x) if `up_to_degree` is set).
+
+    The series is the product of (1 - x)^(-n), respectively (1 - x)^(-n - 1), with a product P of sparse factors. P
+    is expanded up to `stop`, such that every coefficient is a single sum over the non-zero coefficients of P.
+
+    Args:
+        n (int): The number of variables.
+        degrees (list[int]): A list of integers representing the degree of the polynomials.
+        q (int): The order of the finite field, or None.
+        up_to_degree (bool): Compute the coefficients of the series divided by (1 - x).
+        start (int): Index of the first coefficient.
+        stop (int): Index after the last coefficient.
+
+    Tests:
+        >>> from cryptographic_estimators.MQEstimator.series.hilbert import _exact_coefficients
+        >>> _exact_coefficients(5, [2]*7, None, False, 0, 10)
+        [1, 5, 8, 0, -14, -14, 0, 8, 5, 1]
+        >>> _exact_coefficients(5, [2]*7, None, True, 4, 9)
+        [0, -14, -14, -6, -1]
+        >>> H = HilbertSeries(6, [2]*8, q=3)
+        >>> _exact_coefficients(6, [2]*8, 3, False, 0, 12) == [int(H._hilbert_series[d]) for d in range(12)]
+        True
+    """
+    factors = [(d, k, False) for d, k in Counter(degrees).items()]
+    if q is not None and q < 2 * len(degrees):
+        factors += [(d * q, k, True) for d, k in Counter(degrees).items()] + [(q, n, False)]
+
+    P = {0: 1}
+    for e, k, inverse in factors:
+        # Coefficients of (1 - x^e)^k, respectively of (1 - x^e)^(-k), at the multiples of e below stop.
+        terms, term = [], 1
+        for i in range((stop - 1) // e + 1):
+            terms.append(term)
+            term = term * (k + i) // (i + 1) if inverse else -term * (k - i) // (i + 1)
+            if term == 0:
+                break
+        product = {}
+        for j, coefficient in P.items():
+            for i, term in enumerate(terms[:(stop - 1 - j) // e + 1]):
+                product[j + i * e] = product.get(j + i * e, 0) + coefficient * term
+        P = {j: coefficient for j, coefficient in product.items() if coefficient}
+
+    # Coefficients binomial(N - 1 + s, s) of (1 - x)^(-N), as flint integers for faster multiplication.
+    N = n + 1 if up_to_degree else n
+    G = [fmpz(1)]
+    for s in range(stop - 1):
+        G.append(G[-1] * (N + s) // (s + 1))
+
+    support = sorted(P)
+    P = {j: fmpz(coefficient) for j, coefficient in P.items()}
+    return [int(sum(P[j] * G[t - j] for j in support[:bisect_right(support, t)])) for t in range(start, stop)]
+
+
+def _multiply_by_one_minus_monomial(coefficients: list[int], e: int):
+    """Multiply the truncated series with the given coefficients by (1 - x^e) in place."""
+    for i in range(len(coefficients) - 1, e - 1, -1):
+        coefficients[i] -= coefficients[i - e]
+
+
+class HilbertSeriesFamily(object):
+    def __init__(self, degrees: list[int], q=None):
+        """Construct the family of Hilbert series of a fixed system of polynomials in a varying number of variables.
+
+        Hybrid algorithms fixing k of the n variables need the Hilbert series of the same polynomials in n - k
+        variables for many k. Consecutive members of the family differ by a single factor 1/(1 - x), respectively
+        (1 - x^q)/(1 - x) over F_q, so every member is derived from the closest member computed so far instead of
+        being rebuilt from scratch.
+
+        Args:
+            degrees (list[int]): A list of integers representing the degree of the polynomials.
+            q (int, optional): The order of the finite field. Defaults to None.
+
+        Examples:
+            >>> from cryptographic_estimators.MQEstimator.series.hilbert import HilbertSeriesFamily
+            >>> F = HilbertSeriesFamily([2]*15, q=2)
+            >>> F
+            Family of Hilbert series for systems with 15 polynomials over F_2
+            >>> [F.degree_of_regularity(n) for n in range(10, 4, -1)]
+            [3, 3, 3, 3, 2, 2]
+            >>> [F.witness_degree(n) for n in range(10, 4, -1)]
+            [4, 3, 3, 3, 3, 3]
+
+        Tests:
+            >>> from cryptographic_estimators.MQEstimator.series.hilbert import HilbertSeries
+            >>> F = HilbertSeriesFamily([2]*7)
+            >>> all(F.series(n)._hilbert_series.coeffs() == HilbertSeries(n, [2]*7)._hilbert_series.coeffs() for n in range(12))
+            True
+            >>> F = HilbertSeriesFamily([2]*12, q=5)
+            >>> all(F.series(n)._hilbert_series.coeffs() == HilbertSeries(n, [2]*12, q=5)._hilbert_series.coeffs()
+            ...     for n in range(20, 0, -1))
+            True
+        """
+        if q is not None and not is_prime_power(q):
+            raise ValueError("The order of finite field q must be a prime power.")
+
+        self._q = q
+        self._degrees = degrees
+        self._prec = 2 * len(degrees)
+        self._members = {}
+        x = power_series([0, 1], prec=self._prec)
+        if q is not None and q < self._prec:
+            self._one_more_variable = (1 - x**q) / (1 - x)
+        else:
+            self._one_more_variable = 1 / (1 - x)
+        self._one_less_variable = 1 / self._one_more_variable
+
+    @property
+    def degrees(self):
+        """Return a list of degrees of the polynomials.
+
+        Examples:
+            >>> from cryptographic_estimators.MQEstimator.series.hilbert import HilbertSeriesFamily
+            >>> HilbertSeriesFamily([2]*3).degrees
+            [2, 2, 2]
+        """
+        return self._degrees
+
+    def series(self, n: int):
+        """Return the Hilbert series of the system in n variables.
+
+        Args:
+            n (int): The number of variables.
+
+        Examples:
+            >>> from cryptographic_estimators.MQEstimator.series.hilbert import HilbertSeriesFamily
+            >>> F = HilbertSeriesFamily([2]*15)
+            >>> F.series(10)
+            Hilbert series for system with 10 variables and 15 polynomials
+            >>> F.series(9).first_nonpositive_coefficient()
+            4
+        """
+        if n in self._members:
+            return self._members[n]
+
+        closest = min(self._members, key=lambda j: abs(j - n), default=None)
+        if closest is None or n < 0 or abs(closest - n) > len(self._degrees):
+            return self._store(HilbertSeries(n, self._degrees, q=self._q))
+
+        step = 1 if closest < n else -1
+        factor = self._one_more_variable if closest < n else self._one_less_variable
+        series = self._members[closest]._hilbert_series
+        for j in range(closest + step, n + step, step):
+            series = series * factor
+            member = self._members.get(j)
+            if member is None:
+                member = self._store(HilbertSeries._from_series(j, self._degrees, self._q, series))
+        return member
+
+    def _store(self, member: HilbertSeries):
+        if len(self._members) >= MQ_HILBERT_SERIES_FAMILY_SIZE:
+            del self._members[next(iter(self._members))]
+        self._members[member.nvariables] = member
+        return member
+
+    def degree_of_regularity(self, n: int):
+        """Return the index of the first non-positive coefficient of the Hilbert series of the system in n variables.
+
+        Args:
+            n (int): The number of variables.
+
+        Examples:
+            >>> from cryptographic_estimators.MQEstimator.series.hilbert import HilbertSeriesFamily
+            >>> HilbertSeriesFamily([2]*15).degree_of_regularity(10)
+            4
+        """
+        return self.series(n).first_nonpositive_coefficient()
+
+    def witness_degree(self, n: int):
+        """Return the index of the first non-positive coefficient of the series H(x)/(1 - x), where H is the Hilbert
+        series of the system in n variables.
+
+        Args:
+            n (int): The number of variables.
+
+        Examples:
+            >>> from cryptographic_estimators.MQEstimator.series.hilbert import HilbertSeriesFamily
+            >>> HilbertSeriesFamily([2]*15).witness_degree(10)
+            5
+        """
+        return self.series(n).first_nonpositive_coefficient_up_to_degree()
+
+    def __repr__(self):
+        text = f"Family of Hilbert series for systems with {len(self._degrees)} polynomials"
+        if self._q is not None:
+            text += f" over F_{self._q}"
+        return text
+
+
+@lru_cache(maxsize=MQ_HILBERT_SERIES_FAMILY_CACHE_SIZE)
+def _cached_hilbert_series_family(degrees: tuple, q):
+    return HilbertSeriesFamily(list(degrees), q=q)
+
+
+def hilbert_series_family(degrees: list[int], q=None):
+    """Return the family of Hilbert series of a system with the given degrees from a process-wide cache.
+
+    Args:
+        degrees (list[int]): A list of integers representing the degree of the polynomials.
+        q (int, optional): The order of the finite field. Defaults to None.
+
+    Examples:
+        >>> from cryptographic_estimators.MQEstimator.series.hilbert import hilbert_series_family
+        >>> F = hilbert_series_family([2]*15, q=2)
+        >>> F is hilbert_series_family([2]*15, q=2)
+        True
+    """
+    return _cached_hilbert_series_family(tuple(sorted(degrees)), q)
+
+
+def hilbert_series(n: int, degrees: list[int], q=None):
+    """Return the Hilbert series of a system with the given shape from a process-wide cache.
+
+    The series only depends on the number of variables, the multiset of degrees and the order of the field, so
+    repeated requests for the same system shape return the same (shared) instance, and requests differing only in the
+    number of variables are derived incrementally from each other (see `HilbertSeriesFamily`). The returned object
+    must not be modified.
+
+    Args:
+        n (int): The number of variables.
+        degrees (list[int]): A list of integers representing the degree of the polynomials.
+        q (int, optional): The order of the finite field. Defaults to None.
+
+    Examples:
+        >>> from cryptographic_estimators.MQEstimator.series.hilbert import hilbert_series
+        >>> H = hilbert_series(10, [2]*15, q=2)
+        >>> H
+        Hilbert series for system with 10 variables and 15 polynomials over F_2
+        >>> H is hilbert_series(10, [2]*15, q=2)
+        True
+    """
+    return hilbert_series_family(degrees, q=q).series(n)
@@ -19,7 +19,9 @@
 
 
 from cryptographic_estimators.helper import is_prime_power
-from flint import fmpq_series as power_series
+from cryptographic_estimators.MQEstimator.mq_constants import MQ_SERIES_CACHE_SIZE
+from flint import fmpz_series as power_series
+from functools import lru_cache
 
 
 class NMonomialSeries(object):
@@ -132,3 +134,32 @@ class NMonomialSeries(object):
             return f"Class for the number of monomials in the polynomial ring in {n} variables"
         else:
             return f"Class for the number of monomials in the polynomial ring in {n} variables over F_{q}"
+
+
+@lru_cache(maxsize=MQ_SERIES_CACHE_SIZE)
+def _cached_nmonomial_series(n: int, q, max_prec: int):
+    return NMonomialSeries(n, q=q, max_prec=max_prec)
+
+
+def nmonomial_series(n: int, q=None, max_prec=None):
+    """Return the series of the number of monomials of a polynomial ring from a process-wide cache.
+
+    Repeated requests for the same number of variables, field and precision return the same (shared) instance. The
+    returned object must not be modified.
+
+    Args:
+        n (int): The number of variables.
+        q (int, optional): The size of the field (default: None).
+        max_prec (int, optional): The degree of the series (default: None, i.e. n + 1).
+
+    Examples:
+        >>> from cryptographic_estimators.MQEstimator.series.nmonomial import nmonomial_series
+        >>> NM = nmonomial_series(n=6, q=5)
+        >>> NM.nmonomials_up_to_degree(4)
+        210
+        >>> NM is nmonomial_series(n=6, q=5, max_prec=7)
+        True
+    """
+    if max_prec is None:
+        max_prec = n + 1
+    return _cached_nmonomial_series(n, q, max_prec)
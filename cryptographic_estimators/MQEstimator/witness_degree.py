@@ -18,7 +18,9 @@
 # ****************************************************************************
 
 
-from ..MQEstimator.series.hilbert import HilbertSeries
+from ..MQEstimator.degree_tables import tabulated_degree
+from ..MQEstimator.mq_constants import MQ_SADDLE_POINT_MIN_VARIABLES
+from ..MQEstimator.series.hilbert import hilbert_series, _saddle_point_first_nonpositive_coefficient
 
 
 def semi_regular_system(n: int, degrees: list[int], q=None):
@@ -35,6 +37,12 @@ def semi_regular_system(n: int, degrees: list[int], q=None):
         5
         >>> witness_degree.semi_regular_system(10, [2]*15, q=2)
         4
+
+    Tests:
+        >>> witness_degree.semi_regular_system(10000, [2]*10010)  # as the expansion of the Hilbert series
+        4784
+        >>> witness_degree.semi_regular_system(10000, [2]*12000, q=2)
+        802
     """
     m = len(degrees)
     if m <= n and q is None:
@@ -46,7 +54,12 @@ def semi_regular_system(n: int, degrees: list[int], q=None):
             "The number of polynomials must be greater than or equal to the number of variables"
         )
 
-    serie = HilbertSeries(n, degrees, q=q)
+    if n >= MQ_SADDLE_POINT_MIN_VARIABLES:
+        estimate = _saddle_point_first_nonpositive_coefficient(n, degrees, q=q, up_to_degree=True)
+        if estimate is not None:
+            return estimate
+
+    serie = hilbert_series(n, degrees, q=q)
     return serie.first_nonpositive_coefficient_up_to_degree()
 
 
@@ -67,4 +80,8 @@ def quadratic_system(n: int, m: int, q=None):
         >>> witness_degree.quadratic_system(15, 15, q=7)
         12
     """
+    degree = tabulated_degree("witness_degree", n, m, q=q)
+    if degree is not None:
+        return degree
+
     return semi_regular_system(n, [2] * m, q=q)
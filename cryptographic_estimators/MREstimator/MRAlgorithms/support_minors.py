@@ -17,6 +17,7 @@
 # under the License.
 # ****************************************************************************
 
+from itertools import product
 from math import log2, ceil
 from ..mr_constants import MR_NUMBER_OF_KERNEL_VECTORS_TO_GUESS, \
     MR_NUMBER_OF_COEFFICIENTS_TO_GUESS, \
@@ -55,6 +56,8 @@ class SupportMinors(MRAlgorithm):
         self.set_parameter_ranges('nprime', r + 1, n)
         self.set_parameter_ranges('variant', 1, 2)
         self._name = "SupportMinors"
+        self._dimensions = {}
+        self._expected_dimensions = {}
 
     @optimal_parameter
     def a(self):
@@ -161,7 +164,13 @@ class SupportMinors(MRAlgorithm):
         return None
 
     def _expected_dimension_of_support_minors_equations(self, q, m, n, K, r, b):
-        """Return the expected number of linearly independent support minors equations."""
+        """Return the expected number of linearly independent support minors equations, memoized on this instance."""
+        key = (q, m, n, K, r, b)
+        if key not in self._expected_dimensions:
+            self._expected_dimensions[key] = self._compute_expected_dimension_of_support_minors_equations(*key)
+        return self._expected_dimensions[key]
+
+    def _compute_expected_dimension_of_support_minors_equations(self, q, m, n, K, r, b):
         if q == 2:
             temp = 0
             for j in range(1, b + 1):
@@ -174,7 +183,16 @@ class SupportMinors(MRAlgorithm):
         return temp
 
     def _dimension(self, q, n, K, r, b):
-        """Dimension of the smallest vector space spanned by monomials containing the support minors equations."""
+        """Dimension of the smallest vector space spanned by monomials containing the support minors equations.
+
+        The dimensions are memoized on this instance.
+        """
+        key = (q, n, K, r, b)
+        if key not in self._dimensions:
+            self._dimensions[key] = self._compute_dimension(*key)
+        return self._dimensions[key]
+
+    def _compute_dimension(self, q, n, K, r, b):
         if q == 2:
             temp = binomial(n, r) * sum([binomial(K, j) for j in range(1, b + 1)])
         else:
@@ -194,6 +212,36 @@ class SupportMinors(MRAlgorithm):
         exp = self._expected_dimension_of_support_minors_equations(q, m, nprime, k_reduced + 1, r, b)
         return dim >= exp
 
+    def _valid_choices(self):
+        """Yield the valid parameters, restricted to the smallest valid `nprime` for each `a`, `lv` and `b`.
+
+        Time and memory complexity are nondecreasing in `nprime`, since the number of columns of the Macaulay matrix
+        is. Hence, for given `a`, `lv`, `b` and `variant` the smallest valid `nprime` is optimal. The valid values of
+        `nprime` do not form a suffix of its range, thus it is found by increasing `nprime` up to the first valid one.
+        The choices are yielded in the order of the generic enumeration, preserving which optimum is found first.
+
+        Tests:
+            >>> from cryptographic_estimators.MREstimator.MRAlgorithms.support_minors import SupportMinors
+            >>> from cryptographic_estimators.MREstimator.mr_problem import MRProblem
+            >>> from cryptographic_estimators.base_algorithm import BaseAlgorithm
+            >>> SM = SupportMinors(MRProblem(q=7, m=9, n=10, k=15, r=4))
+            >>> len(list(SM._valid_choices())), len(list(BaseAlgorithm._valid_choices(SM)))
+            (56, 122)
+        """
+        new_ranges = self._fix_ranges_for_already_set_parameters()
+        choices = []
+        for a, lv, b in product(*[range(new_ranges[i]["min"], new_ranges[i]["max"] + 1) for i in ["a", "lv", "b"]]):
+            parameters = {"a": a, "lv": lv, "b": b}
+            for nprime in range(new_ranges["nprime"]["min"], new_ranges["nprime"]["max"] + 1):
+                parameters["nprime"] = nprime
+                if not self._are_parameters_invalid(parameters):
+                    choices.extend({**parameters, "variant": variant} for variant in
+                                   range(new_ranges["variant"]["min"], new_ranges["variant"]["max"] + 1))
+                    break
+
+        yield from sorted(choices, key=lambda choice: (choice["variant"], choice["nprime"], choice["b"], choice["lv"],
+                                                       choice["a"]))
+
     def _sm_time_complexity_helper_(self, q: int, K: int, r: int, nprime: int, b: int, variant: str):
         if variant == Variant.block_wiedemann.value:
             time = _bw_complexity_(row_density=K * (r + 1), ncols=self._dimension(q, nprime, K, r, b))
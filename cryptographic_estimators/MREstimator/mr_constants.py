@@ -30,3 +30,6 @@ MR_NUMBER_OF_KERNEL_VECTORS_TO_GUESS = "a"
 MR_NUMBER_OF_COEFFICIENTS_TO_GUESS = "lv"
 MR_REDUCED_NUMBER_OF_COLUMNS = "nprime"
 MR_LINEAR_VARIABLES_DEGREE = "b"
+
+# Maximum number of degrees of minors series kept alive by `minors_polynomial_degree`.
+MR_MINORS_DEGREE_CACHE_SIZE = 4096
@@ -19,12 +19,12 @@
 
 from math import log2
 from enum import Enum
+from functools import lru_cache
 from itertools import product
 from math import comb as binomial
 from math import inf
-from sympy import Poly, QQ
-from sympy.abc import t
-from sympy.polys.matrices import DomainMatrix
+from flint import fmpz_poly
+from .mr_constants import MR_MINORS_DEGREE_CACHE_SIZE
 
 
 class Variant(Enum):
@@ -57,43 +57,71 @@ def _binomial_mult(n, m, i, j, l):
     return binomial(m - i, l) * binomial(n - j, l)
 
 
-def entry_i_j_of_A(n, m, t, i, j):
+def entry_i_j_of_A(n, m, i, j):
     limit = max(m - i, n - j)
-    return sum([_binomial_mult(n, m, i, j, l) * t ** l for l in range(limit +  1)])
+    return fmpz_poly([_binomial_mult(n, m, i, j, l) for l in range(limit + 1)])
 
 
-def matrix_A(m, n, r, t):
-    A = DomainMatrix.zeros((r, r), QQ[t])
+def matrix_A(m, n, r):
     square_r = range(1, r + 1)
-    for i, j in product(square_r, square_r):
-        entry_i_j = entry_i_j_of_A(n, m, t, i, j)
-        A[i-1,j-1] = QQ[t].from_sympy(entry_i_j)
-    return A
+    return [[entry_i_j_of_A(n, m, i, j) for j in square_r] for i in square_r]
 
 
-def determinant_of_A(m, n, r, t):
-    A = matrix_A(m, n, r, t)
-    return A.det()
+def determinant_of_A(m, n, r):
+    """Returns the determinant of the matrix `A` as an integer polynomial in `t`, by fraction-free Bareiss elimination.
+
+    Tests:
+        >>> from cryptographic_estimators.MREstimator.mr_helper import determinant_of_A
+        >>> determinant_of_A(4, 4, 2)
+        x^5 + 4*x^4 + 10*x^3 + 4*x^2 + x
+    """
+    A = matrix_A(m, n, r)
+    sign = 1
+    previous_pivot = fmpz_poly([1])
+    for k in range(r - 1):
+        if A[k][k] == 0:
+            pivot_row = next((i for i in range(k + 1, r) if A[i][k] != 0), None)
+            if pivot_row is None:
+                return fmpz_poly([])
+            A[k], A[pivot_row] = A[pivot_row], A[k]
+            sign = -sign
+        for i, j in product(range(k + 1, r), range(k + 1, r)):
+            A[i][j] = (A[k][k] * A[i][j] - A[i][k] * A[k][j]) // previous_pivot
+        previous_pivot = A[k][k]
+    return sign * A[r - 1][r - 1] if r > 0 else fmpz_poly([1])
 
 
 def minors_series(m, n, k, r):
     exp = (m - r) * (n - r) - (k + 1)
-    num = QQ[t].from_sympy((1 - t) ** exp) * determinant_of_A(m, n, r, t)
-    den = QQ[t].from_sympy((t ** binomial(r, 2)))
-    series = num/den
+    num = fmpz_poly([1, -1]) ** exp * determinant_of_A(m, n, r)
+    den = fmpz_poly([0, 1]) ** binomial(r, 2)
+    series = num // den
     return series
 
+
 def minors_polynomial_degree(m, n_reduced, k_reduced, r):
-    poly = 0
+    """Returns the degree of the truncation of the minors series before its first non-positive coefficient.
+
+    Tests:
+        >>> from cryptographic_estimators.MREstimator.mr_helper import minors_polynomial_degree
+        >>> minors_polynomial_degree(9, 8, 10, 4)
+        4
+    """
     if k_reduced >= (m - r) * (n_reduced - r):
         return inf
-    series = minors_series(m, n_reduced, k_reduced, r)
-    series_coeffs = list(reversed(Poly(QQ[t].to_sympy(series)).all_coeffs())) # cast from PolyElement to Poly
-    for D in range(series.degree()):
-        poly += series_coeffs[D] * QQ[t].from_sympy(t) ** D
+    return _minors_polynomial_degree(m, n_reduced, k_reduced, r)
+
+
+@lru_cache(maxsize=MR_MINORS_DEGREE_CACHE_SIZE)
+def _minors_polynomial_degree(m, n_reduced, k_reduced, r):
+    series_coeffs = minors_series(m, n_reduced, k_reduced, r).coeffs()
+    degree = -inf
+    for D in range(len(series_coeffs) - 1):
+        if series_coeffs[D] != 0:
+            degree = D
         if series_coeffs[D + 1] <= 0:
             break
-    return poly.degree()
+    return degree
 
 
 def extended_binomial(n, k):
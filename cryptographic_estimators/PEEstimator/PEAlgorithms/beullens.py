@@ -24,7 +24,7 @@ from ...base_algorithm import optimal_parameter
 from ..pe_helper import median_size_of_random_orbit, hamming_ball
 from math import log, ceil, log2, inf
 from ...base_constants import BASE_MEMORY_BOUND, BASE_NSOLUTIONS, BASE_BIT_COMPLEXITIES
-from ...SDFqEstimator.sdfq_estimator import SDFqEstimator
+from ...SDFqEstimator.sdfq_estimator import sdfq_sub_estimate
 
 
 class Beullens(PEAlgorithm):
@@ -50,8 +50,6 @@ class Beullens(PEAlgorithm):
         n, k, _, _ = self.problem.get_parameters()
         self.set_parameter_ranges('w', 0, n - k)
 
-        self.SDFqEstimator = None
-
         self._SDFqEstimator_parameters = kwargs.get(PE_SD_PARAMETERS, {})
         self._SDFqEstimator_parameters.pop(BASE_BIT_COMPLEXITIES, None)
         self._SDFqEstimator_parameters.pop(BASE_NSOLUTIONS, None)
@@ -90,10 +88,10 @@ class Beullens(PEAlgorithm):
 
         list_size = (search_space_size + log2(2 * log2(n))) / 2
 
-        self.SDFqEstimator = SDFqEstimator(n=n, k=k, w=w, q=q, bit_complexities=0, nsolutions=0,
-                                           memory_bound=self.problem.memory_bound, **self._SDFqEstimator_parameters)
-        c_isd = self.SDFqEstimator.fastest_algorithm().time_complexity()
-        m_isd = self.SDFqEstimator.fastest_algorithm().memory_complexity()
+        isd = sdfq_sub_estimate(n, k, w, q, nsolutions=0, memory_bound=self.problem.memory_bound,
+                                **self._SDFqEstimator_parameters)
+        c_isd = isd.time
+        m_isd = isd.memory
         list_computation = c_isd - search_space_size + list_size + 1
 
         normal_form_cost = 1 + list_size
@@ -21,7 +21,7 @@ from ...PEEstimator.pe_algorithm import PEAlgorithm
 from ...PEEstimator.pe_problem import PEProblem
 from ...base_algorithm import optimal_parameter
 from ..pe_helper import gv_distance, number_of_weight_d_codewords
-from ...SDFqEstimator.sdfq_estimator import SDFqEstimator
+from ...SDFqEstimator.sdfq_estimator import sdfq_sub_estimate
 from math import log, ceil, log2
 
 
@@ -52,8 +52,6 @@ class Leon(PEAlgorithm):
                                                                                                               q) + 3))))
         self.set_parameter_ranges('w', 0, n)
 
-        self.SDFqEstimator = None
-
         self._SDFqEstimator_parameters = kwargs.get("sd_parameters", {})
         self._SDFqEstimator_parameters.pop("bit_complexities", None)
         self._SDFqEstimator_parameters.pop("nsolutions", None)
@@ -81,13 +79,17 @@ class Leon(PEAlgorithm):
         n, k, q, _ = self.problem.get_parameters()
         w = parameters["w"]
         N = number_of_weight_d_codewords(n, k, q, w)
-        self.SDFqEstimator = SDFqEstimator(n=n, k=k, w=w, q=q, nsolutions=0, memory_bound=self.problem.memory_bound,
-                                           bit_complexities=0, **self._SDFqEstimator_parameters)
-        c_isd = self.SDFqEstimator.fastest_algorithm().time_complexity()
+        c_isd = self._isd_estimate(w).time
         return c_isd + log2(ceil(2 * (0.57 + log(N))))
 
     def _compute_memory_complexity(self, parameters: dict):
-        return self.SDFqEstimator.fastest_algorithm().memory_complexity()
+        return self._isd_estimate(parameters["w"]).memory
+
+    def _isd_estimate(self, w: int):
+        """Return the estimate of the fastest SDFq algorithm finding codewords of weight w."""
+        n, k, q, _ = self.problem.get_parameters()
+        return sdfq_sub_estimate(n, k, w, q, nsolutions=0, memory_bound=self.problem.memory_bound,
+                                 **self._SDFqEstimator_parameters)
 
     def __repr__(self):
         rep = "Leon estimator for " + str(self.problem)
@@ -25,6 +25,11 @@ PE_FIELD_SIZE = "field size"
 PE_HULL_DIMENSION = "hull dimension"
 PE_SD_PARAMETERS = "sd_parameters"
 
+# Maximum number of median collision costs kept alive by the process-wide cache of pe_helper.
+PE_COLLISION_COST_CACHE_SIZE = 4096
+# Maximum number of Gilbert-Varshamov distances kept alive by the process-wide cache of pe_helper.
+PE_GV_DISTANCE_CACHE_SIZE = 4096
+
 
 class VerboseInformation(Enum):
     LIST_COMPUTATION = "list_computation"
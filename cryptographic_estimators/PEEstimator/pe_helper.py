@@ -17,19 +17,58 @@
 # under the License.
 # ****************************************************************************
 
-from math import comb as binomial, log2, factorial
-from random import randint
+from functools import lru_cache
+from math import comb as binomial, log2, lgamma, log, exp, sqrt
+from numpy import arange, where, errstate, log1p, exp as np_exp, logaddexp2, searchsorted
+from scipy.special import gammaln
+from .pe_constants import PE_COLLISION_COST_CACHE_SIZE, PE_GV_DISTANCE_CACHE_SIZE
 
 
+def _log2_binomial(n: int, k: int):
+    """Returns log2 of the binomial coefficient n choose k."""
+    return (lgamma(n + 1) - lgamma(k + 1) - lgamma(n - k + 1)) / log(2)
+
+
+def _hamming_sphere_volume(n: int, q: int, d: int):
+    """Returns the exact number of non-zero vectors of weight at most d in Fq^n."""
+    return sum(binomial(n, i) * (q - 1) ** i for i in range(1, d + 1))
+
+
+@lru_cache(maxsize=PE_GV_DISTANCE_CACHE_SIZE)
 def gv_distance(n: int, k: int, q: int):
-    """Gilbert Varsharmov bound."""
-    d = 1
-    right_term = q ** (n - k)
-    left_term = 0
-    while left_term <= right_term:
-        left_term += binomial(n, d) * (q - 1) ** d
-        d += 1
-    d = d - 1
+    """Gilbert Varsharmov bound.
+
+    Returns the smallest d such that the number of non-zero vectors of weight at most d in Fq^n exceeds q^(n-k). The
+    volumes are accumulated in logarithmic scale and d is found via bisection; only near ties are decided on exact
+    integers.
+
+    Args:
+        n (int): Length of the code
+        k (int): Dimension of the code
+        q (int): Size of the field
+
+    Examples:
+        >>> from cryptographic_estimators.PEEstimator.pe_helper import gv_distance
+        >>> gv_distance(100, 50, 3)
+        17
+
+    Tests:
+        >>> gv_distance(7, 4, 2)
+        2
+        >>> gv_distance(300, 150, 8191)
+        128
+    """
+    i = arange(1, n + 1)
+    log_terms = (gammaln(n + 1) - gammaln(i + 1) - gammaln(n - i + 1)) / log(2) + i * log2(q - 1)
+    log_volumes = logaddexp2.accumulate(log_terms)
+    target = (n - k) * log2(q)
+    d = int(searchsorted(log_volumes, target, side="right")) + 1
+
+    if abs(log_volumes[min(d, n) - 1] - target) < 1e-9 or (d > 1 and abs(log_volumes[d - 2] - target) < 1e-9):
+        right_term = q ** (n - k)
+        d = max(1, d - 1)
+        while d <= n and _hamming_sphere_volume(n, q, d) <= right_term:
+            d += 1
     return d
 
 
@@ -37,25 +76,147 @@ def number_of_weight_d_codewords(n: int, k: int, q: int, d: int):
     """Returns the number of weight d code words in a (n,k,q) code."""
     return binomial(n, d) * (q - 1) ** d // q ** (n - k)
 
-def random_sparse_vec_orbit(n: int, w: int, q: int):
-    counts = [0] * (q - 1)
-    s = 0
-    while s < w:
-        a = randint(0, q - 2)
-        s += 1
-        counts[a] += 1
-    orbit_size = factorial(n) // factorial(n - w)
-    for c in counts:
-        orbit_size //= factorial(c)
-    return log2(orbit_size)
+
+def log2_number_of_weight_d_codewords(n: int, k: int, q: int, d: int):
+    """Returns the logarithm of the expected number of weight d code words in a (n,k,q) code.
+
+    In contrast to `number_of_weight_d_codewords` the expected number is not rounded down, so that the result is
+    negative if less than one codeword is expected.
+
+    Examples:
+        >>> from cryptographic_estimators.PEEstimator.pe_helper import log2_number_of_weight_d_codewords
+        >>> log2_number_of_weight_d_codewords(100, 50, 3, 30)
+        35.35453553248621
+    """
+    return _log2_binomial(n, d) + d * log2(q - 1) - (n - k) * log2(q)
+
+
+def _binomial_pmf(m: int, p: float):
+    """Returns the probability mass function of Bin(i, p) for every i = 0, ..., m as an (m+1)x(m+1) array."""
+    i = arange(m + 1)[:, None]
+    j = arange(m + 1)[None, :]
+    valid = j <= i
+    d = where(valid, i - j, 0)
+    with errstate(divide="ignore", invalid="ignore"):
+        log_pmf = gammaln(i + 1) - gammaln(j + 1) - gammaln(d + 1) \
+                  + where(j > 0, j * log(p), 0) + where(d > 0, d * log1p(-p), 0)
+    return where(valid, np_exp(log_pmf), 0)
+
+
+def _collision_cost_cumulants(w: int, q: int):
+    """Returns mean, variance and third cumulant of S = sum_i log2(c_i!).
+
+    Here (c_1, ..., c_{q-1}) is the uniform multinomial distribution of w non-zero entries over the q-1 non-zero field
+    elements, i.e. the colour counts of a random weight-w vector.
+    """
+    k = q - 1
+    c = arange(w + 1)
+    f = gammaln(c + 1) / log(2)
+    p1 = _binomial_pmf(w, 1 / k)[w]
+
+    m1 = k * (p1 * f).sum()
+    m2 = k * (p1 * f ** 2).sum()
+    m3 = k * (p1 * f ** 3).sum()
+    if k >= 2:
+        # g1[r] = E[f(c_2) | c_1 = w - r]
+        g1 = _binomial_pmf(w, 1 / (k - 1)) @ f
+        m2 += k * (k - 1) * (p1 * f * g1[::-1]).sum()
+        m3 += 3 * k * (k - 1) * (p1 * f ** 2 * g1[::-1]).sum()
+    if k >= 3:
+        # h[t] = E[f(c_2) f(c_3) | c_2 + c_3 = t], g2[r] = E[f(c_2) f(c_3) | c_1 = w - r]
+        complement = where(c[None, :] <= c[:, None], c[:, None] - c[None, :], 0)
+        h = (_binomial_pmf(w, 1 / 2) * f[None, :] * f[complement]).sum(axis=1)
+        g2 = _binomial_pmf(w, 2 / (k - 1)) @ h
+        m3 += k * (k - 1) * (k - 2) * (p1 * f * g2[::-1]).sum()
+
+    variance = m2 - m1 ** 2
+    return float(m1), float(variance), float(m3 - 3 * m1 * m2 + 2 * m1 ** 3)
+
+
+def _exact_median_of_collision_cost(w: int, q: int, upper_bound: float, max_profiles: int = 20000):
+    """Returns the median of S = sum_i log2(c_i!) by enumerating all count profiles with S <= upper_bound.
+
+    Only counts larger than one contribute to S, hence the enumeration runs over multisets of parts >= 2 with the
+    remaining entries spread over distinct field elements. Returns None if more than `max_profiles` profiles would
+    have to be enumerated.
+    """
+    k = q - 1
+    f = [lgamma(j + 1) / log(2) for j in range(w + 1)]
+    constant = lgamma(k + 1) + lgamma(w + 1) - w * log(k)
+    distribution = []
+
+    # stack entries: (largest admissible part, balls used, parts used, S, log(prod m_j! * (j!)^m_j), last part, multiplicity)
+    stack = [(w, 0, 0, 0., 0., 0, 0)]
+    visited = 0
+    while stack:
+        j_max, b, r, cost, log_denominator, last, mult = stack.pop()
+        visited += 1
+        if visited > max_profiles:
+            return None
+
+        singletons = w - b
+        if r + singletons <= k:
+            log_prob = constant - lgamma(k - r - singletons + 1) - lgamma(singletons + 1) - log_denominator
+            distribution.append((cost, exp(log_prob)))
+
+        for j in range(min(j_max, w - b), 1, -1):
+            new_cost = cost + f[j]
+            # the remaining entries must fit into the unused field elements with multiplicity at most j
+            if (k - r - 1) * j < w - b - j:
+                break
+            # every further entry placed in an already used field element increases S by at least one bit
+            excess = w - k - (b + j) + (r + 1)
+            if new_cost + max(0, excess) > upper_bound:
+                continue
+            new_mult = mult + 1 if j == last else 1
+            stack.append((j, b + j, r + 1, new_cost, log_denominator + lgamma(j + 1) + log(new_mult), j, new_mult))
+
+    distribution.sort()
+    cumulative = 0
+    for cost, prob in distribution:
+        cumulative += prob
+        if cumulative >= 0.5:
+            return cost
+    return None
+
+
+@lru_cache(maxsize=PE_COLLISION_COST_CACHE_SIZE)
+def _median_collision_cost(w: int, q: int):
+    """Returns the median of S = sum_i log2(c_i!) over random weight-w vectors in Fq^n.
+
+    For few collisions the distribution is computed exactly, otherwise the median is approximated via a Cornish-Fisher
+    expansion of the exact first three cumulants.
+    """
+    mean, variance, third_cumulant = _collision_cost_cumulants(w, q)
+    median = _exact_median_of_collision_cost(w, q, mean + sqrt(max(variance, 0)) + 1e-9)
+    if median is None:
+        median = mean - third_cumulant / (6 * variance)
+    return median
 
 
 def median_size_of_random_orbit(n: int, w: int, q: int):
-    S = []
-    for x in range(100):
-        S.append(random_sparse_vec_orbit(n, w, q))
-    S.sort()
-    return S[49]
+    """Returns the median of the logarithmic orbit size of a random weight-w vector in Fq^n under permutations.
+
+    The orbit of a vector whose non-zero entries take the values of Fq* with multiplicities c_1, ..., c_{q-1} has size
+    n!/((n-w)! * prod_i c_i!).
+
+    Args:
+        n (int): Length of the vector
+        w (int): Hamming weight of the vector
+        q (int): Size of the field
+
+    Examples:
+        >>> from cryptographic_estimators.PEEstimator.pe_helper import median_size_of_random_orbit
+        >>> median_size_of_random_orbit(100, 10, 509)
+        65.76775786425009
+
+    Tests:
+        >>> median_size_of_random_orbit(100, 30, 3)
+        111.43822964716804
+        >>> median_size_of_random_orbit(250, 120, 53)
+        801.0596045553148
+    """
+    return (lgamma(n + 1) - lgamma(n - w + 1)) / log(2) - _median_collision_cost(w, q)
 
 
 def hamming_ball(n: int, q: int, w: int):
@@ -21,9 +21,9 @@ from ..pk_algorithm import PKAlgorithm
 from ..pk_problem import PKProblem
 from ..pk_constants import *
 from ...base_algorithm import optimal_parameter
-from math import factorial, inf, comb as binomial, log2
-from ..pk_helper import gauss_binomial, cost_for_finding_subcode
-from ...SDFqEstimator.sdfq_estimator import SDFqEstimator
+from math import inf, comb as binomial, log2
+from ..pk_helper import gauss_binomial, cost_for_finding_subcode, log2_factorial_table, log2_sum
+from ...SDFqEstimator.sdfq_estimator import sdfq_sub_estimate
 
 
 class SBC(PKAlgorithm):
@@ -47,7 +47,8 @@ class SBC(PKAlgorithm):
         self.set_parameter_ranges("w", 1, n)
         self.set_parameter_ranges("w1", 1, n)
 
-        self.SDFqEstimator = None
+        self._log2_factorials = log2_factorial_table(n + m)
+
         self.SDFqEstimator_parameters = kwargs.get("sd_parameters", {})
         self.SDFqEstimator_parameters.pop("nsolutions", None)
         self.SDFqEstimator_parameters.pop("memory_bound", None)
@@ -121,8 +122,6 @@ class SBC(PKAlgorithm):
         best_u = 0
         n, m, q, ell = self.problem.get_parameters()
 
-
-
         N_w = log2(binomial(n, w)) + log2((q ** d - 1)) * (w - d) + gauss_binomial(m, d, q) - gauss_binomial(n, d,
                                                                                                              q)  # number of expected subcodes
 
@@ -130,41 +129,41 @@ class SBC(PKAlgorithm):
             return inf, inf
 
         if d == 1:
-            self.SDFqEstimator = SDFqEstimator(n=n, k=m, w=w, q=q, bit_complexities=0, nsolutions=N_w,
-                                               memory_bound=self.problem.memory_bound, **self.SDFqEstimator_parameters)
-            c_isd = self.SDFqEstimator.fastest_algorithm().time_complexity()
+            c_isd = sdfq_sub_estimate(n, m, w, q, nsolutions=N_w, memory_bound=self.problem.memory_bound,
+                                      **self.SDFqEstimator_parameters).time
         else:
-            self.SDFqEstimator = None
             c_isd = cost_for_finding_subcode(n, m, d, w, N_w)
 
+        lf = self._log2_factorials
+        log_q = log2(q)
+
+        def floored(x):
+            # mirrors the integer division of the cost formulas, which rounds values below one to zero
+            return x if x >= 0 else -inf
+
         w2 = w - w1
-        T_K = factorial(n) // factorial(n - w1) + factorial(n) // factorial(n - w2) \
-              + factorial(n) ** 2 // q ** (d * ell) // (factorial(n - w1) * factorial(n - w2))
+        log_L1 = lf[n] - lf[n - w1]
+        log_L2 = lf[n] - lf[n - w2]
+        log_T_K = log2_sum(log_L1, log_L2, floored(2 * lf[n] - d * ell * log_q - lf[n - w1] - lf[n - w2]))
 
-        if self._is_early_abort_possible(log2(T_K)):
+        if self._is_early_abort_possible(log_T_K):
             return inf, inf
-        L = min(factorial(n) // factorial(n - w1), factorial(n) // factorial(n - w2))
-        size_K = max(1, factorial(n) // factorial(n - w) // q ** (d * ell))
+        log_L = min(log_L1, log_L2)
+        log_size_K = max(0, lf[n] - lf[n - w] - d * ell * log_q)
         for u in range(1, m):
-
+            log_N_u = floored(lf[n] - lf[m + w - u])
             if u > d:
-                T_L = factorial(n) // factorial(m + w - u) + size_K + factorial(n) // factorial(m + w - u) * size_K \
-                      // q ** (ell * (u - d))
-                T_test = factorial(n - w) // q ** ((u - d) * ell) // factorial(m - u) * size_K
+                log_T_L = log2_sum(log_N_u, log_size_K, floored(log_N_u + log_size_K - ell * (u - d) * log_q))
+                log_T_test = floored(lf[n - w] - (u - d) * ell * log_q - lf[m - u]) + log_size_K
             else:
-                T_L = factorial(n) // factorial(m + w - u) + size_K + factorial(n) * q ** (ell * (d - u)) // factorial(
-                    m + w - u) * size_K
-                T_test = factorial(n - w)* q ** ((d - u) * ell) // factorial(m - u) * size_K
-            L = max(L, min(factorial(n) // factorial(m + w - u), size_K))
-
-
-
-
-
+                log_T_L = log2_sum(log_N_u, log_size_K,
+                                   floored(lf[n] + ell * (d - u) * log_q - lf[m + w - u]) + log_size_K)
+                log_T_test = floored(lf[n - w] + (d - u) * ell * log_q - lf[m - u]) + log_size_K
+            log_L = max(log_L, min(log_N_u, log_size_K))
 
-            local_time = log2(int(2 ** c_isd) + (T_K + T_L + T_test) * self.cost_for_list_operation)
+            local_time = log2_sum(c_isd, log2_sum(log_T_K, log_T_L, log_T_test) + log2(self.cost_for_list_operation))
 
-            local_memory = log2(L) + log2(self.memory_for_list_element)
+            local_memory = log_L + log2(self.memory_for_list_element)
 
             if local_time < time:
                 best_u = u
@@ -17,7 +17,7 @@
 # under the License.
 # ****************************************************************************
 
-from math import log2, comb as binomial, factorial, inf
+from math import log2, comb as binomial, factorial, inf, lgamma, log
 
 
 def gauss_binomial(m: int, r: int, q: int):
@@ -37,6 +37,36 @@ def beullens_lee_brickell_adaptation(n: int, k: int, d: int, w: int, Nw: int):
 def lof(x: int):
     return log2(factorial(x))
 
+
+def log2_factorial_table(n: int):
+    """Return the list of log2(i!) for i = 0, ..., n.
+
+    Examples:
+        >>> from cryptographic_estimators.PKEstimator.pk_helper import log2_factorial_table
+        >>> [round(i, 6) for i in log2_factorial_table(4)]
+        [0.0, 0.0, 1.0, 2.584963, 4.584963]
+    """
+    return [lgamma(i + 1) / log(2) for i in range(n + 1)]
+
+
+def log2_sum(*terms: float):
+    """Return log2(2^t_1 + ... + 2^t_r) for terms t_i given in logarithmic scale.
+
+    Terms equal to -inf contribute zero to the sum.
+
+    Examples:
+        >>> from math import inf
+        >>> from cryptographic_estimators.PKEstimator.pk_helper import log2_sum
+        >>> log2_sum(3, 3)
+        4.0
+        >>> log2_sum(10, -inf)
+        10.0
+    """
+    largest = max(terms)
+    if largest in (inf, -inf):
+        return largest
+    return largest + log2(sum(2 ** (t - largest) for t in terms))
+
 def cost_for_finding_subcode(n: int, k: int, d: int, w: int, Nw: int):
     """Compute cost for computation of d-dimensional subcode with support w where there exist Nw of them."""
     c_isd = beullens_lee_brickell_adaptation(n, k, d, w, Nw)
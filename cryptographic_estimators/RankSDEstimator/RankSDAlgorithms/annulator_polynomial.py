@@ -88,7 +88,6 @@ class AnnulatorPolynomial(RankSDAlgorithm):
         """
 
         q, _, _, k, r = self.problem.get_parameters()
-        self.problem.set_operations_on_base_field(self.on_base_field)
         t = parameters[RANKSD_NUMBER_OF_ENTRIES_X_TO_GUESS]
         time_complexity = self._w * (log2(r) + log2(k)) + r * t * log2(q)
         return time_complexity
@@ -110,7 +109,7 @@ class AnnulatorPolynomial(RankSDAlgorithm):
         t = parameters[RANKSD_NUMBER_OF_ENTRIES_X_TO_GUESS]
         n_rows = n - t
         n_columns = ((r + 1) * (k + 1 - t) - 1)
-        return self.__compute_memory_complexity_helper__(n_rows, n_columns, self.on_base_field)
+        return self.__compute_memory_complexity_helper__(n_rows, n_columns)
 
     def _are_parameters_invalid(self, parameters: dict):
         """Specifies constraints on the parameters.
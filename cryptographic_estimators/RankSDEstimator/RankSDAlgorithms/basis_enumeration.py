@@ -63,7 +63,6 @@ class BasisEnumeration(RankSDAlgorithm):
                749.6889972117298
         """
         q, m, n, _, r = self.problem.get_parameters()
-        self.problem.set_operations_on_base_field(self.on_base_field)
         time_complexity = self._w * log2(n * r + m) + (m - r) * (r - 1) * log2(q)
         return time_complexity
 
@@ -83,4 +82,4 @@ class BasisEnumeration(RankSDAlgorithm):
         _, m, n, k, r = self.problem.get_parameters()
         n_rows = (n - k) * m
         n_columns = n * r + m
-        return self.__compute_memory_complexity_helper__(n_rows, n_columns, self.on_base_field)
+        return self.__compute_memory_complexity_helper__(n_rows, n_columns)
@@ -64,7 +64,6 @@ class GRS(RankSDAlgorithm):
         """
 
         q, m, n, k, r = self.problem.get_parameters()
-        self.problem.set_operations_on_base_field(self.on_base_field)
 
         r1 = m - ceil(k * m / n)
         t1 = self._w * log2((n - k) * m)
@@ -100,6 +99,6 @@ class GRS(RankSDAlgorithm):
         if r1 > 0:
             n_columns = r1 * n
             n_rows = (n - k) * m
-            return self.__compute_memory_complexity_helper__(n_rows, n_columns, self.on_base_field)
+            return self.__compute_memory_complexity_helper__(n_rows, n_columns)
         else:
             return inf
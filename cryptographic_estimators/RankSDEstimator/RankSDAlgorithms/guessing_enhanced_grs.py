@@ -91,7 +91,6 @@ class GuessingEnhancedGRS(RankSDAlgorithm):
 
         r1 = floor(((n - k - 1) * m + t) / n)
         if r1 > 0:
-            self.problem.set_operations_on_base_field(self.on_base_field)
             t1 = self._w * log2((n - k) * m + t)
             mu1 = r * (m - r1) - m + t
             time_complexity = t1 + max(0, mu1 * log2(q))
@@ -119,6 +118,6 @@ class GuessingEnhancedGRS(RankSDAlgorithm):
         if r1 > 0:
             n_columns = r1 * n
             n_rows = (n - k - 1) * m + t
-            return self.__compute_memory_complexity_helper__(n_rows, n_columns, self.on_base_field)
+            return self.__compute_memory_complexity_helper__(n_rows, n_columns)
         else:
             return inf
@@ -67,7 +67,6 @@ class ImprovedGRS(RankSDAlgorithm):
 
         r1 = m - ceil((k + 1) * m / n)
         if r1 > 0:
-            self.problem.set_operations_on_base_field(self.on_base_field)
             t1 = self._w * log2((n - k) * m)
             mu1 = r * (m - r1) - m
             time_complexity = t1 + max(0, mu1 * log2(q))
@@ -93,6 +92,6 @@ class ImprovedGRS(RankSDAlgorithm):
         if r1 > 0:
             n_columns = r1 * n
             n_rows = (n - k - 1) * m
-            return self.__compute_memory_complexity_helper__(n_rows, n_columns, self.on_base_field)
+            return self.__compute_memory_complexity_helper__(n_rows, n_columns)
         else:
             return inf
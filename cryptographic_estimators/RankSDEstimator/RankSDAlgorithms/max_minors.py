@@ -111,7 +111,7 @@ class MaxMinors(RankSDAlgorithm):
 
         a = parameters[RANKSD_NUMBER_OF_COLUMNS_X_TO_GUESS]
         p = parameters[RANKSD_NUMBER_OF_PUNCTURED_POSITIONS]
-        return self.compute_time_complexity_helper(a, 0, p, self.on_base_field)
+        return self.compute_time_complexity_helper(a, 0, p)
 
     def _compute_memory_complexity(self, parameters: dict):
         """Return the memory complexity of the algorithm for a given set of parameters.
@@ -129,7 +129,7 @@ class MaxMinors(RankSDAlgorithm):
 
         a = parameters[RANKSD_NUMBER_OF_COLUMNS_X_TO_GUESS]
         p = parameters[RANKSD_NUMBER_OF_PUNCTURED_POSITIONS]
-        return self.compute_memory_complexity_helper(a, 0, p, self.on_base_field)
+        return self.compute_memory_complexity_helper(a, 0, p)
 
     def _valid_choices(self):
         """Generator yielding new sets of valid parameters.
@@ -64,7 +64,6 @@ class OJ1(RankSDAlgorithm):
 
         q, m, _, k, r = self.problem.get_parameters()
         N = ceil(((r - 1) * m + (k + 1)) / (m - 1))
-        self.problem.set_operations_on_base_field(self.on_base_field)
         time_complexity = self._w * log2((r - 1) * m + k + N + 1) + (r - 1) * (k + N + 2 - r) * log2(q)
 
         return time_complexity
@@ -87,4 +86,4 @@ class OJ1(RankSDAlgorithm):
         N = ceil(((r - 1) * m + k + 1) / (m - 1))
         n_rows = N * m
         n_columns = (r - 1) * m + k + N + 1
-        return self.__compute_memory_complexity_helper__(n_rows, n_columns, self.on_base_field)
+        return self.__compute_memory_complexity_helper__(n_rows, n_columns)
@@ -64,7 +64,6 @@ class OJ2(RankSDAlgorithm):
 
         q, m, _, k, r = self.problem.get_parameters()
         nn = ceil(((k + 1) * r) / (m - r))
-        self.problem.set_operations_on_base_field(self.on_base_field)
         time_complexity = self._w * (log2(m * nn) + log2(k + 1 + nn) + log2(r)) + (r - 1) * (m - r) * log2(q)
 
         return time_complexity
@@ -86,4 +85,4 @@ class OJ2(RankSDAlgorithm):
         nn = ceil(((k + 1) * r) / (m - r))
         n_rows = nn * m
         n_columns = (k + 1 + nn) * r
-        return self.__compute_memory_complexity_helper__(n_rows, n_columns, self.on_base_field)
+        return self.__compute_memory_complexity_helper__(n_rows, n_columns)
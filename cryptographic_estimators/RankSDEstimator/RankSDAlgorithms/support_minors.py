@@ -136,7 +136,7 @@ class SupportMinors(RankSDAlgorithm):
         a = parameters[RANKSD_NUMBER_OF_COLUMNS_X_TO_GUESS]
         b = parameters[RANKSD_LINEAR_VARIABLES_DEGREE]
         p = parameters[RANKSD_NUMBER_OF_PUNCTURED_POSITIONS]
-        return self.compute_time_complexity_helper(a, b, p, self.on_base_field)
+        return self.compute_time_complexity_helper(a, b, p)
 
     def _compute_memory_complexity(self, parameters: dict):
         """Return the memory complexity of the algorithm for a given set of parameters
@@ -154,7 +154,7 @@ class SupportMinors(RankSDAlgorithm):
         a = parameters[RANKSD_NUMBER_OF_COLUMNS_X_TO_GUESS]
         b = parameters[RANKSD_LINEAR_VARIABLES_DEGREE]
         p = parameters[RANKSD_NUMBER_OF_PUNCTURED_POSITIONS]
-        return self.compute_memory_complexity_helper(a, b, p, self.on_base_field)
+        return self.compute_memory_complexity_helper(a, b, p)
 
     def _valid_choices(self):
         """Generator yielding new sets of valid parameters.
@@ -76,7 +76,26 @@ class RankSDAlgorithm(BaseAlgorithm):
         r_reduced = r
         return q_reduced, m_reduced, n_reduced, k_reduced, r_reduced
 
-    def compute_time_complexity_helper(self, a, b, p, op_on_base_field):
+    def _to_bitcomplexity_time(self, basic_operations: float):
+        """Return the bit-complexity of basic_operations operations on the field the algorithm works on.
+
+           Tests:
+               >>> from cryptographic_estimators.RankSDEstimator.ranksd_algorithm import RankSDAlgorithm
+               >>> from cryptographic_estimators.RankSDEstimator.ranksd_problem import RankSDProblem
+               >>> A = RankSDAlgorithm(RankSDProblem(q=2, m=127, n=118, k=48, r=7))
+               >>> A.on_base_field = False
+               >>> A._to_bitcomplexity_time(200)
+               213.97736937354432
+               >>> A.problem.operations_on_base_field
+               True
+        """
+        return self.problem.to_bitcomplexity_time(basic_operations, operations_on_base_field=self.on_base_field)
+
+    def _to_bitcomplexity_memory(self, elements_to_store: float):
+        """Return the memory bit-complexity of elements_to_store elements of the field the algorithm works on."""
+        return self.problem.to_bitcomplexity_memory(elements_to_store, operations_on_base_field=self.on_base_field)
+
+    def compute_time_complexity_helper(self, a, b, p):
         """Return the time complexity of the reduced instance, i.e.,
            after puncturing the code on ``p`` positions and specializing ``a`` columns in X.
 
@@ -84,10 +103,7 @@ class RankSDAlgorithm(BaseAlgorithm):
                a (int): Number of columns to guess in X.
                b (int): Degree of linear variables.
                p (int): Number of positions to puncture in the code.
-               op_on_base_field (boolean): True if operations are performed on Fq. False if performed on Fq^m.
         """
-        self.problem.set_operations_on_base_field(op_on_base_field)
-
         q, m, n_red, k_red, r = self.get_reduced_instance_parameters(a, p)
         w = self._w
         n_rows = compute_nb(m, n_red, k_red, r, b)
@@ -96,7 +112,7 @@ class RankSDAlgorithm(BaseAlgorithm):
 
         return time_complexity
 
-    def compute_memory_complexity_helper(self, a, b, p, op_on_base_field):
+    def compute_memory_complexity_helper(self, a, b, p):
         """Return the time complexity of the reduced instance, i.e.,
            after puncturing the code on ``p`` positions and specializing ``a`` columns in X.
 
@@ -104,25 +120,22 @@ class RankSDAlgorithm(BaseAlgorithm):
                a (int): Number of columns to guess in X.
                b (int): Degree of linear variables.
                p (int): Number of positions to puncture in the code.
-               op_on_base_field (boolean): True if operations are performed on Fq. False if performed on Fq^m.
         """
 
         _, m, n_red, k_red, r = self.get_reduced_instance_parameters(a, p)
         n_rows = compute_nb(m, n_red, k_red, r, b)
         n_columns = compute_mb(m, n_red, k_red, r, b)
-        return self.__compute_memory_complexity_helper__(n_rows, n_columns, op_on_base_field)
+        return self.__compute_memory_complexity_helper__(n_rows, n_columns)
 
-    def __compute_memory_complexity_helper__(self, n_rows, n_columns, op_on_base_field):
+    def __compute_memory_complexity_helper__(self, n_rows, n_columns):
         """Return the log of the number of field elements to store an n_rows x n_columns matrix.
 
             Args:
                 n_rows (int): Number of columns to guess in X.
                 n_columns (int): Degree of linear variables.
-                op_on_base_field (boolean): True if operations are performed on Fq. False if performed on Fq^m.
         """
 
         memory_complexity = 0
-        self.problem.set_operations_on_base_field(op_on_base_field)
         if n_columns > 0 and n_rows > 0:
             memory_complexity += log2(n_rows * n_columns)
 
@@ -29,3 +29,6 @@ RANKSD_NUMBER_OF_ENTRIES_X_TO_GUESS = 't'
 RANKSD_NUMBER_OF_PUNCTURED_POSITIONS = 'p'
 RANKSD_NUMBER_OF_COLUMNS_X_TO_GUESS = 'a'
 RANKSD_LINEAR_VARIABLES_DEGREE = "b"
+
+# Maximum number of row and column counts of Support Minors systems kept alive by the process-wide caches.
+RANKSD_HELPER_CACHE_SIZE = 65536
@@ -17,9 +17,10 @@
 # under the License.
 # ****************************************************************************
 
+from functools import lru_cache
 from math import comb as binomial, inf
 from .ranksd_constants import RANKSD_NUMBER_OF_COLUMNS_X_TO_GUESS, \
-    RANKSD_LINEAR_VARIABLES_DEGREE, RANKSD_NUMBER_OF_PUNCTURED_POSITIONS
+    RANKSD_LINEAR_VARIABLES_DEGREE, RANKSD_NUMBER_OF_PUNCTURED_POSITIONS, RANKSD_HELPER_CACHE_SIZE
 
 
 def nb_fqm(m, n, k, r, b):
@@ -35,9 +36,20 @@ def nb_fqm(m, n, k, r, b):
     if (1 > k) or (k > n) or (b < 1) or (r < 1) or (m < 1) or (r > n - k - 1):
         return None
 
+    if b == 1:
+        # the sum of binomial(n - i, r) for i = 1..k telescopes to a difference of cumulative sums
+        nn = binomial(n, r + 1) - binomial(n - k, r + 1)
+        return nn - binomial(n - k - 1, r) * k
+
+    # binomial(n - i, r) and binomial(k + b - 1 - i, b - 1) are updated from one i to the next
     nn = 0
+    binomial_n = binomial(n - 1, r)
+    binomial_k = binomial(k + b - 2, b - 1)
     for i in range(1, k + 1):
-        nn = nn + binomial(n - i, r) * binomial(k + b - 1 - i, b - 1)
+        nn = nn + binomial_n * binomial_k
+        if i < k:
+            binomial_n = binomial_n * (n - i - r) // (n - i)
+            binomial_k = binomial_k * (k - i) // (k + b - 1 - i)
 
     nn = nn - binomial(n - k - 1, r) * binomial(k + b - 1, b)
 
@@ -64,6 +76,7 @@ def nb_fq_syz(m, n, k, r, b):
     return (m - 1) * nn
 
 
+@lru_cache(maxsize=RANKSD_HELPER_CACHE_SIZE)
 def compute_nb(m, n, k, r, b):
     """Returns the number of rows.
 
@@ -87,6 +100,7 @@ def compute_nb(m, n, k, r, b):
         return nb - nb_fq_syz(m, n, k, r, b)
 
 
+@lru_cache(maxsize=RANKSD_HELPER_CACHE_SIZE)
 def compute_mb(m, n, k, r, b):
     """Returns the number of columns.
 
@@ -107,9 +121,27 @@ def compute_mb(m, n, k, r, b):
         return binomial(k + b - 1, b) * (binomial(n, r) - m * binomial(n - k - 1, r))
 
 
+def has_enough_rows(m, n, k, r, b):
+    """Returns True if the Support Minors system at bi-degree b,1 has at least as many rows as columns minus one.
+
+       Args:
+           m (int): Extension degree.
+           n (int): Code length.
+           k (int): Code dimension.
+           r (int): Target rank.
+           b (int): Linear variables degree.
+    """
+    nb = compute_nb(m, n, k, r, b)
+    mb = compute_mb(m, n, k, r, b)
+    return nb is not None and mb is not None and nb >= mb - 1
+
+
 def find_p_sm_fqm(m, n, k, r, b, p_min, p_max):
     """Returns p for the given instance.
 
+       For b = 0 the system has enough rows for all p up to some bound, as m * binomial(n - p - k - 1, r) shrinks
+       faster than binomial(n - p, r) when p grows, thus the largest such p is found by bisection.
+
        Args:
            m (int): Extension degree.
            n (int): Code length.
@@ -118,14 +150,30 @@ def find_p_sm_fqm(m, n, k, r, b, p_min, p_max):
            b (int): Linear variables degree
            p_min (int): minimum value for p
            p_max (int): maximum value for p
+
+       Tests:
+           >>> from cryptographic_estimators.RankSDEstimator.ranksd_helper import find_p_sm_fqm, has_enough_rows
+           >>> find_p_sm_fqm(31, 21, 5, 4, 0, 0, 19)
+           8
+           >>> max(p for p in range(0, 20) if has_enough_rows(31, 21 - p, 5, 4, 0))
+           8
     """
+    p_end = min(n - 1, p_max + 1)
+    if b == 0:
+        low, high = p_min, p_end
+        while low < high:
+            p = (low + high) // 2
+            if has_enough_rows(m, n - p, k, r, b):
+                low = p + 1
+            else:
+                high = p
+        return low - 1 if low > p_min else None
 
     p_selected = None
-    for p in range(p_min, min(n - 1, p_max + 1), 1):
-        nb = compute_nb(m, n - p, k, r, b)
-        mb = compute_mb(m, n - p, k, r, b)
-        if nb is not None and mb is not None and nb >= mb - 1:
+    for p in range(p_end - 1, p_min - 1, -1):
+        if has_enough_rows(m, n - p, k, r, b):
             p_selected = p
+            break
 
     return p_selected
 
@@ -133,6 +181,9 @@ def find_p_sm_fqm(m, n, k, r, b, p_min, p_max):
 def find_best_choice_param_mm(m, n, k, r, a_min, a_max, p_min, p_max):
     """Returns the best choice (a,p) for Max Minors for the given instance.
 
+       The system has enough rows for all a from some value on, as binomial(n - a, r) shrinks when a grows while the
+       number of rows does not change, thus the smallest such a is found by bisection.
+
        Args:
            m (int): Extension degree.
            n (int): Code length.
@@ -142,18 +193,24 @@ def find_best_choice_param_mm(m, n, k, r, a_min, a_max, p_min, p_max):
            a_max (int): maximum value for a
            p_min (int): minimum value for p
            p_max (int): maximum value for p
+
+       Tests:
+           >>> from cryptographic_estimators.RankSDEstimator.ranksd_helper import find_best_choice_param_mm
+           >>> find_best_choice_param_mm(31, 33, 15, 10, 0, 15, 0, 33)
+           {'a': 12, 'p': 2}
     """
     values = {}
-    a_selected = None
-    for a in range(a_min, a_max + 1, 1):
-        nb = compute_nb(m, n - a, k - a, r, 0)
-        mb = compute_mb(m, n - a, k - a, r, 0)
-        if nb is not None and mb is not None and nb >= mb - 1:
-            a_selected = a
-            break
-    if a_selected is None or a_selected >= k:
+    low, high = a_min, max(a_min, min(a_max, k - 1) + 1)
+    while low < high:
+        a = (low + high) // 2
+        if has_enough_rows(m, n - a, k - a, r, 0):
+            high = a
+        else:
+            low = a + 1
+    if low > min(a_max, k - 1):
         return values
 
+    a_selected = low
     p_selected = find_p_sm_fqm(m, n - a_selected, k - a_selected, r, 0, p_min, p_max)
     values[RANKSD_NUMBER_OF_COLUMNS_X_TO_GUESS] = a_selected
     values[RANKSD_NUMBER_OF_PUNCTURED_POSITIONS] = p_selected
@@ -173,9 +230,7 @@ def find_b_sm_fqm(m, n, k, r, b_min, b_max):
     """
     b_selected = inf
     for b in range(b_min, b_max + 1, 1):
-        nb = compute_nb(m, n, k, r, b)
-        mb = compute_mb(m, n, k, r, b)
-        if nb is not None and mb is not None and nb >= mb - 1:
+        if has_enough_rows(m, n, k, r, b):
             b_selected = b
             break
 
@@ -74,7 +74,8 @@ class RankSDProblem(BaseProblem):
         self.operations_on_base_field = True
 
     def set_operations_on_base_field(self, value):
-        """Set operations_on_base_field to value.
+        """Set operations_on_base_field to value, which is used by the bit-complexity conversions if they are not told
+           the field the operations are performed on.
 
            Args:
                value (boolean): True if operations are performed on Fq. False if operations are performed on Fq^m.
@@ -83,11 +84,26 @@ class RankSDProblem(BaseProblem):
 
         self.operations_on_base_field = value
 
-    def to_bitcomplexity_time(self, basic_operations: float):
+    def _operations_field_order(self, operations_on_base_field):
+        """Return the order of the field the operations are performed on.
+
+           Args:
+               operations_on_base_field (boolean): True if operations are performed on Fq. False if performed on Fq^m.
+               If None, operations_on_base_field of the problem is used.
+        """
+        q = self.parameters[RANKSD_BASE_FIELD_ORDER]
+        m = self.parameters[RANKSD_DEGREE_EXTENSION]
+        if operations_on_base_field is None:
+            operations_on_base_field = self.operations_on_base_field
+        return q if operations_on_base_field else q ** m
+
+    def to_bitcomplexity_time(self, basic_operations: float, operations_on_base_field=None):
         """Return the bit-complexity corresponding to a certain amount of basic_operations.
 
            Args:
                basic_operations (float): Number of basic operations (logarithmic).
+               operations_on_base_field (boolean, optional): True if operations are performed on Fq. False if performed
+               on Fq^m. Defaults to operations_on_base_field of the problem.
 
            Tests:
                >>> from cryptographic_estimators.RankSDEstimator.ranksd_estimator import RankSDProblem
@@ -99,26 +115,28 @@ class RankSDProblem(BaseProblem):
                >>> RSDP.set_operations_on_base_field(False)
                >>> RSDP.to_bitcomplexity_time(200)
                213.97736937354432
-        """
-        q = self.parameters[RANKSD_BASE_FIELD_ORDER]
-        theta = self._theta
-        m = self.parameters[RANKSD_DEGREE_EXTENSION]
 
-        if not self.operations_on_base_field:
-            q = q ** m
-        return ngates(q, basic_operations, theta=theta)
+               >>> RSDP.to_bitcomplexity_time(200, operations_on_base_field=True)
+               200.0
+        """
+        q = self._operations_field_order(operations_on_base_field)
+        return ngates(q, basic_operations, theta=self._theta)
 
-    def to_bitcomplexity_memory(self, elements_to_store: float):
+    def to_bitcomplexity_memory(self, elements_to_store: float, operations_on_base_field=None):
         """Return the memory bit-complexity associated to a given number of elements to store.
 
            Args:
               elements_to_store: number of memory operations (logarithmic).
+              operations_on_base_field (boolean, optional): True if the elements are in Fq. False if they are in Fq^m.
+              Defaults to operations_on_base_field of the problem.
 
+           Tests:
+               >>> from cryptographic_estimators.RankSDEstimator.ranksd_estimator import RankSDProblem
+               >>> RSDP = RankSDProblem(q=2, m=127, n=118, k=48, r=7)
+               >>> RSDP.to_bitcomplexity_memory(20, operations_on_base_field=False)
+               26.988684686772167
         """
-        q = self.parameters[RANKSD_BASE_FIELD_ORDER]
-        m = self.parameters[RANKSD_DEGREE_EXTENSION]
-        if not self.operations_on_base_field:
-            q = q ** m
+        q = self._operations_field_order(operations_on_base_field)
         return log2(ceil(log2(q))) + elements_to_store
 
     def expected_number_solutions(self):
@@ -21,8 +21,9 @@
 from ...base_algorithm import optimal_parameter
 from ..regsd_algorithm import RegSDAlgorithm
 from ..regsd_problem import RegSDProblem
-from ..regsd_helper import r_int
+from ..regsd_helper import r_int, log2_binomial_table
 from math import log2, comb as binomial, ceil, floor, inf
+from numpy import arange, array, errstate, floor as np_floor, log2 as np_log2, maximum, vectorize, where
 from types import SimpleNamespace
 
 
@@ -58,7 +59,7 @@ class RegularISDRep(RegSDAlgorithm):
             >>> from cryptographic_estimators.RegSDEstimator import RegSDProblem
             >>> A = RegularISDRep(RegSDProblem(n=300,k=150,w=30))
             >>> A.p()
-            8
+            6
         """
         return self._get_optimal_parameter("p")
 
@@ -71,7 +72,7 @@ class RegularISDRep(RegSDAlgorithm):
             >>> from cryptographic_estimators.RegSDEstimator import RegSDProblem
             >>> A = RegularISDRep(RegSDProblem(n=300,k=150,w=30))
             >>> A.ell()
-            22
+            20
         """
         return self._get_optimal_parameter("ell")
 
@@ -84,7 +85,7 @@ class RegularISDRep(RegSDAlgorithm):
             >>> from cryptographic_estimators.RegSDEstimator import RegSDProblem
             >>> A = RegularISDRep(RegSDProblem(n=300,k=150,w=30))
             >>> A.eps_x()
-            0
+            2
         """
         return self._get_optimal_parameter("eps_x")
 
@@ -113,6 +114,15 @@ class RegularISDRep(RegSDAlgorithm):
             return True
         return False
 
+    def _ell_range(self, p: int, eps_x: int, eps_y: int):
+        """Return the range of ell around twice the size of the initial lists for the given p, eps_x and eps_y."""
+        _, k, w = self.problem.get_parameters()
+        k_prime = k - w
+        p_y = (p / 2 + eps_x) / 2 + eps_y
+        L1 = log2(max(binomial(r_int(w / 2), int(p_y / 2)) * k_prime ** (p_y // 2), 1))
+        ell_approx = r_int(2 * L1)
+        return r_int(ell_approx * 0.5), r_int(ell_approx * 1.5)
+
     def _valid_choices(self):
         """Generator yielding new sets of valid parameters.
     
@@ -120,67 +130,118 @@ class RegularISDRep(RegSDAlgorithm):
         """
         new_ranges = self._fix_ranges_for_already_set_parameters()
 
-        n, k, w = self.problem.get_parameters()
-        k_prime = k - w
-        for p in range(new_ranges["p"]["min"], min(w // 2, new_ranges["p"]["max"])+1, 8):
-            for eps_x in range(new_ranges["eps_x"]["min"], new_ranges["eps_x"]["max"]+1, 4):
-                p_x = p/2 + eps_x
+        _, _, w = self.problem.get_parameters()
+        for p in range(new_ranges["p"]["min"], min(w // 2, new_ranges["p"]["max"]) + 1, 2):
+            for eps_x in range(new_ranges["eps_x"]["min"], new_ranges["eps_x"]["max"] + 1):
                 for eps_y in range(new_ranges["eps_y"]["min"], new_ranges["eps_y"]["max"] + 1):
-                    p_y = p_x / 2 + eps_y
-                    L1 = log2(max(binomial(r_int(w / 2), int(p_y / 2)) * k_prime ** (p_y // 2), 1))
-                    ell_approx = r_int(2 * L1)
-                    ell_min = r_int(ell_approx * 0.5)
-                    ell_max = r_int(ell_approx * 1.5)
+                    ell_min, ell_max = self._ell_range(p, eps_x, eps_y)
                     for ell in range(max(new_ranges["ell"]["min"], ell_min), min(ell_max, new_ranges["ell"]["max"])):
                         indices = {"p": p, "ell": ell, "eps_x": eps_x, "eps_y": eps_y}
                         if self._are_parameters_invalid(indices):
                             continue
                         yield indices
 
-    def _compute_time_and_memory_complexity(self, parameters: dict):
-        """Return the time complexity of the algorithm for a given set of parameters.
-    
+    def _find_optimal_parameters(self):
+        """Enumerates the same parameter sets as `_valid_choices`, evaluating all sets sharing p and eps_x at once.
+
+        For each p and eps_x, the valid choices of (eps_y, ell) are a mask over a NumPy grid, on which the time and
+        memory complexities are computed in one go. The first set of minimal time complexity is saved in
+        `_optimal_parameters`, as in the generic search.
+        """
+        new_ranges = self._fix_ranges_for_already_set_parameters()
+        n, k, w = self.problem.get_parameters()
+
+        time = inf
+        for p in range(new_ranges["p"]["min"], min(w // 2, new_ranges["p"]["max"]) + 1, 2):
+            for eps_x in range(new_ranges["eps_x"]["min"], new_ranges["eps_x"]["max"] + 1):
+                eps_y = arange(new_ranges["eps_y"]["min"], new_ranges["eps_y"]["max"] + 1)[:, None]
+                eps_y = eps_y[w / 2 - p / 4 - eps_x / 2 >= eps_y / 2][:, None]
+                if w / 2 - p / 2 < eps_x / 2 or w / 2 < p / 2 or len(eps_y) == 0:
+                    continue
+
+                ell_ranges = array([self._ell_range(p, eps_x, int(i)) for i in eps_y[:, 0]])
+                ell_min = max(new_ranges["ell"]["min"], ell_ranges[:, 0].min())
+                ell_max = min(new_ranges["ell"]["max"], ell_ranges[:, 1].max())
+                if ell_max <= ell_min:
+                    continue
+                ell = arange(ell_min, ell_max)[None, :]
+
+                v = (k - w + ell) / w
+                valid = (ell_ranges[:, :1] <= ell) & (ell < ell_ranges[:, 1:]) & (v != 0) & (v < n / w)
+                if not valid.any():
+                    continue
+
+                tmp_time, tmp_memory = self._compute_time_and_memory_complexities(p, ell, eps_x, eps_y)
+                if self.bit_complexities:
+                    tmp_memory = self._to_bitcomplexity_memory(tmp_memory)
+                if self._memory_access != 0:
+                    tmp_time[valid] += vectorize(self.memory_access_cost, otypes=[float])(tmp_memory[valid])
+
+                tmp_time = where(valid & (tmp_memory <= self.problem.memory_bound), tmp_time, inf)
+                i, j = divmod(int(tmp_time.argmin()), tmp_time.shape[1])
+                if tmp_time[i, j] < time:
+                    time = tmp_time[i, j]
+                    self._optimal_parameters.update({"p": p, "ell": int(ell[0, j]), "eps_x": eps_x,
+                                                     "eps_y": int(eps_y[i, 0])})
+                    self._current_minimum_for_early_abort = min(time, self._current_minimum_for_early_abort)
+        self._current_minimum_for_early_abort = inf
+
+    def _compute_time_and_memory_complexities(self, p: int, ell, eps_x: int, eps_y):
+        """Return the time and memory complexities of the algorithm, where ell and eps_y may be NumPy arrays.
+
+        Both are inf if there are more representations on the second level than on the first one.
+
         Args:
-            parameters (dict): Dictionary including the parameters.
+            p (int): Weight of the solution in the information set.
+            ell: Number of parity-check equations matched by the final list.
+            eps_x (int): Additional weight of the representations on the first level.
+            eps_y: Additional weight of the representations on the second level.
         """
         n, k, w = self.problem.get_parameters()
-        p, ell, eps_x, eps_y= list(parameters.values())
-        
-        k_prime = k-w
-        v = (k_prime + ell) / w
-        b=n//w
+        log2_binomial = log2_binomial_table(w, w)
 
-        p_x = p//2 + eps_x
-        p_y = p_x//2 + eps_y
-        # Num reps
-        R_x = (log2(binomial(int(p / 2), int(p / 4))) + log2(binomial(int((w-p)/ 2), int(eps_x / 2))) + log2(v) * (eps_x / 2)) * 2
-        R_y = (log2(binomial(int(p_x / 2), int(p_x / 4))) + log2(binomial(int((w- p_x)/2), int(eps_y // 2))) + log2(v) * (
-                    eps_y // 2)) * 2
+        k_prime = k - w
+        v = (k_prime + ell) / w
+        b = n // w
 
-        ell_x = floor(R_x)
-        ell_y = floor(R_y)
+        p_x = p // 2 + eps_x
+        p_y = p_x // 2 + eps_y
+        with errstate(divide="ignore", invalid="ignore"):
+            # Num reps
+            R_x = (log2_binomial[p // 2, p // 4] + log2_binomial[(w - p) // 2, eps_x // 2] + np_log2(v) * (eps_x / 2)) * 2
+            R_y = (log2_binomial[p_x // 2, p_x // 4] + log2_binomial[(w - p_x) // 2, eps_y // 2] + np_log2(v) * (
+                        eps_y // 2)) * 2
 
-        if ell_y > ell_x:
-            return inf, inf
+            ell_x = np_floor(R_x)
+            ell_y = np_floor(R_y)
 
-        # success probability
-        p_iter = log2(binomial(floor(w / 2), r_int(p / 2))) + log2(binomial(ceil(w / 2), r_int(p / 2))) + log2(
-            v / b) * p + log2(1 - v / b) * (w - p)
+            # success probability
+            p_iter = log2_binomial[floor(w / 2), r_int(p / 2)] + log2_binomial[ceil(w / 2), r_int(p / 2)] + np_log2(
+                v / b) * p + np_log2(1 - v / b) * (w - p)
 
-        L1 = log2(binomial(r_int(w / 2), int(p_y / 2))) + log2(v) * (p_y / 2)  # list size, first level (initial lists)
+            L1 = log2_binomial[r_int(w / 2), p_y // 2] + np_log2(v) * (p_y / 2)  # list size, first level (initial lists)
 
-        L_y1 = L1 * 2 - ell_y
-        N_y = L_y1 * 2 - (ell_x - ell_y)
+            L_y1 = L1 * 2 - ell_y
+            N_y = L_y1 * 2 - (ell_x - ell_y)
 
-        L_x1 = log2(binomial(r_int(w / 2), p_x // 2)) * 2 + log2(v) * p_x - ell_x
-        N_x = L_x1 * 2 - (ell - ell_x)
+            L_x1 = log2_binomial[r_int(w / 2), p_x // 2] * 2 + np_log2(v) * p_x - ell_x
+            N_x = L_x1 * 2 - (ell - ell_x)
 
-        # cost of one iteration
-        T_gauss = log2(n - k_prime) * 2
-        T_iter = max(T_gauss, 3 + L1, 2 + L_y1, 1 + N_y, 1 + L_x1, N_x)
+            # cost of one iteration
+            T_gauss = log2(n - k_prime) * 2
+            T_iter = maximum(maximum(maximum(T_gauss, 3 + L1), maximum(2 + L_y1, 1 + N_y)), maximum(1 + L_x1, N_x))
 
-        # overall cost
-        time = T_iter - p_iter
-        memory = max(L1, L_y1,L_x1)
+            # overall cost
+            time = where(ell_y > ell_x, inf, T_iter - p_iter)
+            memory = where(ell_y > ell_x, inf, maximum(maximum(L1, L_y1), L_x1))
         return time, memory
 
+    def _compute_time_and_memory_complexity(self, parameters: dict):
+        """Return the time complexity of the algorithm for a given set of parameters.
+    
+        Args:
+            parameters (dict): Dictionary including the parameters.
+        """
+        time, memory = self._compute_time_and_memory_complexities(parameters["p"], parameters["ell"],
+                                                                  parameters["eps_x"], parameters["eps_y"])
+        return float(time), float(memory)
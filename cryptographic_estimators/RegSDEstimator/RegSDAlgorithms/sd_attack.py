@@ -24,15 +24,25 @@ from ...SDEstimator import SDEstimator
 from ...SDEstimator.SDAlgorithms import BJMMdw, BJMMpdw, BJMMplus, MayOzerov, BothMay, Stern, Dumer
 
 
-#FIX: Performance
 class SDAttack(RegSDAlgorithm):
     def __init__(self, problem: RegSDProblem, **kwargs):
         """Construct an instance of SDEstimator to solve the RegSDProblem.
 
-        (for performance reasons for now only BJMM is estimated)
+        The attack cost is given by the fastest algorithm of the SDEstimator. For performance reasons only BJMM, BallCollision
+        and Prange are estimated by default, as estimating the whole ISD family is still several times slower.
 
         Args:
             problem (RegSDProblem): An instance of the RegSDProblem class.
+            **kwargs: Additional keyword arguments.
+                full_isd_family (bool, optional): Estimate the whole ISD family of the SDEstimator. Defaults to False.
+
+        Tests:
+            >>> from cryptographic_estimators.RegSDEstimator.RegSDAlgorithms import SDAttack
+            >>> from cryptographic_estimators.RegSDEstimator import RegSDProblem
+            >>> SDAttack(RegSDProblem(n=100, k=50, w=10)).SDEstimator.nalgorithms()
+            3
+            >>> SDAttack(RegSDProblem(n=100, k=50, w=10), full_isd_family=True).SDEstimator.nalgorithms()
+            10
         """
         super(SDAttack, self).__init__(problem, **kwargs)
         self._name = "SD-Attack"
@@ -41,9 +51,11 @@ class SDAttack(RegSDAlgorithm):
         _ = kwargs.pop("bit_complexities", None)
         _ = kwargs.pop("nsolutions", None)
         _ = kwargs.pop("excluded_algorithms", None)
+        full_isd_family = kwargs.pop("full_isd_family", False)
+        excluded_algorithms = [] if full_isd_family else [BJMMdw, BJMMpdw, BJMMplus, MayOzerov, BothMay, Stern, Dumer]
         self.SDEstimator = SDEstimator(n, k, w, bit_complexities=0
                                        , nsolutions=self.problem.nsolutions
-                                       , excluded_algorithms=[BJMMdw, BJMMpdw, BJMMplus, MayOzerov, BothMay, Stern, Dumer]
+                                       , excluded_algorithms=excluded_algorithms
                                        , **kwargs)
 
     def _compute_time_and_memory_complexity(self, parameters: dict):
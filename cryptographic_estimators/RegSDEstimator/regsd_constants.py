@@ -20,3 +20,6 @@
 RegSD_CODE_LENGTH = "code length"
 RegSD_CODE_DIMENSION = "code dimension"
 RegSD_ERROR_WEIGHT = "error weight"
+
+# Maximum number of log2 binomial tables kept alive by the process-wide cache of regsd_helper.
+RegSD_BINOMIAL_TABLE_CACHE_SIZE = 64
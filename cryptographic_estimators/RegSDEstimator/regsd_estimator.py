@@ -66,7 +66,7 @@ class RegSDEstimator(BaseEstimator):
             +----------------+-------+--------+----------------------------------------------------------------------+
             | RegularISDPerm | 133.4 |   18.8 |                                  {}                                  |
             | RegularISDEnum | 114.8 |   31.1 |                         {'p': 6, 'ell': 20}                          |
-            | RegularISDRep  | 112.7 |   60.3 |             {'p': 24, 'ell': 96, 'eps_x': 4, 'eps_y': 0}             |
+            | RegularISDRep  | 108.4 |   66.9 |            {'p': 30, 'ell': 110, 'eps_x': 4, 'eps_y': 0}             |
             | CCJ            | 129.1 |  127.6 |                             {'ell': 118}                             |
             | CCJLin         | 148.9 |   18.4 |                                  {}                                  |
             | SDAttack       | 155.1 |  118.9 | {'r': 6, 'depth': 2, 'p': 32, 'p1': 19, 'l': 212, 'variant': 'BJMM'} |
@@ -83,7 +83,7 @@ class RegSDEstimator(BaseEstimator):
             +----------------+------+--------+-------------------------------------------------------------------+
             | RegularISDPerm | 72.0 |   21.3 |                                 {}                                |
             | RegularISDEnum | 57.4 |   28.5 |                        {'p': 4, 'ell': 15}                        |
-            | RegularISDRep  | 59.0 |   41.0 |            {'p': 8, 'ell': 34, 'eps_x': 0, 'eps_y': 0}            |
+            | RegularISDRep  | 53.0 |   29.9 |            {'p': 6, 'ell': 39, 'eps_x': 2, 'eps_y': 0}            |
             | CCJ            | 75.8 |   74.7 |                            {'ell': 67}                            |
             | CCJLin         | 83.4 |   21.3 |                                 {}                                |
             | SDAttack       | 59.0 |   27.7 | {'r': 8, 'depth': 2, 'p': 2, 'p1': 1, 'l': 20, 'variant': 'BJMM'} |
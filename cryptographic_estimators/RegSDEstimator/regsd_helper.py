@@ -17,5 +17,40 @@
 # under the License.
 # ****************************************************************************
 
+from functools import lru_cache
+from math import comb as binomial, log2
+from numpy import full, inf
+from .regsd_constants import RegSD_BINOMIAL_TABLE_CACHE_SIZE
+
+
 def r_int(x):
-    return int(round(x))
\ No newline at end of file
+    return int(round(x))
+
+
+@lru_cache(maxsize=RegSD_BINOMIAL_TABLE_CACHE_SIZE)
+def log2_binomial_table(n_max: int, k_max: int):
+    """Return the table whose entry (n, k) is log2 of the binomial coefficient n choose k, for n <= n_max and k <= k_max.
+
+    Entries with k > n are -inf. The entries are computed from the exact integers, such that they are indexable by
+    NumPy arrays of parameters without loss of precision. The table is shared by all callers and therefore read-only.
+
+    Args:
+        n_max (int): Largest n in the table
+        k_max (int): Largest k in the table
+
+    Tests:
+        >>> from cryptographic_estimators.RegSDEstimator.regsd_helper import log2_binomial_table
+        >>> T = log2_binomial_table(4, 3)
+        >>> T[4].tolist()
+        [0.0, 2.0, 2.584962500721156, 2.0]
+        >>> T[1].tolist()
+        [0.0, 0.0, -inf, -inf]
+        >>> T.flags.writeable
+        False
+    """
+    table = full((n_max + 1, k_max + 1), -inf)
+    for n in range(n_max + 1):
+        for k in range(min(n, k_max) + 1):
+            table[n, k] = log2(binomial(n, k))
+    table.flags.writeable = False
+    return table
@@ -30,6 +30,7 @@ from ...SDEstimator.sd_helper import (
     ceil,
     inf,
 )
+from functools import lru_cache
 from scipy.special import binom as binom_sp
 from scipy.optimize import root
 from warnings import filterwarnings
@@ -40,6 +41,62 @@ from ..sd_constants import *
 filterwarnings("ignore", category=RuntimeWarning)
 
 
+@lru_cache(maxsize=SD_CONSTRAINT_CACHE_SIZE)
+def _first_constraint(k: int, p: int, p1: int, w1: int, w11: int):
+    """Returns the l1 value for which the representations of BJMM-dw cancel out exactly, or -1 if there is none."""
+    try:
+
+        def f(x):
+            try:
+                x = float(x[0])
+            except:
+                x = float(x)
+            return (
+                2
+                * log2(
+                    (binom(p, p // 2) * binom(k // 2 - p, p1 - p // 2))
+                    * (binom_sp(x, w1 // 2) * binom_sp(x - w1, w11 - w1 // 2))
+                    + 1
+                )
+                - 2 * x
+            )
+
+        l1_val = int(
+            root(
+                f,
+                2 * log2((binom(p, p // 2) * binom(k // 2 - p, p1 - p // 2))),method='hybr'
+            ).x[0]
+        )
+    except ValueError:
+        return -1
+
+    if f(l1_val) < 0 or f(l1_val) > 10:
+        return -1
+    return l1_val
+
+
+@lru_cache(maxsize=SD_CONSTRAINT_CACHE_SIZE)
+def _second_constraint(list_size: int, w2: int):
+    """Returns the l2 value for which lists of size `list_size` keep their size in BJMM-dw, or -1 if there is none."""
+    try:
+
+        def f(x):
+            try:
+                x = float(x[0])
+            except:
+                x = float(x)
+            return log2(list_size) + 2 * log2(binom_sp(x, w2) + 1) - 2 * x
+
+        l2_val = int(root(f, log2(list_size)/2,method='hybr').x[0])
+    except ValueError:
+        return -1
+
+    if f(l2_val) < 0 or f(l2_val) > 10:
+        return -1
+
+    return l2_val
+
+
 class BJMMdw(SDAlgorithm):
     def __init__(self, problem: SDProblem, **kwargs):
         """Construct an instance of BJMM's estimator using disjoint weight distributions combined with MitM-nearest neighbor search. [EB22]_, [MMT11]_, [BJMM12]_.
@@ -201,61 +258,20 @@ class BJMMdw(SDAlgorithm):
                             yield indices
 
     def _choose_first_constraint_such_that_representations_cancel_out_exactly(self, parameters: dict):
-        """Tries to find an l1 value fulfilling the constraints."""
-        _, k, _ = self.problem.get_parameters()
-        par = SimpleNamespace(**parameters)
-
-        try:
-
-            def f(x):
-                try:
-                    x = float(x[0])
-                except:
-                    x = float(x)
-                return (
-                    2
-                    * log2(
-                        (binom(par.p, par.p // 2) * binom(k // 2 - par.p, par.p1 - par.p // 2))
-                        * (binom_sp(x, par.w1 // 2) * binom_sp(x - par.w1, par.w11 - par.w1 // 2))
-                        + 1
-                    )
-                    - 2 * x
-                )
-
-            l1_val = int(
-                root(
-                    f,
-                    2 * log2((binom(par.p, par.p // 2) * binom(k // 2 - par.p, par.p1 - par.p // 2))),method='hybr'
-                ).x[0]
-            )
-        except ValueError:
-            return -1
+        """Tries to find an l1 value fulfilling the constraints.
 
-        if f(l1_val) < 0 or f(l1_val) > 10:
-            return -1
-        return l1_val
+        The root only depends on k, `p`, `p1`, `w1` and `w11`, so it is shared with all estimators of codes of the
+        same dimension.
+        """
+        _, k, _ = self.problem.get_parameters()
+        return _first_constraint(k, parameters["p"], parameters["p1"], parameters["w1"], parameters["w11"])
 
     def _choose_second_constraint_such_that_list_size_remains_constant(self, parameters: dict, list_size: float):
-        """Tries to find an L2 value which does not increase the list size."""
-        par = SimpleNamespace(**parameters)
-
-        try:
-
-            def f(x):
-                try:
-                    x = float(x[0])
-                except:
-                    x = float(x)
-                return log2(list_size) + 2 * log2(binom_sp(x, par.w2) + 1) - 2 * x
+        """Tries to find an L2 value which does not increase the list size.
 
-            l2_val = int(root(f, log2(list_size)/2,method='hybr').x[0])
-        except ValueError:
-            return -1
-
-        if f(l2_val) < 0 or f(l2_val) > 10:
-            return -1
-
-        return l2_val
+        The root only depends on `list_size` and `w2`, so it is shared with all estimators.
+        """
+        return _second_constraint(list_size, parameters["w2"])
 
     def _time_and_memory_complexity(self, parameters: dict, verbose_information=None):
         """Computes the expected runtime and memory consumption for a given parameter set."""
@@ -268,6 +284,20 @@ class BJMMdw(SDAlgorithm):
         l1_search_radius = self._adjust_radius
         l2_search_radius = max(1, self._adjust_radius // 2)
 
+        Tg = _gaussian_elimination_complexity(n, k, par.r)
+        k1 = k // 2
+        L1 = binom(k1, par.p1)
+        if self._is_early_abort_possible(log2(L1)):
+            return inf, inf
+
+        log2_all_errors = log2(binom(n, w))
+        log2_first_block = 2 * log2(binom(k1, par.p))
+
+        # the remaining weight distributes over at most n - k positions and the first level merges at least 2 * L1 elements
+        Tp_lower_bound = max(log2_all_errors - log2(binom(n - k, w - 2 * par.p)) - log2_first_block - solutions, 0)
+        if self._is_early_abort_possible(Tp_lower_bound + log2(Tg + 2 * L1)):
+            return inf, inf
+
         l1_start_value = self._choose_first_constraint_such_that_representations_cancel_out_exactly(parameters)
         if l1_start_value == -1:
             return inf, inf
@@ -279,15 +309,21 @@ class BJMMdw(SDAlgorithm):
             if 2 * l1 >= n - k or n - k - 2 * l1 < w:
                 continue
 
-            k1 = k // 2
+            log2_first_constraint = 2 * log2(binom(l1, par.w1))
+            # any l2 distributes the remaining weight over at most n - k - 2 * l1 positions
+            if self._is_early_abort_possible(
+                    max(log2_all_errors
+                        - log2(binom(n - k - 2 * l1, w - 2 * par.p - 2 * par.w1))
+                        - log2_first_block
+                        - log2_first_constraint
+                        - solutions, 0) + log2(Tg + 2 * L1)):
+                continue
+
             reps = (binom(par.p, par.p // 2) * binom(k1 - par.p, par.p1 - par.p // 2)) ** 2 * (
                 binom(par.w1, par.w1 // 2) * binom(l1 - par.w1, par.w11 - par.w1 // 2)
             ) ** 2
             reps = max(reps, 1)
 
-            L1 = binom(k1, par.p1)
-            if self._is_early_abort_possible(log2(L1)):
-                return inf, inf
             L12 = L1**2 * binom(l1, par.w11) ** 2 // 2 ** (2 * l1)
             L12 = max(L12, 1)
             memory = log2((2 * L1 + L12) + _mem_matrix(n, k, par.r))
@@ -298,33 +334,48 @@ class BJMMdw(SDAlgorithm):
             if l2_start_value == -1:
                 continue
 
+            first_level_nn = 2 * _mitm_nn_complexity(L1, 2 * l1, 2 * par.w11, self._hmap)
+            T_rep = int(ceil(2 ** max(2 * l1 - log2(reps), 0)))
+
             l2_max = (n - k - 2 * l1 - (w - 2 * par.p - 2 * par.w1 - 2 * par.w2)) // 2
             l2_min = par.w2
             l2_range = [
                 l2_start_value - l2_search_radius,
                 l2_start_value + l2_search_radius,
             ]
-            for l2 in range(max(l2_min, l2_range[0]), max(1, min(l2_max, l2_range[1]))):
+            l2_lower, l2_upper = max(l2_min, l2_range[0]), max(1, min(l2_max, l2_range[1]))
+            if l2_lower >= l2_upper:
+                continue
+
+            # bounding both l2 dependent binomials by their extremes lower bounds the time of every l2
+            Tp_lower_bound = max(
+                log2_all_errors
+                - log2(binom(n - k - 2 * l1, w - 2 * par.p - 2 * par.w1 - 2 * par.w2))
+                - log2_first_block
+                - log2_first_constraint
+                - 2 * log2(binom(l2_upper - 1, par.w2))
+                - solutions,
+                0,
+            )
+            if self._is_early_abort_possible(Tp_lower_bound + log2(Tg + T_rep * first_level_nn)):
+                continue
+
+            for l2 in range(l2_lower, l2_upper):
                 Tp = max(
-                    log2(binom(n, w))
+                    log2_all_errors
                     - log2(
                         binom(
                             n - k - 2 * l1 - 2 * l2,
                             w - 2 * par.p - 2 * par.w1 - 2 * par.w2,
                         )
                     )
-                    - 2 * log2(binom(k1, par.p))
-                    - 2 * log2(binom(l1, par.w1))
+                    - log2_first_block
+                    - log2_first_constraint
                     - 2 * log2(binom(l2, par.w2))
                     - solutions,
                     0,
                 )
-                Tg = _gaussian_elimination_complexity(n, k, par.r)
-
-                T_tree = 2 * _mitm_nn_complexity(L1, 2 * l1, 2 * par.w11, self._hmap) + _mitm_nn_complexity(
-                    L12, 2 * l2, 2 * par.w2, self._hmap
-                )
-                T_rep = int(ceil(2 ** max(2 * l1 - log2(reps), 0)))
+                T_tree = first_level_nn + _mitm_nn_complexity(L12, 2 * l2, 2 * par.w2, self._hmap)
 
                 time = Tp + log2(Tg + T_rep * T_tree)
 
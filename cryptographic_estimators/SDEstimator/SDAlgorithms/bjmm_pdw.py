@@ -26,14 +26,14 @@ from ...SDEstimator.sd_helper import (
     _mem_matrix,
     _list_merge_complexity,
     _mitm_nn_complexity,
+    _log2_binomial,
+    _largest_integer_with_nonnegative_value,
     binom,
     log2,
     ceil,
     inf,
     min_max,
 )
-from scipy.special import binom as binom_sp
-from scipy.optimize import fsolve
 from warnings import filterwarnings
 from types import SimpleNamespace
 from ..sd_constants import *
@@ -155,22 +155,13 @@ class BJMMpdw(SDAlgorithm):
         """Tries to find an optimal l1 value fulfilling its constraints."""
         _, k, _ = self.problem.get_parameters()
         par = SimpleNamespace(**parameters)
+        log2_reps_first_part = _log2_binomial(par.p, par.p // 2)
 
-        try:
+        def f(x):
+            return 2 * (log2_reps_first_part + _log2_binomial((k + x) / 2 - par.p, par.p1 - par.p // 2)) - x
 
-            def f(x):
-                try:
-                    x = float(x[0])
-                except:
-                    x = float(x)
-
-                return log2((binom(par.p, par.p // 2) * binom_sp((k + x) / 2 - par.p, par.p1 - par.p // 2))) * 2 - x
-
-            l1_val = int(fsolve(f, 0)[0])
-
-            if f(l1_val) < 0 or f(l1_val) > 1:
-                return -1
-        except ValueError:
+        l1_val = _largest_integer_with_nonnegative_value(f)
+        if l1_val == -1 or f(l1_val) > 1:
             return -1
 
         return l1_val
@@ -178,20 +169,13 @@ class BJMMpdw(SDAlgorithm):
     def _choose_second_constraint_such_that_list_size_remains_constant(self, parameters: dict, list_size: float):
         """Tries to find an optimal l2 value fulfilling its constraints."""
         par = SimpleNamespace(**parameters)
+        log2_list_size = log2(list_size)
 
-        try:
-
-            def f(x):
-                try:
-                    x = float(x[0])
-                except:
-                    x = float(x)
-                return log2(list_size) + 2 * log2(binom_sp(x, par.w2)) - 2 * x
+        def f(x):
+            return log2_list_size + 2 * _log2_binomial(x, par.w2) - 2 * x
 
-            l2_val = int(fsolve(f, 0)[0])
-            if f(l2_val) < 0 or f(l2_val) > 1:
-                return -1
-        except ValueError:
+        l2_val = _largest_integer_with_nonnegative_value(f)
+        if l2_val == -1 or f(l2_val) > 1:
             return -1
 
         return l2_val
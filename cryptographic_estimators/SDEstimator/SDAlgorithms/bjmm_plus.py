@@ -67,6 +67,7 @@ class BJMMplus(SDAlgorithm):
         self.initialize_parameter_ranges()
         self.limit_depth = kwargs.get("limit_depth", False)
         self.qc = False
+        self._permutation_complexities = {}
 
     def initialize_parameter_ranges(self):
         """Initialize the parameter ranges for p, p1, and l to start the optimization
@@ -141,14 +142,14 @@ class BJMMplus(SDAlgorithm):
             bool: True if the parameter set is invalid, False otherwise.
         """
         n, k, w = self.problem.get_parameters()
-        par = SimpleNamespace(**parameters)
-        k1 = (k + par.l) // 2
-        if par.p > w // 2 or \
-            k1 < par.p or \
-            par.l >= n - k or\
-            n - k - par.l < w - 2 * par.p or \
-            k1 - par.p < par.p1 - par.p / 2 or \
-            par.p1 < par.p / 2:
+        p, p1, l = parameters["p"], parameters["p1"], parameters["l"]
+        k1 = (k + l) // 2
+        if p > w // 2 or \
+            k1 < p or \
+            l >= n - k or\
+            n - k - l < w - 2 * p or \
+            k1 - p < p1 - p / 2 or \
+            p1 < p / 2:
             return True
         return False
 
@@ -157,11 +158,26 @@ class BJMMplus(SDAlgorithm):
         new_ranges = self._fix_ranges_for_already_set_parameters()
 
         n, k, w = self.problem.get_parameters()
+        Tg = _gaussian_elimination_complexity(n, k, self._optimal_parameters["r"])
 
         for p in range(new_ranges["p"]["min"], min(w // 2, new_ranges["p"]["max"]) + 1, 2):
             for l in range(new_ranges["l"]["min"], min(n - k - (w - 2 * p), new_ranges["l"]["max"]) + 1):
+                # permutations and Gaussian elimination lower bound the time of every (p1, l1) for this (p, l)
+                if (k + l) // 2 < p or n - k - l < w - 2 * p + self.qc:
+                    Tp = 0
+                else:
+                    Tp = self._permutation_complexity(p, l)
+                if self._is_early_abort_possible(Tp + log2(Tg)):
+                    continue
                 for p1 in range(max(new_ranges["p1"]["min"], (p + 1) // 2), min((k + l) // 2,new_ranges["p1"]["max"] + 1)):
+                    # validity and the early abort bounds do not depend on l1, check them once for the whole l1 range,
+                    # every iteration of the tree enumerates at least one base list
+                    if self._are_parameters_invalid({"p": p, "p1": p1, "l": l}):
+                        continue
                     L1 = log2(binom((k + l) // 2, p1))
+                    if self._is_early_abort_possible(L1) or \
+                            self._is_early_abort_possible(Tp + log2(Tg + binom((k + l) // 2, p1))):
+                        continue
                     d1 = self._adjust_radius
                     lower = new_ranges["l1"]["min"] if new_ranges["l1"]["min"] == new_ranges["l1"]["max"] else max(
                         int(L1) - d1, 0)
@@ -169,11 +185,28 @@ class BJMMplus(SDAlgorithm):
                         int(L1) + d1, 0)
 
                     for l1 in range(lower, upper):
-                        indices = {"p": p, "p1": p1, "l": l, "l1": l1,
-                                   "r": self._optimal_parameters["r"]}
-                        if self._are_parameters_invalid(indices):
-                            continue
-                        yield indices
+                        yield {"p": p, "p1": p1, "l": l, "l1": l1, "r": self._optimal_parameters["r"]}
+
+    def _permutation_complexity(self, p: int, l: int):
+        """Returns the logarithm of the expected number of permutations for the given `p` and `l`."""
+        if (p, l) not in self._permutation_complexities:
+            self._permutation_complexities[(p, l)] = self._compute_permutation_complexity(p, l)
+        return self._permutation_complexities[(p, l)]
+
+    def _compute_permutation_complexity(self, p: int, l: int):
+        """Computes the value memoized by `_permutation_complexity`."""
+        n, k, w = self.problem.get_parameters()
+        k1 = (k + l) // 2
+        qc_advantage = log2(k) if self.qc else 0
+        return max(
+            log2(binom(n, w))
+            - log2(binom(n - k - l, w - 2 * p + self.qc))
+            - log2(binom(k1, p))
+            - log2(binom(k1, p - self.qc))
+            - qc_advantage
+            - self.problem.nsolutions,
+            0,
+        )
 
     def _time_and_memory_complexity(self, parameters: dict, verbose_information=None):
         """Computes the expected runtime and memory consumption for the depth 2 version."""
@@ -184,8 +217,6 @@ class BJMMplus(SDAlgorithm):
         if self._are_parameters_invalid(parameters):
             return inf, inf
 
-        solutions = self.problem.nsolutions
-
         L1 = binom(k1, par.p1)
         if self._is_early_abort_possible(log2(L1)):
             return inf, inf
@@ -204,10 +235,8 @@ class BJMMplus(SDAlgorithm):
 
         L12 = max(1, L1**2 // 2**par.l1)
 
-        qc_advantage = 0
         if self.qc:
             L12b = max(1, L1 * L1b // 2**par.l1)
-            qc_advantage = log2(k)
 
         memory = (
             log2((2 * L1 + L12) + _mem_matrix(n, k, par.r))
@@ -217,15 +246,7 @@ class BJMMplus(SDAlgorithm):
         if self._is_early_abort_possible(memory):
             return inf, inf
 
-        Tp = max(
-            log2(binom(n, w))
-            - log2(binom(n - k - par.l, w - 2 * par.p + self.qc))
-            - log2(binom(k1, par.p))
-            - log2(binom(k1, par.p - self.qc))
-            - qc_advantage
-            - solutions,
-            0,
-        )
+        Tp = self._permutation_complexity(par.p, par.l)
 
         Tg = _gaussian_elimination_complexity(n, k, par.r)
         if not self.qc:
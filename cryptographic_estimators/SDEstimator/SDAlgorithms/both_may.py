@@ -59,6 +59,7 @@ class BothMay(SDAlgorithm):
         """
         super(BothMay, self).__init__(problem, **kwargs)
         self._name = "Both-May"
+        self._permutation_complexities = {}
         self.initialize_parameter_ranges()
         self.scipy_model = BothMayScipyModel
 
@@ -145,11 +146,11 @@ class BothMay(SDAlgorithm):
             bool: True if the parameter set is invalid, False otherwise.
         """
         n, k, w = self.problem.get_parameters()
-        par = SimpleNamespace(**parameters)
+        p, p1, w1, w2, l = parameters["p"], parameters["p1"], parameters["w1"], parameters["w2"], parameters["l"]
         k1 = k // 2
-        if par.p > w // 2 or k1 < par.p or par.w1 >= min(w, par.l + 1) \
-                or par.w2 > min(w - 2 * par.p, par.l, 2 * par.w1) or par.p1 < (par.p + 1) // 2 or par.p1 > w \
-                or n - k - par.l < w - par.w2 - 2 * par.p or par.p1 > k1:
+        if p > w // 2 or k1 < p or w1 >= min(w, l + 1) \
+                or w2 > min(w - 2 * p, l, 2 * w1) or p1 < (p + 1) // 2 or p1 > w \
+                or n - k - l < w - w2 - 2 * p or p1 > k1:
             return True
         return False
 
@@ -157,6 +158,7 @@ class BothMay(SDAlgorithm):
         """Generator which yields on each call a new set of valid parameters based on the `_parameter_ranges` and already set parameters in `_optimal_parameters`."""
         new_ranges = self._fix_ranges_for_already_set_parameters()
         n, k, w = self.problem.get_parameters()
+        Tg = _gaussian_elimination_complexity(n, k, self._optimal_parameters["r"])
 
         for p in range(new_ranges["p"]["min"], min(w // 2, new_ranges["p"]["max"]) + 1, 2):
             for l in range(
@@ -165,10 +167,23 @@ class BothMay(SDAlgorithm):
             ):
                 for w1 in range(new_ranges["w1"]["min"], new_ranges["w1"]["max"] + 1):
                     for w2 in range(new_ranges["w2"]["min"], new_ranges["w2"]["max"] + 1, 2):
+                        # permutations and Gaussian elimination lower bound the time of every p1 for this (p, l, w2)
+                        if k // 2 < p or l < w2 or not 0 <= w - w2 - 2 * p <= n - k - l:
+                            Tp = 0
+                        else:
+                            Tp = self._permutation_complexity(p, l, w2)
+                        if self._is_early_abort_possible(Tp + log2(Tg)):
+                            continue
                         for p1 in range(
                             max(new_ranges["p1"]["min"], (p + 1) // 2),
                             new_ranges["p1"]["max"] + 1,
                         ):
+                            # every iteration of the tree enumerates at least one base list
+                            if p1 <= k // 2 and (
+                                self._is_early_abort_possible(log2(binom(k // 2, p1)))
+                                or self._is_early_abort_possible(Tp + log2(Tg + binom(k // 2, p1)))
+                            ):
+                                continue
                             indices = {
                                 "p": p,
                                 "w1": w1,
@@ -181,13 +196,30 @@ class BothMay(SDAlgorithm):
                                 continue
                             yield indices
 
+    def _permutation_complexity(self, p: int, l: int, w2: int):
+        """Returns the logarithm of the expected number of permutations for the given `p`, `l` and `w2`."""
+        if (p, l, w2) not in self._permutation_complexities:
+            self._permutation_complexities[(p, l, w2)] = self._compute_permutation_complexity(p, l, w2)
+        return self._permutation_complexities[(p, l, w2)]
+
+    def _compute_permutation_complexity(self, p: int, l: int, w2: int):
+        """Computes the value memoized by `_permutation_complexity`."""
+        n, k, w = self.problem.get_parameters()
+        return max(
+            log2(binom(n, w))
+            - log2(binom(n - k - l, w - w2 - 2 * p))
+            - 2 * log2(binom(k // 2, p))
+            - log2(binom(l, w2))
+            - self.problem.nsolutions,
+            0,
+        )
+
     def _time_and_memory_complexity(self, parameters: dict, verbose_information=None):
         """Computes the expected runtime and memory consumption for a given parameter set."""
         n, k, w = self.problem.get_parameters()
         par = SimpleNamespace(**parameters)
         k1 = k // 2
 
-        solutions = self.problem.nsolutions
         memory_bound = self.problem.memory_bound
 
         reps = (
@@ -207,14 +239,7 @@ class BothMay(SDAlgorithm):
         if memory > memory_bound:
             return inf, inf
 
-        Tp = max(
-            log2(binom(n, w))
-            - log2(binom(n - k - par.l, w - par.w2 - 2 * par.p))
-            - 2 * log2(binom(k1, par.p))
-            - log2(binom(par.l, par.w2))
-            - solutions,
-            0,
-        )
+        Tp = self._permutation_complexity(par.p, par.l, par.w2)
         Tg = _gaussian_elimination_complexity(n, k, par.r)
 
         first_level_nn = _indyk_motwani_complexity(L1, par.l, par.w1, self._hmap)
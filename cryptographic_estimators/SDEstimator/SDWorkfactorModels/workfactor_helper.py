@@ -19,25 +19,80 @@
 
 
 from random import uniform as ru
-from math import log2
-from scipy.optimize import fsolve
+from bisect import bisect_left
+from math import log2, sqrt as sqrt_
+from numpy import clip, concatenate, errstate, geomspace, interp, linspace, log2 as np_log2, nan_to_num, ndarray, pi, \
+    sin, sqrt, unique, where
 
 
-def inverse_binary_entropy(v: float):
+def _inverse_binary_entropy_table(size: int):
+    """Returns sqrt(1 - H(x)) and x for a grid of points x in [0, 1/2], both in increasing order of sqrt(1 - H(x)).
+
+    In terms of sqrt(1 - H(x)) the inverse binary entropy is well-behaved close to 1/2, while a geometric part of the
+    grid resolves the steep region close to zero.
+    """
+    x = unique(concatenate([[0.], geomspace(1e-12, 1e-2, size // 4), 0.5 * sin(linspace(0, pi / 2, size)) ** 2]))[::-1]
+    with errstate(divide="ignore", invalid="ignore"):
+        h = nan_to_num(-x * np_log2(x) - (1 - x) * np_log2(1 - x))
+    return sqrt(clip(1 - h, 0, 1)), x
+
+
+_INVERSE_BINARY_ENTROPY_S, _INVERSE_BINARY_ENTROPY_X = _inverse_binary_entropy_table(2 ** 10)
+_INVERSE_BINARY_ENTROPY_S_LIST = _INVERSE_BINARY_ENTROPY_S.tolist()
+_INVERSE_BINARY_ENTROPY_X_LIST = _INVERSE_BINARY_ENTROPY_X.tolist()
+
+
+def _scalar_inverse_binary_entropy(v: float):
+    s = sqrt_(1 - v)
+    i = min(max(bisect_left(_INVERSE_BINARY_ENTROPY_S_LIST, s), 1), len(_INVERSE_BINARY_ENTROPY_S_LIST) - 1)
+    s0, s1 = _INVERSE_BINARY_ENTROPY_S_LIST[i - 1], _INVERSE_BINARY_ENTROPY_S_LIST[i]
+    x0, x1 = _INVERSE_BINARY_ENTROPY_X_LIST[i - 1], _INVERSE_BINARY_ENTROPY_X_LIST[i]
+    x = x0 + (x1 - x0) * (s - s0) / (s1 - s0)
+    for _ in range(2):
+        if not 0 < x < 0.5:
+            break
+        x -= (-x * log2(x) - (1 - x) * log2(1 - x) - v) / log2((1 - x) / x)
+    return min(max(x, 0.), 0.5)
+
+
+def inverse_binary_entropy(v):
     """Compute the inverse binary entropy function.
 
+    The value is interpolated from a precomputed table and refined by two Newton iterations. Accepts scalars as well as
+    NumPy arrays.
+
     Args:
         v (float): The value for which the inverse binary entropy function should be computed.
 
     Returns:
         float: The unique value of x in the range [0, ..., 1/2] such that H^{-1}(x) = v.
-    """
-    if v == 1:
-        return 0.5
-    if v < 0.00001:
-        return 0
 
-    return fsolve(lambda x: v - (-x[0] * log2(x[0]) - (1 - x[0]) * log2(1 - x[0])), 0.0000001)[0]
+    Examples:
+        >>> from cryptographic_estimators.SDEstimator.SDWorkfactorModels.workfactor_helper import inverse_binary_entropy
+        >>> round(inverse_binary_entropy(0.5), 10)
+        0.1100278644
+        >>> inverse_binary_entropy(1)
+        0.5
+
+    Tests:
+        >>> from numpy import array
+        >>> inverse_binary_entropy(array([0.5, 1, 0]))
+        array([0.11002786, 0.5       , 0.        ])
+    """
+    if not isinstance(v, ndarray):
+        if v >= 1:
+            return 0.5
+        if v < 0.00001:
+            return 0
+        return _scalar_inverse_binary_entropy(v)
+
+    x = interp(sqrt(clip(1 - v, 0, 1)), _INVERSE_BINARY_ENTROPY_S, _INVERSE_BINARY_ENTROPY_X)
+    with errstate(divide="ignore", invalid="ignore"):
+        for _ in range(2):
+            x = clip(x, 1e-300, 0.5)
+            h = -x * np_log2(x) - (1 - x) * np_log2(1 - x)
+            x = where(x < 0.5, x - (h - v) / np_log2((1 - x) / x), x)
+    return where(v >= 1, 0.5, where(v < 0.00001, 0, clip(x, 0, 0.5)))
 
 
 def binary_entropy(c: float):
@@ -88,13 +88,13 @@ class SDAlgorithm(BaseAlgorithm):
                 tmp_time, tmp_memory = self._time_and_memory_complexity(params)
 
                 if self.bit_complexities:
-                    tmp_memory = self.problem.to_bitcomplexity_memory(tmp_memory)
+                    tmp_memory = self._to_bitcomplexity_memory(tmp_memory)
 
                 tmp_time += self.memory_access_cost(tmp_memory)
 
                 if tmp_time < time and tmp_memory < self.problem.memory_bound:
                     time, memory = tmp_time, tmp_memory
-                    self._current_minimum_for_early_abort = tmp_time
+                    self._current_minimum_for_early_abort = min(tmp_time, self._current_minimum_for_early_abort)
 
                     for i in params:
                         self._optimal_parameters[i] = params[i]
@@ -24,6 +24,18 @@ SD_CODE_LENGTH = "code length"
 SD_CODE_DIMENSION = "code dimension"
 SD_ERROR_WEIGHT = "error weight"
 
+# Maximum number of BJMM-dw constraint roots kept alive by the process-wide caches, shared by all estimators.
+SD_CONSTRAINT_CACHE_SIZE = 65536
+
+# Maximum number of exact binomial coefficients kept alive by the process-wide cache of sd_helper.binom.
+SD_BINOMIAL_CACHE_SIZE = 65536
+
+# Maximum number of real-valued log2 binomial coefficients kept alive by the process-wide cache of sd_helper.
+SD_LOG2_BINOMIAL_CACHE_SIZE = 16384
+
+# Maximum number of Gaussian elimination costs and of M4RI block sizes kept alive by the process-wide caches of sd_helper.
+SD_GAUSSIAN_ELIMINATION_CACHE_SIZE = 4096
+
 
 class VerboseInformation(Enum):
     CONSTRAINTS = "constraints"
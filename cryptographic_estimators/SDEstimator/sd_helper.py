@@ -18,9 +18,12 @@
 # ****************************************************************************
 
 
-from math import log2, comb, inf, ceil
+from functools import lru_cache
+from math import log2, comb, inf, ceil, lgamma, log
+from .sd_constants import SD_BINOMIAL_CACHE_SIZE, SD_LOG2_BINOMIAL_CACHE_SIZE, SD_GAUSSIAN_ELIMINATION_CACHE_SIZE
 
 
+@lru_cache(maxsize=SD_BINOMIAL_CACHE_SIZE)
 def binom(n: int, k: int):
     """Compute the binomial coefficient.
 
@@ -35,6 +38,63 @@ def binom(n: int, k: int):
     return comb(int(n), int(k))
 
 
+@lru_cache(maxsize=SD_LOG2_BINOMIAL_CACHE_SIZE)
+def _log2_binomial(n: float, k: float) -> float:
+    """Compute the logarithm (base 2) of the binomial coefficient for real-valued arguments.
+
+    Args:
+        n (float): The total number of items.
+        k (float): The number of items to be selected.
+
+    Returns:
+        float: log2 of Gamma(n + 1) / (Gamma(k + 1) * Gamma(n - k + 1)), exact for integer arguments, or -inf if k < 0
+        or k > n.
+
+    Examples:
+        >>> from cryptographic_estimators.SDEstimator.sd_helper import _log2_binomial
+        >>> _log2_binomial(10, 5) == log2(252)
+        True
+        >>> _log2_binomial(4, 5)
+        -inf
+    """
+    if k < 0 or k > n:
+        return -inf
+    if n == int(n) and k == int(k):
+        return log2(comb(int(n), int(k)))
+    return (lgamma(n + 1) - lgamma(k + 1) - lgamma(n - k + 1)) / log(2)
+
+
+def _largest_integer_with_nonnegative_value(f) -> int:
+    """Find the largest integer x >= 0 with f(x) >= 0 via bisection, for a function f that is non-increasing on the
+    non-negative integers and eventually negative.
+
+    Args:
+        f: A function mapping integers to floats.
+
+    Returns:
+        int: The largest integer x >= 0 with f(x) >= 0, or -1 if f(0) < 0.
+
+    Examples:
+        >>> from cryptographic_estimators.SDEstimator.sd_helper import _largest_integer_with_nonnegative_value
+        >>> _largest_integer_with_nonnegative_value(lambda x: 100.5 - x)
+        100
+        >>> _largest_integer_with_nonnegative_value(lambda x: -1 - x)
+        -1
+    """
+    if not f(0) >= 0:
+        return -1
+    lower, upper = 0, 1
+    while f(upper) >= 0:
+        lower, upper = upper, 2 * upper
+    while upper - lower > 1:
+        middle = (lower + upper) // 2
+        if f(middle) >= 0:
+            lower = middle
+        else:
+            upper = middle
+    return lower
+
+
 def min_max(a: int, b: int, s: bool) -> int:
     """Returns the minimum or maximum of two integers based on a boolean switch.
 
@@ -86,6 +146,7 @@ def __round_or_truncate_to_given_precision(T: float, M: float, truncate: bool, p
     return "{:.{p}f}".format(T, p=precision), "{:.{p}f}".format(M, p=precision)
 
 
+@lru_cache(maxsize=SD_GAUSSIAN_ELIMINATION_CACHE_SIZE)
 def _gaussian_elimination_complexity(n: int, k: int, r: int):
     """Compute the complexity estimate of the Gaussian elimination routine. [Bar07]_ [BLP08]_
 
@@ -108,6 +169,7 @@ def _gaussian_elimination_complexity(n: int, k: int, r: int):
     return (n - k) ** 2
 
 
+@lru_cache(maxsize=SD_GAUSSIAN_ELIMINATION_CACHE_SIZE)
 def _optimize_m4ri(n: int, k: int, mem=float("inf")):
     """Finds the optimal blocksize for Gaussian elimination via M4RI.
 
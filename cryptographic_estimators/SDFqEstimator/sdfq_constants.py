@@ -25,6 +25,9 @@ SDFQ_CODE_DIMENSION = "code dimension"
 SDFQ_ERROR_WEIGHT = "error weight"
 SDFQ_ERROR_FIELD_SIZE = "field size"
 
+# Maximum number of sub-estimates kept alive by the process-wide cache used by estimators calling SDFqEstimator.
+SDFQ_SUB_ESTIMATE_CACHE_SIZE = 4096
+
 
 class VerboseInformation(Enum):
     CONSTRAINTS = "constraints"
@@ -19,7 +19,10 @@
 
 from ..SDFqEstimator.sdfq_algorithm import SDFqAlgorithm
 from ..SDFqEstimator.sdfq_problem import SDFqProblem
+from ..SDFqEstimator.sdfq_constants import SDFQ_SUB_ESTIMATE_CACHE_SIZE
 from ..base_estimator import BaseEstimator
+from collections import namedtuple
+from functools import lru_cache
 from math import inf
 
 
@@ -88,3 +91,55 @@ class SDFqEstimator(BaseEstimator):
                                          show_all_parameters=show_all_parameters,
                                          precision=precision, truncate=truncate,
                                          *args, **kwargs)
+
+
+SDFqSubEstimate = namedtuple("SDFqSubEstimate", ["time", "memory", "parameters", "algorithm"])
+
+
+def sdfq_sub_estimate(n: int, k: int, w: int, q: int, nsolutions=0, memory_bound=inf, **sd_parameters):
+    """Return the estimate of the fastest SDFq algorithm for the given instance, as used by other estimators.
+
+    Estimators solving syndrome decoding instances as a subroutine query many identical instances. The results are
+    shared through a bounded process-wide cache keyed by the instance and by `sd_parameters`. Bit complexities are
+    disabled, as for every such subroutine.
+
+    Args:
+        n (int): Code length.
+        k (int): Code dimension.
+        w (int): Error weight.
+        q (int): Base field size.
+        nsolutions (float, optional): Number of solutions (logarithmic). Defaults to 0.
+        memory_bound (float, optional): Memory bound. Defaults to inf.
+        **sd_parameters: Additional keyword arguments for SDFqEstimator.
+
+    Returns:
+        SDFqSubEstimate: Time and memory complexity, optimal parameters and name of the fastest algorithm.
+
+    Examples:
+        >>> from cryptographic_estimators.SDFqEstimator.sdfq_estimator import sdfq_sub_estimate
+        >>> sdfq_sub_estimate(100, 50, 10, 5)
+        SDFqSubEstimate(time=23.037015151282212, memory=22.6811242895483, parameters={'p': 2, 'l': 7}, algorithm='Stern')
+    """
+    try:
+        key = tuple(sorted((name, tuple(value) if isinstance(value, list) else value)
+                           for name, value in sd_parameters.items()))
+        hash(key)
+    except TypeError:
+        return _sdfq_sub_estimate(n, k, w, q, nsolutions, memory_bound, sd_parameters)
+
+    estimate = _cached_sdfq_sub_estimate(n, k, w, q, nsolutions, memory_bound, key)
+    return estimate._replace(parameters=dict(estimate.parameters))
+
+
+@lru_cache(maxsize=SDFQ_SUB_ESTIMATE_CACHE_SIZE)
+def _cached_sdfq_sub_estimate(n: int, k: int, w: int, q: int, nsolutions, memory_bound, sd_parameters: tuple):
+    sd_parameters = {name: list(value) if isinstance(value, tuple) else value for name, value in sd_parameters}
+    return _sdfq_sub_estimate(n, k, w, q, nsolutions, memory_bound, sd_parameters)
+
+
+def _sdfq_sub_estimate(n: int, k: int, w: int, q: int, nsolutions, memory_bound, sd_parameters: dict):
+    estimator = SDFqEstimator(n=n, k=k, w=w, q=q, bit_complexities=0, nsolutions=nsolutions,
+                              memory_bound=memory_bound, **sd_parameters)
+    algorithm = estimator.fastest_algorithm()
+    return SDFqSubEstimate(algorithm.time_complexity(), algorithm.memory_complexity(),
+                           dict(algorithm.optimal_parameters()), algorithm.__class__.__name__)
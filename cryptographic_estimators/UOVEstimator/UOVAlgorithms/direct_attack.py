@@ -20,7 +20,7 @@
 
 from ..uov_algorithm import UOVAlgorithm
 from ..uov_problem import UOVProblem
-from ...MQEstimator.mq_estimator import MQEstimator
+from ...MQEstimator.mq_estimator import fastest_mq_algorithm
 from ...MQEstimator.MQAlgorithms.lokshtanov import Lokshtanov
 from ...base_constants import BASE_EXCLUDED_ALGORITHMS
 from cryptographic_estimators.base_constants import BASE_FORGERY_ATTACK
@@ -46,25 +46,36 @@ class DirectAttack(UOVAlgorithm):
         super(DirectAttack, self).__init__(problem, **kwargs)
 
         self._name = "DirectAttack"
-        n, m, q = self.problem.get_parameters()
-
-        w = self.linear_algebra_constant()
-        h = self._h
-        excluded_algorithms = kwargs.get(BASE_EXCLUDED_ALGORITHMS, [Lokshtanov])
-        complexity_type = self.complexity_type
-        self._MQEstimator = MQEstimator(n=n, m=m, q=q,
-                                        w=w,
-                                        h=h,
-                                        excluded_algorithms=excluded_algorithms,
-                                        memory_access=0,
-                                        complexity_type=complexity_type,
-                                        bit_complexities=0)
+        self._excluded_algorithms = kwargs.get(BASE_EXCLUDED_ALGORITHMS, [Lokshtanov])
+        self._mq_complexity_type = self.complexity_type
         self._fastest_algorithm = None
         self._attack_type = BASE_FORGERY_ATTACK
 
     def get_fastest_mq_algorithm(self):
+        """Return the fastest algorithm solving the MQ instance of the public key.
+
+        The estimate is shared with every other direct attack on the same instance, see `fastest_mq_algorithm`, while
+        the returned algorithm is a copy owned by this attack.
+
+        Tests:
+            >>> from cryptographic_estimators.UOVEstimator.UOVAlgorithms.direct_attack import DirectAttack
+            >>> from cryptographic_estimators.UOVEstimator.uov_problem import UOVProblem
+            >>> A = DirectAttack(UOVProblem(n=14, m=12, q=5))
+            >>> B = DirectAttack(UOVProblem(n=14, m=12, q=5), complexity_type=1)
+            >>> A.get_fastest_mq_algorithm() is B.get_fastest_mq_algorithm()
+            False
+            >>> A.time_complexity(), B.time_complexity(), A.time_complexity()
+            (29.92041846257129, 23.609416039920553, 29.92041846257129)
+        """
         if self._fastest_algorithm is None:
-            self._fastest_algorithm = self._MQEstimator.fastest_algorithm()
+            n, m, q = self.problem.get_parameters()
+            self._fastest_algorithm = fastest_mq_algorithm(n, m, q,
+                                                           w=self.linear_algebra_constant(),
+                                                           h=self._h,
+                                                           excluded_algorithms=self._excluded_algorithms,
+                                                           memory_access=0,
+                                                           complexity_type=self._mq_complexity_type,
+                                                           bit_complexities=0)
         return self._fastest_algorithm
 
     def _compute_time_complexity(self, parameters: dict):
@@ -138,6 +149,4 @@ class DirectAttack(UOVAlgorithm):
     def get_optimal_parameters_dict(self):
         """Returns the optimal parameters dictionary."""
         fastest_algorithm = self.get_fastest_mq_algorithm()
-        d = fastest_algorithm.get_optimal_parameters_dict()
-        d["variant"] = fastest_algorithm._name
-        return d
+        return {**fastest_algorithm.get_optimal_parameters_dict(), "variant": fastest_algorithm._name}
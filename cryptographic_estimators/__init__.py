@@ -2,6 +2,7 @@ from .base_algorithm import BaseAlgorithm
 from .base_estimator import BaseEstimator
 from .base_problem import BaseProblem
 from .helper import ComplexityType, concat_pretty_tables, _truncate, round_or_truncate
+from .scheme_report import scheme_report
 
 from .SDEstimator import *
 from .MQEstimator import *
@@ -25,5 +26,5 @@ from .IFEstimator import *
 # The chosen limit should be sufficient for most use cases, and values
 # below 4000 will raise testing errors.
 MAX_COEFFS = 20000
-from flint import fmpq_series as power_series, ctx
+from flint import fmpz_series as power_series, ctx
 ctx.cap = MAX_COEFFS
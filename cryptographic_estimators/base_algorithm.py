@@ -164,6 +164,14 @@ class BaseAlgorithm:
             return self._memory_access(mem)
         return 0
 
+    def _to_bitcomplexity_time(self, basic_operations: float):
+        """Returns the bit-complexity of `basic_operations` basic operations (logarithmic) of the algorithm."""
+        return self.problem.to_bitcomplexity_time(basic_operations)
+
+    def _to_bitcomplexity_memory(self, elements_to_store: float):
+        """Returns the memory bit-complexity of `elements_to_store` elements (logarithmic) stored by the algorithm."""
+        return self.problem.to_bitcomplexity_memory(elements_to_store)
+
     def _get_verbose_information(self):
         """Returns dictionary with any additional information relevant to this algorithm."""
         return {}
@@ -274,13 +282,13 @@ class BaseAlgorithm:
             tmp_time = self._compute_time_complexity(params)
             tmp_memory = self._compute_memory_complexity(params)
             if self.bit_complexities:
-                tmp_memory = self.problem.to_bitcomplexity_memory(tmp_memory)
+                tmp_memory = self._to_bitcomplexity_memory(tmp_memory)
 
             tmp_time += self.memory_access_cost(tmp_memory)
 
             if tmp_time < time and tmp_memory <= self.problem.memory_bound:
                 time, _ = tmp_time, tmp_memory
-                self._current_minimum_for_early_abort = tmp_time
+                self._current_minimum_for_early_abort = min(tmp_time, self._current_minimum_for_early_abort)
                 for i in params:
                     self._optimal_parameters[i] = params[i]
 
@@ -394,11 +402,11 @@ class BaseAlgorithm:
         """
         temp_time_complexity = self._compute_time_complexity(params)
         if self.bit_complexities:
-            temp_basic_operation_cost = self.problem.to_bitcomplexity_time(
+            temp_basic_operation_cost = self._to_bitcomplexity_time(
                 temp_time_complexity)
 
             if self._memory_access != 0:
-                field_element_bits = self.problem.to_bitcomplexity_memory(0)
+                field_element_bits = self._to_bitcomplexity_memory(0)
                 temp_memory_access_cost = temp_time_complexity + field_element_bits
                 temp_memory_access_cost += self.memory_access_cost(
                     self.memory_complexity())
@@ -464,7 +472,7 @@ class BaseAlgorithm:
         if self._complexity_type == ComplexityType.ESTIMATE.value:
             temp_memory_complexity = self._compute_memory_complexity(params)
             if self.bit_complexities:
-                temp_memory_complexity = self.problem.to_bitcomplexity_memory(
+                temp_memory_complexity = self._to_bitcomplexity_memory(
                     temp_memory_complexity)
         else:
             temp_memory_complexity = self._compute_tilde_o_memory_complexity(
@@ -44,5 +44,6 @@ BASE_ATTACK_TYPE_KEY_RECOVERY = "key-recovery"
 BASE_ATTACK_TYPE_MSG_RECOVERY = "message-recovery"
 BASE_ATTACK_TYPE = "algorithm"
 BASE_ESTIMATOR_TYPE = "problem"
+BASE_ESTIMATOR_ID = "estimator_id"
 BASE_FORGERY_ATTACK = "forgery"
 BASE_KEY_RECOVERY_ATTACK = "key-recovery"
\ No newline at end of file
@@ -0,0 +1,109 @@
+# ****************************************************************************
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+# ****************************************************************************
+
+
+from .base_constants import BASE_ESTIMATOR_ID, BASE_ESTIMATEO, BASE_PARAMETERS
+from .base_estimator import BaseEstimator
+from concurrent.futures import ProcessPoolExecutor
+from importlib import import_module
+
+
+def scheme_report(specs: list, processes=1):
+    """Return the estimates of several estimators, e.g., all those relevant for the security of one scheme.
+
+    Each spec is a dictionary holding the name of an estimator under `estimator_id`, e.g. "UOVEstimator", and the
+    keyword arguments of that estimator. Identical specs are estimated once, and only their estimates are reused as a
+    whole. Specs sharing the number of polynomials and the field size are estimated one after the other in the same
+    process, such that their MQ sub-estimates reuse the same Hilbert series from the process-wide cache of
+    `hilbert_series_family`. With `processes` larger than 1, these groups are distributed over a pool of processes.
+
+    Args:
+        specs (list): List of dictionaries, each including `estimator_id` and the parameters of the estimator.
+        processes (int, optional): Maximum number of processes estimating in parallel. Defaults to 1.
+
+    Returns:
+        list: For each spec, a dictionary including `estimator_id`, the parameters and the estimate of the estimator.
+
+    Examples:
+        >>> from cryptographic_estimators.scheme_report import scheme_report
+        >>> report = scheme_report([{"estimator_id": "UOVEstimator", "n": 24, "m": 10, "q": 2},
+        ...                         {"estimator_id": "MQEstimator", "n": 24, "m": 10, "q": 2, "w": 2}])
+        >>> [entry["estimator_id"] for entry in report]
+        ['UOVEstimator', 'MQEstimator']
+        >>> report[0]["parameters"]
+        {'n': 24, 'm': 10, 'q': 2}
+        >>> round(report[0]["estimate"]["DirectAttack"]["estimate"]["time"], 1)
+        11.2
+
+    Tests:
+        >>> specs = [{"estimator_id": "UOVEstimator", "n": 24, "m": 10, "q": 2},
+        ...          {"estimator_id": "MAYOEstimator", "n": 24, "m": 10, "o": 4, "k": 2, "q": 16},
+        ...          {"estimator_id": "UOVEstimator", "n": 24, "m": 10, "q": 2}]
+        >>> report = scheme_report(specs, processes=2)
+        >>> report[0]["estimate"] == report[2]["estimate"] == scheme_report(specs[:1])[0]["estimate"]
+        True
+        >>> report[1]["estimate"] == scheme_report(specs[1:2])[0]["estimate"]
+        True
+        >>> scheme_report([{"estimator_id": "UnknownEstimator"}])
+        Traceback (most recent call last):
+        ...
+        ValueError: UnknownEstimator is not an estimator
+    """
+    keys = [_spec_key(spec) for spec in specs]
+    groups = {}
+    for key in dict.fromkeys(keys):
+        parameters = dict(key[1])
+        groups.setdefault((parameters.get("m"), parameters.get("q")), []).append(key)
+    groups = list(groups.values())
+
+    if processes > 1 and len(groups) > 1:
+        with ProcessPoolExecutor(max_workers=min(processes, len(groups))) as pool:
+            estimates = [estimate for group in pool.map(_estimate_specs, groups) for estimate in group]
+    else:
+        estimates = [estimate for group in groups for estimate in _estimate_specs(group)]
+    estimates = dict(zip([key for group in groups for key in group], estimates))
+
+    return [{BASE_ESTIMATOR_ID: key[0],
+             BASE_PARAMETERS: {name: value for name, value in spec.items() if name != BASE_ESTIMATOR_ID},
+             BASE_ESTIMATEO: estimates[key]} for spec, key in zip(specs, keys)]
+
+
+def _spec_key(spec: dict):
+    """Return a hashable and picklable representation of `spec`."""
+    estimator_id = spec.get(BASE_ESTIMATOR_ID)
+    _estimator(estimator_id)
+    return estimator_id, tuple(sorted((name, tuple(value) if isinstance(value, list) else value)
+                                      for name, value in spec.items() if name != BASE_ESTIMATOR_ID))
+
+
+def _estimator(estimator_id: str):
+    """Return the estimator class named `estimator_id`."""
+    Estimator = getattr(import_module(__package__), str(estimator_id), None)
+    if not (isinstance(Estimator, type) and issubclass(Estimator, BaseEstimator)) or Estimator is BaseEstimator:
+        raise ValueError(f"{estimator_id} is not an estimator")
+    return Estimator
+
+
+def _estimate_specs(keys: list):
+    """Return the estimates of the specs represented by `keys`, computed one after the other."""
+    estimates = []
+    for estimator_id, parameters in keys:
+        parameters = {name: list(value) if isinstance(value, tuple) else value for name, value in parameters}
+        estimates.append(_estimator(estimator_id)(**parameters).estimate())
+    return estimates
@@ -0,0 +1,51 @@
+"""Generate the tables of degrees of regularity and witness degrees of quadratic systems.
+
+The tables are read (memory-mapped) by `cryptographic_estimators.MQEstimator.degree_tables`, which turns
+`degree_of_regularity.quadratic_system` and `witness_degree.quadratic_system` into lookups inside the tabulated range.
+
+Usage:
+    python3 scripts/generate_mq_degree_tables.py --max-variables 256 --max-polynomials 256 --fields 0 2 3 4 5 7 8 16
+
+A field order of 0 stands for systems over the rationals (q=None).
+"""
+import argparse
+
+from cryptographic_estimators.MQEstimator import degree_of_regularity, witness_degree
+from cryptographic_estimators.MQEstimator.degree_tables import write_degree_table
+from cryptographic_estimators.MQEstimator.mq_constants import MQ_DEGREE_TABLES_DIRECTORY
+
+DEFAULT_FIELDS = [0, 2, 3, 4, 5, 7, 8, 11, 13, 16, 31, 127, 251, 256]
+
+
+def degrees_of_quadratic_systems(function, max_variables: int, max_polynomials: int, q):
+    degrees = {}
+    for m in range(1, max_polynomials + 1):
+        for n in range(min(m, max_variables), 0, -1):
+            try:
+                degrees[n, m] = function(n, [2] * m, q=q)
+            except ValueError:
+                continue
+    return degrees
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--max-variables", type=int, default=256)
+    parser.add_argument("--max-polynomials", type=int, default=256)
+    parser.add_argument("--fields", type=int, nargs="+", default=DEFAULT_FIELDS)
+    parser.add_argument("--output", default=MQ_DEGREE_TABLES_DIRECTORY)
+    args = parser.parse_args()
+
+    for field in args.fields:
+        q = field or None
+        for kind, function in [
+            ("degree_of_regularity", degree_of_regularity.generic_system),
+            ("witness_degree", witness_degree.semi_regular_system),
+        ]:
+            degrees = degrees_of_quadratic_systems(function, args.max_variables, args.max_polynomials, q)
+            file_name = write_degree_table(args.output, kind, q, degrees)
+            print(f"{file_name}: {len(degrees)} entries")
+
+
+if __name__ == "__main__":
+    main()
@@ -18,7 +18,6 @@ let
     pythonPackages.prettytable
     pythonPackages.scipy
     pythonPackages.pytest
-    pythonPackages.sympy
   ];
 in
 let
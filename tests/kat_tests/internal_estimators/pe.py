@@ -24,9 +24,6 @@ def leon2(input, epsilon=0.01):
 def beullens(input, epsilon=0.01):
     n, k, q = input
 
-    complexities = [
-        Beullens(PEProblem(n, k, q), **leon_params).time_complexity() for _ in range(20)
-    ]
-    actual_complexity = min(complexities)
+    actual_complexity = Beullens(PEProblem(n, k, q), **leon_params).time_complexity()
 
     return actual_complexity, epsilon